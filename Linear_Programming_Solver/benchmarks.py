@@ -0,0 +1,601 @@
+import argparse
+import compileall
+import json
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from interior_point import InteriorPointSolver
+from modeling import Model
+from parallel import ParallelSolver, SharedArrays, attach
+from pricing import PRICING_RULES
+from simplex import SimplexSolver
+from sparse import CSRMatrix
+
+
+def _loop_pivot(T, row, col):
+    # Row-by-row elimination, kept as the reference for the pivot benchmark
+    T[row, :] /= T[row, col]
+    m = T.shape[0]
+    for r in range(m):
+        if r != row:
+            T[r, :] -= T[r, col] * T[row, :]
+
+
+def _random_tableau(rows, cols, rng):
+    T = rng.uniform(-1.0, 1.0, size=(rows, cols))
+    T[np.abs(T) < 1e-3] = 1e-3  # keep every entry usable as a pivot
+    return T
+
+
+def _time_pivots(pivot, T, rng, min_time, max_pivots):
+    m, n = T.shape
+    pivots = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while pivots < max_pivots and (pivots == 0 or elapsed < min_time):
+        row = rng.integers(m)
+        col = rng.integers(n)
+        if abs(T[row, col]) < 1e-6:
+            T[row, col] = 1.0
+        pivot(T, row, col)
+        pivots += 1
+        elapsed = time.perf_counter() - start
+    return pivots / elapsed
+
+
+def bench_pivot(sizes=(10, 100, 500, 1000, 2000, 5000), min_time=0.5, max_pivots=10_000, seed=0):
+    """Iterations/sec of the rank-1 pivot kernel against the row loop."""
+    solver = SimplexSolver()
+    results = []
+    for size in sizes:
+        rng = np.random.default_rng(seed)
+        T = _random_tableau(size, size, rng)
+        loop_rate = _time_pivots(_loop_pivot, T.copy(), np.random.default_rng(seed), min_time, max_pivots)
+        kernel_rate = _time_pivots(solver._pivot, T, np.random.default_rng(seed), min_time, max_pivots)
+        results.append({
+            'size': size,
+            'loop_pivots_per_sec': loop_rate,
+            'kernel_pivots_per_sec': kernel_rate,
+            'speedup': kernel_rate / loop_rate,
+        })
+    return results
+
+
+def bench_batch(m=50, n=80, scenarios=1000, spread=0.05, seed=0):
+    """LPs/sec of solve_batch against one solve call per scenario."""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0.0, 1.0, size=(m, n))
+    b = rng.uniform(10.0, 20.0, size=m) * (1.0 + spread * rng.standard_normal((scenarios, m)))
+    c = rng.uniform(0.0, 1.0, size=n) * (1.0 + spread * rng.standard_normal((scenarios, n)))
+    solver = SimplexSolver()
+
+    start = time.perf_counter()
+    for i in range(scenarios):
+        solver.solve(c[i], A, b[i])
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = solver.solve_batch(c, A, b)
+    batch_time = time.perf_counter() - start
+
+    return {
+        'scenarios': scenarios,
+        'loop_lps_per_sec': scenarios / loop_time,
+        'batch_lps_per_sec': scenarios / batch_time,
+        'batch_mean_iterations': float(batch.iterations.mean()),
+        'speedup': loop_time / batch_time,
+    }
+
+
+def _pricing_family(family, m, n, rng):
+    if family == "dense":
+        return rng.uniform(0.0, 1.0, n), rng.uniform(0.0, 1.0, (m, n)), rng.uniform(10.0, 20.0, m)
+    if family == "degenerate":
+        # Small integer data with many equal and zero RHS entries ties the ratio test
+        A = rng.integers(0, 3, (m, n)).astype(float)
+        b = rng.integers(0, 2, m).astype(float)
+        return rng.integers(1, 4, n).astype(float), A, b
+    raise ValueError(f"Unknown problem family {family!r}")
+
+
+def bench_pricing(families=("dense", "degenerate"), m=100, n=200, problems=5, rules=None, seed=0):
+    """Iterations and time of every pricing rule per problem family."""
+    rules = rules or list(PRICING_RULES)
+    results = []
+    for family in families:
+        rng = np.random.default_rng(seed)
+        lps = [_pricing_family(family, m, n, rng) for _ in range(problems)]
+        for rule in rules:
+            solver = SimplexSolver(pricing=rule)
+            iterations, pricing_time, solve_time = 0, 0.0, 0.0
+            for c, A, b in lps:
+                result = solver.solve(c, A, b)
+                iterations += result.iterations
+                pricing_time += result.stats.pricing_time
+                solve_time += result.stats.solve_time
+            results.append({
+                'family': family,
+                'pricing': rule,
+                'iterations': iterations,
+                'pricing_time': pricing_time,
+                'solve_time': solve_time,
+            })
+    return results
+
+
+def bench_interior(sizes=(50, 100, 200, 400), seed=0):
+    """Iterations and time of the interior-point solver against the simplex per size."""
+    results = []
+    for size in sizes:
+        rng = np.random.default_rng(seed)
+        m, n = size, 2 * size
+        c, A, b = rng.uniform(0.0, 1.0, n), rng.uniform(0.0, 1.0, (m, n)), rng.uniform(10.0, 20.0, m)
+        row = {'m': m, 'n': n}
+        for name, solver in (("simplex", SimplexSolver()), ("ipm", InteriorPointSolver()),
+                             ("ipm_crossover", InteriorPointSolver(crossover=True))):
+            start = time.perf_counter()
+            result = solver.solve(c, A, b)
+            row[name + '_time'] = time.perf_counter() - start
+            row[name + '_iterations'] = result.iterations
+        results.append(row)
+    return results
+
+
+def _transport_loop(cost, supply, demand):
+    # Baseline for bench_modeling: the same model built one term at a time
+    plants, markets = len(cost), len(cost[0])
+    rows, cols, vals, b = [], [], [], []
+    for i in range(plants):
+        for j in range(markets):
+            rows.append(i)
+            cols.append(i * markets + j)
+            vals.append(1.0)
+        b.append(supply[i])
+    for j in range(markets):
+        for i in range(plants):
+            rows.append(plants + j)
+            cols.append(i * markets + j)
+            vals.append(-1.0)
+        b.append(-demand[j])
+    c = [cost[i][j] for i in range(plants) for j in range(markets)]
+    A = CSRMatrix.from_coo(rows, cols, vals, (plants + markets, plants * markets))
+    return np.array(c), A, np.array(b)
+
+
+def _transport_model(cost, supply, demand):
+    model = Model("transport")
+    x = model.add_variables("x", cost.shape)
+    model.add_constraints("supply", x.sum(axis=1) <= supply)
+    model.add_constraints("demand", x.sum(axis=0) >= demand)
+    model.set_objective((cost * x).sum())
+    return model.compile(names=False)
+
+
+def bench_modeling(sizes=(100, 300, 1000), seed=0):
+    """Build time of a size x size transportation model with modeling.Model against a per-term Python loop."""
+    results = []
+    for size in sizes:
+        rng = np.random.default_rng(seed)
+        cost = rng.uniform(1.0, 10.0, (size, size))
+        supply, demand = rng.uniform(20.0, 40.0, size), rng.uniform(5.0, 15.0, size)
+        start = time.perf_counter()
+        _, A, _ = _transport_loop(cost.tolist(), supply.tolist(), demand.tolist())
+        loop_time = time.perf_counter() - start
+        start = time.perf_counter()
+        model = _transport_model(cost, supply, demand)
+        model_time = time.perf_counter() - start
+        results.append({'size': size, 'nnz': A.nnz, 'loop_time': loop_time, 'model_time': model_time,
+                        'speedup': loop_time / model_time, 'same_nnz': model.A.nnz == A.nnz})
+    return results
+
+
+def _pickled_chunk(solver, c, A, b):
+    # Baseline task for bench_shared: the problem arrays travel with every task
+    return solver.solve_batch(c, A, b)
+
+
+def _pickled_shape(A):
+    # Transport-only task: A arrives pickled
+    return A.shape
+
+
+def _attached_shape(spec):
+    # Transport-only task: A is attached from shared memory
+    views, blocks = attach(spec)
+    shape = views["A"].shape
+    views.clear()
+    for block in blocks:
+        block.close()
+    return shape
+
+
+def bench_shared(sizes=(1_000, 10_000, 100_000, 400_000), m=20, scenarios=64, workers=None, seed=0):
+    """Parallel batch solves with shared-memory transport against pickling A to every task.
+
+    A is m x size and only a few columns have a positive cost, so every
+    solve takes a handful of pivots and the cost of moving the matrix to
+    the workers shows as it grows. The solves still dominate both totals,
+    so the same tasks are also timed without solving: pickle_transport
+    sends A to every task, shared_transport copies it into shared memory
+    once and has every task attach it.
+    """
+    workers = workers or os.cpu_count() or 1
+    solver = SimplexSolver()
+    results = []
+    with ParallelSolver(solver, workers) as shared, ProcessPoolExecutor(workers) as pool:
+        # Start both pools before timing anything
+        shared.solve_batch(np.ones(2), np.ones((1, 2)), np.ones(1))
+        list(pool.map(abs, range(workers)))
+        for size in sizes:
+            rng = np.random.default_rng(seed)
+            n = size
+            A = rng.uniform(0.0, 1.0, (m, n))
+            b = rng.uniform(10.0, 20.0, m) * (1.0 + 0.05 * rng.standard_normal((scenarios, m)))
+            c = np.where(rng.random(n) < 0.001, 1.0, -1.0) * rng.uniform(0.5, 1.0, (scenarios, n))
+            chunk = max(1, -(-scenarios // (4 * workers)))
+            starts = range(0, scenarios, chunk)
+
+            start = time.perf_counter()
+            futures = [pool.submit(_pickled_chunk, solver, c[i:i + chunk], A, b[i:i + chunk]) for i in starts]
+            pickled_status = np.concatenate([future.result().status for future in futures])
+            pickle_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            batch = shared.solve_batch(c, A, b)
+            shared_time = time.perf_counter() - start
+
+            assert np.array_equal(pickled_status, batch.status)
+
+            start = time.perf_counter()
+            list(pool.map(_pickled_shape, [A] * len(starts)))
+            pickle_transport = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with SharedArrays(A=A) as arrays:
+                list(pool.map(_attached_shape, [arrays.spec] * len(starts)))
+            shared_transport = time.perf_counter() - start
+
+            results.append({
+                'm': m,
+                'n': n,
+                'bytes_per_task': len(pickle.dumps((solver, c[:chunk], A, b[:chunk]))),
+                'pickle_time': pickle_time,
+                'shared_time': shared_time,
+                'speedup': pickle_time / shared_time,
+                'pickle_transport': pickle_transport,
+                'shared_transport': shared_transport,
+                'transport_speedup': pickle_transport / shared_transport,
+            })
+    return results
+
+
+# -- Generated corpus and regression tracking ------------------------------------
+
+# Sizes per family: rows for dense/degenerate/sparse, dimension for
+# Klee-Minty, sources (= sinks) for transportation, constraints for the
+# two-variable problems of the graphical vertex search
+CORPUS = {
+    "dense": (25, 50, 100, 200),
+    "sparse": (100, 200, 400),
+    "degenerate": (25, 50, 100),
+    "klee_minty": (4, 6, 8, 10),
+    "transportation": (5, 10, 20),
+    "graphical": (10, 20, 40),
+}
+
+
+def generate_lp(family, size, seed=0):
+    """Seeded problem (c, A, b, maximize) of a corpus family.
+
+    For "graphical" the problem is (objective, constraints) in the
+    (a, b, c, sense) form of graphical_solver instead.
+    """
+    rng = np.random.default_rng([seed, size])
+    if family == "dense":
+        m, n = size, 2 * size
+        return rng.uniform(0.0, 1.0, n), rng.uniform(0.0, 1.0, (m, n)), rng.uniform(10.0, 20.0, m), True
+    if family == "sparse":
+        # About five nonzeros per column, stored as a CSRMatrix
+        m, n = size, 2 * size
+        nnz = 5 * n
+        rows = rng.integers(0, m, nnz)
+        cols = np.repeat(np.arange(n), 5)
+        A = CSRMatrix.from_coo(rows, cols, rng.uniform(0.1, 1.0, nnz), (m, n))
+        return rng.uniform(0.0, 1.0, n), A, rng.uniform(1.0, 2.0, m), True
+    if family == "degenerate":
+        c, A, b = _pricing_family("degenerate", size, 2 * size, rng)
+        return c, A, b, True
+    if family == "klee_minty":
+        # max sum 2^(d-j) x_j s.t. 2 sum_{j<i} 2^(i-j) x_j + x_i <= 5^i: Dantzig's
+        # rule visits all 2^d vertices
+        d = size
+        i, j = np.indices((d, d))
+        A = np.where(j < i, 2.0 ** (i - j + 1), 0.0) + np.eye(d)
+        return 2.0 ** (d - 1 - np.arange(d)), A, 5.0 ** (np.arange(d) + 1), True
+    if family == "transportation":
+        # Minimize shipping cost: supplies as sum_j x_ij <= s_i, demands as
+        # -sum_i x_ij <= -d_j
+        k = size
+        supply = rng.uniform(10.0, 20.0, k)
+        demand = rng.uniform(0.0, 1.0, k)
+        demand *= 0.9 * supply.sum() / demand.sum()
+        A = np.vstack([np.kron(np.eye(k), np.ones(k)), -np.kron(np.ones(k), np.eye(k))])
+        return rng.uniform(1.0, 10.0, k * k), A, np.concatenate([supply, -demand]), False
+    if family == "graphical":
+        # Tangents of a circle around (5, 5): a bounded polygon with size edges
+        angles = np.sort(rng.uniform(0.0, 2 * np.pi, size))
+        a, b = np.cos(angles), np.sin(angles)
+        constraints = [(float(ai), float(bi), float(5 * ai + 5 * bi + 4), "<=") for ai, bi in zip(a, b)]
+        return rng.uniform(0.0, 1.0, 2), constraints
+    raise ValueError(f"Unknown problem family {family!r}")
+
+
+def _measure(run, repeats):
+    # Best wall time over the repeats, then one more run under tracemalloc for the peak
+    best, value = np.inf, None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        value = run()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return value, best, peak
+
+
+def bench_suite(corpus=None, repeats=3, seed=0):
+    """Time SimplexSolver.solve and the graphical vertex search over the generated corpus."""
+    corpus = corpus or CORPUS
+    solver = SimplexSolver()
+    results = []
+    for family, sizes in corpus.items():
+        for size in sizes:
+            problem = generate_lp(family, size, seed)
+            record = {'case': f"{family}/{size}", 'family': family, 'size': size}
+            if family == "graphical":
+                from graphical import feasible_vertices
+                vertices, seconds, peak = _measure(lambda: feasible_vertices(problem[1]), repeats)
+                record.update({'vertices': len(vertices), 'time': seconds, 'peak_memory': peak})
+            else:
+                c, A, b, maximize = problem
+                result, seconds, peak = _measure(lambda: solver.solve(c, A, b, maximize), repeats)
+                record.update({
+                    'shape': list(A.shape),
+                    'status': result.status,
+                    'iterations': result.iterations,
+                    'time': seconds,
+                    'pivots_per_sec': result.iterations / seconds if seconds > 0 else 0.0,
+                    'peak_memory': peak,
+                })
+            results.append(record)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'repeats': repeats,
+            'seed': seed,
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        'results': results,
+    }
+
+
+# Absolute growth ignored on top of the relative threshold, so timer and
+# allocator noise on tiny cases is not reported
+COMPARE_SLACK = {'time': 1e-3, 'iterations': 0, 'peak_memory': 1 << 16}
+
+
+def compare(current, baseline, threshold=0.2):
+    """Regression flags of a bench_suite run against a stored one.
+
+    A case is flagged when its time, iteration count or peak memory grows
+    by more than threshold (a fraction, plus COMPARE_SLACK) or its status
+    changes.
+    """
+    old = {r['case']: r for r in baseline['results']}
+    flags = []
+    for record in current['results']:
+        ref = old.get(record['case'])
+        if ref is None:
+            continue
+        if record.get('status') != ref.get('status'):
+            flags.append({'case': record['case'], 'metric': 'status',
+                          'baseline': ref.get('status'), 'current': record.get('status')})
+        for metric, slack in COMPARE_SLACK.items():
+            if metric in record and metric in ref and record[metric] > (1.0 + threshold) * ref[metric] + slack:
+                flags.append({'case': record['case'], 'metric': metric, 'baseline': ref[metric],
+                              'current': record[metric], 'ratio': record[metric] / max(ref[metric], 1e-12)})
+    return flags
+
+
+# Startup budget per module: seconds of import time on top of the heavy
+# packages it is allowed to load, which must not include GUI or plotting
+# packages for anything a solver worker imports
+HEAVY_PACKAGES = ("numpy", "scipy", "matplotlib", "PIL", "tkinter")
+STARTUP_TARGETS = {
+    "simplex": (0.015, ("numpy",)),
+    "revised": (0.015, ("numpy",)),
+    "interior_point": (0.015, ("numpy",)),
+    "mip": (0.015, ("numpy",)),
+    "parallel": (0.06, ("numpy",)),  # needs the pool machinery up front
+    "problem_io": (0.02, ("numpy",)),
+    "cli": (0.02, ("numpy",)),
+    "cache": (0.015, ("numpy",)),
+    "modeling": (0.02, ("numpy",)),
+    "graphical": (0.015, ("numpy",)),
+    "ui": (0.015, ("tkinter", "numpy")),
+}
+
+
+def _import_times(module, preload=()):
+    # Cumulative import time (seconds) of every import from one fresh
+    # interpreter that imports preload first, then module, parsed from the
+    # -X importtime report on stderr
+    here = os.path.dirname(os.path.abspath(__file__))
+    start = time.perf_counter()
+    code = "; ".join(f"import {name}" for name in (*preload, module))
+    run = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                         cwd=here, capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+    times = {}
+    for line in run.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times.setdefault(name.strip(), int(cumulative) / 1e6)
+    return times, wall
+
+
+def bench_startup(targets=None, repeats=5):
+    """Import time of each module in a fresh interpreter, against STARTUP_TARGETS.
+
+    The heavy packages a module may load are imported first, so overhead
+    is what importing the module adds on top of them (the best of repeats
+    runs) and heavy lists the other heavy packages it pulled in. A module
+    fails when it is over its target or heavy is not empty. wall is the
+    whole interpreter run, startup included.
+    """
+    targets = targets or STARTUP_TARGETS
+    # Fresh bytecode first, so no run pays for compiling a stale module
+    compileall.compile_dir(os.path.dirname(os.path.abspath(__file__)), maxlevels=0, quiet=1)
+    results = []
+    for module, (target, allowed) in targets.items():
+        best = None
+        for _ in range(repeats):
+            times, wall = _import_times(module, allowed)
+            heavy = [name for name in HEAVY_PACKAGES if name in times and name not in allowed]
+            if best is None or times[module] < best['overhead']:
+                best = {'module': module, 'overhead': times[module], 'wall': wall, 'heavy': heavy, 'target': target}
+        best['ok'] = best['overhead'] <= target and not best['heavy']
+        results.append(best)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LP solver benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("pivot", help="pivot kernel vs row loop")
+    p.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 1000, 2000, 5000])
+    p.add_argument("--min-time", type=float, default=0.5)
+
+    p = sub.add_parser("batch", help="solve_batch throughput vs repeated solve")
+    p.add_argument("--m", type=int, default=50)
+    p.add_argument("--n", type=int, default=80)
+    p.add_argument("--scenarios", type=int, default=1000)
+
+    p = sub.add_parser("pricing", help="iterations and time per pricing rule")
+    p.add_argument("--families", nargs="+", default=["dense", "degenerate"])
+    p.add_argument("--m", type=int, default=100)
+    p.add_argument("--n", type=int, default=200)
+    p.add_argument("--problems", type=int, default=5)
+
+    p = sub.add_parser("interior", help="interior point vs simplex per problem size")
+    p.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200, 400])
+
+    p = sub.add_parser("modeling", help="model build time with modeling.Model vs a per-term loop")
+    p.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 1000])
+
+    p = sub.add_parser("shared", help="shared-memory parallel solves vs pickled arguments")
+    p.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 400_000])
+    p.add_argument("--m", type=int, default=20)
+    p.add_argument("--scenarios", type=int, default=64)
+    p.add_argument("--workers", type=int, default=None)
+
+    p = sub.add_parser("suite", help="generated corpus with a JSON report and baseline comparison")
+    p.add_argument("--families", nargs="+", choices=list(CORPUS), default=list(CORPUS))
+    p.add_argument("--sizes", type=int, nargs="+", default=None, help="sizes for every family (default per family)")
+    p.add_argument("--repeats", type=int, default=3)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("-o", "--output", default="benchmark_results.json")
+    p.add_argument("--baseline", default=None, help="earlier report to compare against")
+    p.add_argument("--threshold", type=float, default=0.2, help="allowed relative growth before a flag")
+    p.add_argument("--save-baseline", action="store_true", help="also write the report to --baseline")
+
+    p = sub.add_parser("startup", help="import time per module against the startup targets")
+    p.add_argument("--modules", nargs="+", choices=list(STARTUP_TARGETS), default=list(STARTUP_TARGETS))
+    p.add_argument("--repeats", type=int, default=5)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "pivot":
+        print(f"{'size':>8} {'loop it/s':>12} {'kernel it/s':>12} {'speedup':>8}")
+        for r in bench_pivot(args.sizes, min_time=args.min_time):
+            print(f"{r['size']:>8} {r['loop_pivots_per_sec']:>12.1f} "
+                  f"{r['kernel_pivots_per_sec']:>12.1f} {r['speedup']:>8.2f}")
+    elif args.command == "batch":
+        r = bench_batch(args.m, args.n, args.scenarios)
+        print(f"{r['scenarios']} scenarios: loop {r['loop_lps_per_sec']:.1f} LP/s, "
+              f"batch {r['batch_lps_per_sec']:.1f} LP/s ({r['speedup']:.2f}x), "
+              f"{r['batch_mean_iterations']:.1f} pivots/scenario")
+    elif args.command == "pricing":
+        print(f"{'family':>12} {'pricing':>14} {'iterations':>10} {'pricing s':>10} {'total s':>10}")
+        for r in bench_pricing(args.families, args.m, args.n, args.problems):
+            print(f"{r['family']:>12} {r['pricing']:>14} {r['iterations']:>10} "
+                  f"{r['pricing_time']:>10.4f} {r['solve_time']:>10.4f}")
+    elif args.command == "interior":
+        print(f"{'m x n':>12} {'simplex it':>10} {'simplex s':>10} {'ipm it':>8} {'ipm s':>8} {'crossover s':>12}")
+        for r in bench_interior(args.sizes):
+            print(f"{r['m']:>5} x {r['n']:<5} {r['simplex_iterations']:>10} {r['simplex_time']:>10.4f} "
+                  f"{r['ipm_iterations']:>8} {r['ipm_time']:>8.4f} {r['ipm_crossover_time']:>12.4f}")
+
+    elif args.command == "modeling":
+        print(f"{'size':>8} {'nnz':>10} {'loop s':>10} {'model s':>10} {'speedup':>8}")
+        for r in bench_modeling(args.sizes):
+            print(f"{r['size']:>8} {r['nnz']:>10} {r['loop_time']:>10.4f} {r['model_time']:>10.4f} "
+                  f"{r['speedup']:>8.2f}")
+
+    elif args.command == "shared":
+        print(f"{'m x n':>16} {'MB/task':>8} {'pickle s':>10} {'shared s':>10} {'speedup':>8} "
+              f"{'move pickle':>12} {'move shared':>12} {'speedup':>8}")
+        for r in bench_shared(args.sizes, args.m, args.scenarios, args.workers):
+            print(f"{r['m']:>6} x {r['n']:<8} {r['bytes_per_task'] / 1e6:>8.2f} {r['pickle_time']:>10.4f} "
+                  f"{r['shared_time']:>10.4f} {r['speedup']:>8.2f} {r['pickle_transport']:>12.4f} "
+                  f"{r['shared_transport']:>12.4f} {r['transport_speedup']:>8.2f}")
+
+    elif args.command == "suite":
+        corpus = {family: args.sizes or CORPUS[family] for family in args.families}
+        report = bench_suite(corpus, args.repeats, args.seed)
+        print(f"{'case':>20} {'status':>10} {'iters':>7} {'seconds':>9} {'pivots/s':>10} {'peak MB':>8}")
+        for r in report['results']:
+            print(f"{r['case']:>20} {r.get('status', '-'):>10} {r.get('iterations', r.get('vertices')):>7} "
+                  f"{r['time']:>9.4f} {r.get('pivots_per_sec', 0.0):>10.1f} {r['peak_memory'] / 1e6:>8.2f}")
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+        if args.baseline and args.save_baseline:
+            with open(args.baseline, "w") as f:
+                json.dump(report, f, indent=1)
+        elif args.baseline:
+            with open(args.baseline) as f:
+                flags = compare(report, json.load(f), args.threshold)
+            for flag in flags:
+                change = f"{flag['ratio']:.2f}x" if 'ratio' in flag else f"{flag['baseline']} -> {flag['current']}"
+                print(f"REGRESSION {flag['case']} {flag['metric']}: {change}")
+            if flags:
+                raise SystemExit(1)
+
+    elif args.command == "startup":
+        print(f"{'module':>16} {'overhead s':>10} {'target s':>9} {'wall s':>8}  heavy imports")
+        results = bench_startup({module: STARTUP_TARGETS[module] for module in args.modules}, args.repeats)
+        for r in results:
+            print(f"{r['module']:>16} {r['overhead']:>10.4f} {r['target']:>9.3f} "
+                  f"{r['wall']:>8.3f}  {', '.join(r['heavy']) or '-'}{'' if r['ok'] else '  OVER TARGET'}")
+        if not all(r['ok'] for r in results):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
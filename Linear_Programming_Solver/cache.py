@@ -0,0 +1,237 @@
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+
+from simplex import SimplexResult, SimplexSolver
+from sparse import as_csr, is_sparse
+
+
+def _hash_array(h, tag, array, dtype=float):
+    # Shape and raw bytes in C order; adding 0.0 folds -0.0 into 0.0
+    array = np.ascontiguousarray(array, dtype=dtype)
+    if dtype is float:
+        array = array + 0.0
+    h.update(f"{tag}{array.shape}".encode())
+    h.update(array.tobytes())
+
+
+def matrix_key(A, senses=None):
+    """Hex digest of a constraint matrix (and its row senses).
+
+    Dense input is hashed as float64, so lists and arrays of the same
+    matrix share a key. A sparse A is hashed by its CSR arrays and gets a
+    different key than the same matrix given densely.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    if is_sparse(A):
+        A = as_csr(A)
+        h.update(f"csr{A.shape}".encode())
+        _hash_array(h, "data", A.data)
+        _hash_array(h, "indices", A.indices, np.int64)
+        _hash_array(h, "indptr", A.indptr, np.int64)
+    else:
+        _hash_array(h, "A", A)
+    h.update(repr(None if senses is None else tuple(senses)).encode())
+    return h.hexdigest()
+
+
+def problem_key(c, A, b, maximize=True, senses=None, tol=None, bounds=None, matrix=None):
+    """Hex digest of (c, A, b, senses, maximize, tol, bounds) from the array bytes.
+
+    matrix is matrix_key(A, senses) when it is already known.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update((matrix or matrix_key(A, senses)).encode())
+    _hash_array(h, "c", np.asarray(c, dtype=float).flatten())
+    _hash_array(h, "b", np.asarray(b, dtype=float).flatten())
+    if bounds is not None:
+        pairs = [[0.0 if lo is None else lo, np.inf if hi is None else hi] for lo, hi in bounds]
+        _hash_array(h, "bounds", pairs)
+    h.update(repr((bool(maximize), tol)).encode())
+    return h.hexdigest()
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0         # lookups answered from the cache, disk hits included
+        self.disk_hits = 0    # hits loaded from the on-disk store
+        self.misses = 0       # lookups that had to solve
+        self.evictions = 0    # entries dropped from memory by the LRU bound
+        self.warm_starts = 0  # misses solved from the cached basis of a problem with the same A
+        self.disk_writes = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self):
+        stats = dict(vars(self))
+        stats["hit_rate"] = self.hit_rate
+        return stats
+
+    def __repr__(self):
+        return (f"CacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+                f"hit_rate={self.hit_rate:.3f})")
+
+
+class CacheEntry:
+    """What the cache keeps of a SimplexResult: the solution and the final basis, not the tableau."""
+
+    __slots__ = ("status", "x", "z", "message", "iterations", "basis")
+
+    def __init__(self, status, x, z, message, iterations, basis):
+        self.status = status
+        self.x = x
+        self.z = z
+        self.message = message
+        self.iterations = iterations
+        self.basis = basis  # column indices of the final basis (n + i for slack i), None if unknown
+
+    @classmethod
+    def from_result(cls, result):
+        basis = getattr(result.state, "basis", None)
+        return cls(result.status, None if result.x is None else np.array(result.x), result.z, result.message,
+                   result.iterations, None if basis is None else np.array(basis, dtype=int))
+
+    def result(self):
+        result = SimplexResult(self.status, x=None if self.x is None else self.x.copy(), z=self.z,
+                               message=self.message, iterations=self.iterations)
+        result.basis = None if self.basis is None else self.basis.copy()
+        return result
+
+
+class SolveCache:
+    """Content-addressed cache in front of SimplexSolver.solve and graphical_solver.
+
+    Problems are keyed by a hash of their data (problem_key), so an
+    identical resubmission is answered without solving. At most
+    max_entries results are held in memory, the least recently used are
+    evicted first. With path, every result is also written to that
+    directory (one pickle per key, replaced atomically) and other
+    processes using the same path pick it up on a miss; only point path
+    at a directory you trust.
+
+    Results from the cache have no state or stats; their basis attribute
+    holds the stored final basis, which SimplexSolver.solve(basis=...)
+    warm-starts from. A miss whose A matches an earlier optimal solve
+    warm-starts from that solve's basis.
+    """
+
+    def __init__(self, solver=None, max_entries=1024, path=None):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.solver = solver or SimplexSolver()
+        self.max_entries = max_entries
+        self.path = path
+        self.stats = CacheStats()
+        self._entries = OrderedDict()
+        self._bases = OrderedDict()  # matrix_key -> basis of the latest optimal solve with that A
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries or (self.path is not None and os.path.exists(self._file(key)))
+
+    def _file(self, key):
+        return os.path.join(self.path, key + ".pkl")
+
+    def _load(self, key):
+        try:
+            with open(self._file(key), "rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _store(self, key, value):
+        # Write to a temporary file and rename, so readers never see half a file
+        import tempfile
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._file(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        self.stats.disk_writes += 1
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def get(self, key):
+        """Cached value of key (memory first, then disk), or None; counts a hit or a miss."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        elif self.path is not None:
+            value = self._load(key)
+            if value is not None:
+                self.stats.disk_hits += 1
+                self._remember(key, value)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.path is not None:
+            self._store(key, value)
+
+    def clear(self):
+        """Empty the in-memory cache; the disk store is left alone."""
+        self._entries.clear()
+        self._bases.clear()
+
+    def solve(self, c, A, b, maximize=True, bounds=None, warm_start=True):
+        """SimplexSolver.solve through the cache; errors are returned but not cached."""
+        matrix = matrix_key(A)
+        key = problem_key(c, A, b, maximize, tol=self.solver.tol, bounds=bounds, matrix=matrix)
+        entry = self.get(key)
+        if entry is not None:
+            return entry.result()
+
+        basis = self._bases.get(matrix) if warm_start else None
+        if basis is not None:
+            self.stats.warm_starts += 1
+        result = self.solver.solve(c, A, b, maximize, bounds=bounds, basis=basis)
+        if result.status == "error":
+            return result
+        entry = CacheEntry.from_result(result)
+        self.put(key, entry)
+        if result.status == "optimal" and entry.basis is not None:
+            self._bases[matrix] = entry.basis
+            self._bases.move_to_end(matrix)
+            while len(self._bases) > self.max_entries:
+                self._bases.popitem(last=False)
+        return result
+
+    def basis(self, A):
+        """Basis of the latest optimal solve with this A, for SimplexSolver.solve(basis=...), or None."""
+        return self._bases.get(matrix_key(A))
+
+    def graphical(self, opt_type, obj_coeffs, constraints, image_format=None):
+        """graphical_solver(..., show=False) through the cache, with result["image"] when image_format is given."""
+        from graphical import graphical_solver
+
+        rows = np.array([[a, b] for a, b, _, _ in constraints], dtype=float).reshape(-1, 2)
+        rhs = [c for _, _, c, _ in constraints]
+        senses = [sense for _, _, _, sense in constraints]
+        key = f"graphical-{image_format}-" + problem_key(obj_coeffs, rows, rhs, opt_type == "max", senses=senses)
+        result = self.get(key)
+        if result is None:
+            result = graphical_solver(opt_type, obj_coeffs, constraints, show=False, image_format=image_format)
+            self.put(key, result)
+        return dict(result, opt_points=list(result['opt_points']))
@@ -0,0 +1,246 @@
+"""Headless batch solver.
+
+    python cli.py problems/ --workers 8 --timeout 5 > results.jsonl
+    cat problems.jsonl | python cli.py - --workers 8
+
+Every input problem gives one JSON line on the output, written as soon as
+its solve finishes (so lines come out in completion order, each tagged
+with the problem id). Inputs are files or directories of .json / .npz
+problems, MPS / CPLEX LP model files (optionally gzipped), or "-" to read
+one JSON problem per line from stdin. A JSON problem is an object with
+"c", "A", "b" and optionally "maximize", "bounds" and "integer"; an .npz
+file holds the arrays c, A, b and optionally maximize.
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+
+import numpy as np
+
+MODEL_SUFFIXES = (".mps", ".lp", ".mps.gz", ".lp.gz")
+PROBLEM_SUFFIXES = (".json", ".npz") + MODEL_SUFFIXES
+
+_solver = None
+_options = None
+
+
+class SolveTimeout(Exception):
+    pass
+
+
+def _on_alarm(signum, frame):
+    raise SolveTimeout()
+
+
+def _init_worker(options):
+    # Build the solver once per worker process
+    global _solver, _options
+    _options = options
+    name = options["solver"]
+    if name == "interior":
+        from interior_point import InteriorPointSolver
+        _solver = InteriorPointSolver(crossover=options["crossover"])
+    elif name == "revised":
+        from revised import RevisedSimplexSolver
+        _solver = RevisedSimplexSolver()
+    else:
+        from simplex import SimplexSolver
+        _solver = SimplexSolver(method=options["method"], pricing=options["pricing"], presolve=options["presolve"])
+    if hasattr(signal, "setitimer"):
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+
+def load_problem(source):
+    """Problem dict with c, A, b and the optional keys from a path or a JSON text.
+
+    Model files also give "form", the StandardForm that maps the solution
+    back to the model's variables.
+    """
+    if isinstance(source, str) and source.lower().endswith(MODEL_SUFFIXES):
+        from problem_io import read_problem
+        form = read_problem(source).to_standard()
+        bounds = form.bounds
+        if not (np.any(bounds[:, 0] != 0) or np.any(np.isfinite(bounds[:, 1]))):
+            bounds = None  # plain x >= 0 keeps a sparse A on the revised engine
+        return {"c": form.c, "A": form.A, "b": form.b, "maximize": form.maximize, "bounds": bounds,
+                "integer": form.integer if form.integer.size else None, "form": form}
+    if isinstance(source, str) and source.endswith(".npz"):
+        with np.load(source) as data:
+            problem = {key: data[key] for key in data.files}
+        if "maximize" in problem:
+            problem["maximize"] = bool(problem["maximize"])
+        return problem
+    if isinstance(source, str) and os.path.isfile(source):
+        with open(source) as f:
+            return json.load(f)
+    return json.loads(source)
+
+
+def _finite(value):
+    # NaN and infinities are not valid JSON
+    if value is None:
+        return None
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def _record(problem_id, result, load_time, solve_time, with_x):
+    record = {
+        "id": problem_id,
+        "status": result.status,
+        "z": _finite(result.z),
+        "message": result.message,
+        "iterations": result.iterations,
+        "load_time": load_time,
+        "solve_time": solve_time,
+    }
+    if with_x:
+        record["x"] = None if result.x is None else [_finite(v) for v in result.x]
+    if result.stats is not None:
+        record["stats"] = {k: v for k, v in result.stats.as_dict().items() if isinstance(v, (int, float, str))}
+    return record
+
+
+def solve_task(task):
+    """Load and solve one problem in a worker; always returns a JSON-ready dict."""
+    problem_id, source = task
+    options = _options
+    start = time.perf_counter()
+    timer = options["timeout"] and hasattr(signal, "setitimer")
+    if timer:
+        signal.setitimer(signal.ITIMER_REAL, options["timeout"])
+    try:
+        problem = load_problem(source)
+        loaded = time.perf_counter()
+        maximize = bool(problem.get("maximize", options["maximize"]))
+        if problem.get("integer") is not None:
+            from mip import BranchAndBound
+            result = BranchAndBound(solver=_solver if options["solver"] == "simplex" else None).solve(
+                problem["c"], problem["A"], problem["b"], problem["integer"], maximize, problem.get("bounds"))
+            result.iterations = result.stats.lp_iterations
+        elif problem.get("bounds") is not None and options["solver"] != "simplex":
+            from problem_io import fold_bounds
+            c, A, b, lower, offset = fold_bounds(problem["c"], problem["A"], problem["b"], problem["bounds"])
+            result = _solver.solve(c, A, b, maximize)
+            if result.x is not None:
+                result.x, result.z = result.x + lower, result.z + offset
+        elif problem.get("bounds") is not None:
+            result = _solver.solve(problem["c"], problem["A"], problem["b"], maximize, bounds=problem["bounds"])
+        else:
+            result = _solver.solve(problem["c"], problem["A"], problem["b"], maximize)
+        form = problem.get("form")
+        if form is not None and result.x is not None:
+            result.x, result.z = form.recover(result.x), result.z + form.offset
+        done = time.perf_counter()
+        return _record(problem_id, result, loaded - start, done - loaded, options["with_x"])
+    except SolveTimeout:
+        return {"id": problem_id, "status": "timeout", "message": f"No result within {options['timeout']} s.",
+                "solve_time": time.perf_counter() - start}
+    except Exception as exc:
+        return {"id": problem_id, "status": "error", "message": f"{type(exc).__name__}: {exc}",
+                "solve_time": time.perf_counter() - start}
+    finally:
+        if timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def iter_tasks(inputs):
+    """(id, source) pairs for every problem, produced lazily so huge batches are never listed in memory."""
+    for entry in inputs:
+        if entry == "-":
+            for number, line in enumerate(sys.stdin, 1):
+                line = line.strip()
+                if line:
+                    yield f"stdin:{number}", line
+        elif os.path.isdir(entry):
+            for root, dirs, files in os.walk(entry):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(PROBLEM_SUFFIXES):
+                        yield os.path.join(root, name), os.path.join(root, name)
+        else:
+            yield entry, entry
+
+
+def run(tasks, options, workers, out, max_pending=None):
+    """Solve tasks with a process pool, writing one JSON line per result as it finishes."""
+    counts = {}
+
+    def emit(record):
+        out.write(json.dumps(record) + "\n")
+        out.flush()
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+
+    if workers <= 1:
+        _init_worker(options)
+        for task in tasks:
+            emit(solve_task(task))
+        return counts
+
+    # Keep a bounded number of tasks in flight, so reading the inputs
+    # never runs far ahead of the workers
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+    max_pending = max_pending or 4 * workers
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(options,)) as executor:
+        pending = set()
+        for task in tasks:
+            pending.add(executor.submit(solve_task, task))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    emit(future.result())
+        for future in as_completed(pending):
+            emit(future.result())
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve LP problem files in parallel, one JSON line per result.")
+    parser.add_argument("inputs", nargs="+", help="problem files, directories, or - for JSON lines on stdin")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-t", "--timeout", type=float, default=None, help="seconds per problem")
+    parser.add_argument("-o", "--output", default="-", help="output JSONL file (default stdout)")
+    parser.add_argument("--solver", choices=("simplex", "revised", "interior"), default="simplex")
+    parser.add_argument("--method", choices=("primal", "dual"), default="primal")
+    parser.add_argument("--pricing", default="dantzig")
+    parser.add_argument("--presolve", action="store_true")
+    parser.add_argument("--crossover", action="store_true", help="crossover after the interior-point solver")
+    parser.add_argument("--minimize", action="store_true", help="default sense for problems that do not set it")
+    parser.add_argument("--no-x", action="store_true", help="leave the solution vectors out of the output")
+    parser.add_argument("--max-pending", type=int, default=None, help="tasks in flight (default 4 per worker)")
+    args = parser.parse_args(argv)
+
+    options = {
+        "solver": args.solver,
+        "method": args.method,
+        "pricing": args.pricing,
+        "presolve": args.presolve,
+        "crossover": args.crossover,
+        "maximize": not args.minimize,
+        "timeout": args.timeout,
+        "with_x": not args.no_x,
+    }
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    start = time.perf_counter()
+    try:
+        counts = run(iter_tasks(args.inputs), options, args.workers, out, args.max_pending)
+    except BrokenPipeError:
+        # Reader went away (e.g. piped into head); silence the final flush
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    total = sum(counts.values())
+    elapsed = time.perf_counter() - start
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    print(f"{total} problems in {elapsed:.2f} s ({total / max(elapsed, 1e-9):.1f}/s): {summary}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
+import io
+from collections import deque
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+# matplotlib is imported on the first plot, so the geometry helpers (and
+# anything importing this module) load without it
 
 def format_constraint(a, b, c, sense):
     """Formats constraint equation as a string"""
@@ -12,49 +17,150 @@ def format_constraint(a, b, c, sense):
         parts.append(f" {sign} {coeff}y" if coeff else f" {sign} y")
     return f"{''.join(parts)} {sense} {c:.2f}"
 
-def graphical_solver(opt_type, obj_coeffs, constraints):
-   
-    def satisfies(x, y, a, b, c, sense):
-        if sense == "<=":
-            return a * x + b * y <= c + 1e-9
-        elif sense == ">=":
-            return a * x + b * y >= c - 1e-9
-        elif sense == "=":
-            return np.isclose(a * x + b * y, c, atol=1e-9)
-        return False
-
-    cons_funcs = [lambda X, Y, a=a, b=b, c=c, s=sense: satisfies(X, Y, a, b, c, s) for a, b, c, sense in constraints]
-
-    # Find intersection points
-    points = []
-    for i in range(len(constraints)):
-        for j in range(i+1, len(constraints)):
-            a1, b1, c1, _ = constraints[i]
-            a2, b2, c2, _ = constraints[j]
-            A = np.array([[a1, b1], [a2, b2]])
-            B = np.array([c1, c2])
-            if np.linalg.det(A) != 0:
-                x, y = np.linalg.solve(A, B)
-                if x >= -1e-9 and y >= -1e-9:
-                    if all(cf(x, y) for cf in cons_funcs):
-                        points.append((x, y))
-
-    # Axis intercepts
+SENSES = ("<=", ">=", "=")
+
+def _feasible(P, a, b, c, sense):
+    """Mask of the points P (k x 2) that satisfy every constraint (within 1e-9, np.isclose for "=")."""
+    if np.any(sense < 0):
+        return np.zeros(P.shape[0], dtype=bool)
+    ok = np.ones(P.shape[0], dtype=bool)
+    # One product and comparison per sense, rows of P in blocks so the
+    # points x constraints matrix stays small
+    groups = [(np.vstack([a[sense == k], b[sense == k]]), c[sense == k]) for k in range(len(SENSES))]
+    block = max(1, (1 << 22) // max(a.size, 1))
+    for start in range(0, P.shape[0], block):
+        rows = P[start:start + block]
+        (AL, cl), (AG, cg), (AE, ce) = groups
+        good = np.all(rows @ AL <= cl + 1e-9, axis=1)
+        good &= np.all(rows @ AG >= cg - 1e-9, axis=1)
+        good &= np.all(np.abs(rows @ AE - ce) <= 1e-9 + 1e-5 * np.abs(ce), axis=1)
+        ok[start:start + block] = good
+    return ok
+
+def _unique_points(P):
+    """First occurrence of every point of P, equal meaning np.isclose in both coordinates."""
+    if P.shape[0] == 0:
+        return P
+    # Sort by x and split where x jumps, then sort each x group by y and
+    # split where y jumps: the groups are the clusters of close points
+    order = np.lexsort((P[:, 1], P[:, 0]))
+    x = P[order, 0]
+    x_group = np.concatenate([[0], np.cumsum(np.abs(np.diff(x)) > 1e-8 + 1e-5 * np.abs(x[:-1]))])
+    regroup = np.lexsort((P[order, 1], x_group))
+    order, x_group = order[regroup], x_group[regroup]
+    y = P[order, 1]
+    new = np.ones(order.size, dtype=bool)
+    new[1:] = (x_group[1:] != x_group[:-1]) | (np.abs(np.diff(y)) > 1e-8 + 1e-5 * np.abs(y[:-1]))
+    starts = np.flatnonzero(new)
+    first = np.minimum.reduceat(order, starts)
+    return P[np.sort(first)]
+
+def feasible_vertices(constraints):
+    """Feasible intersection points and axis intercepts of (a, b, c, sense) constraints in x, y >= 0."""
+    if not constraints:
+        return []
+    a, b, c = (np.array([con[k] for con in constraints], dtype=float) for k in range(3))
+    sense = np.array([SENSES.index(con[3]) if con[3] in SENSES else -1 for con in constraints])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Intersection of every pair of boundary lines by Cramer's rule
+        i, j = np.triu_indices(len(constraints), k=1)
+        det = a[i] * b[j] - a[j] * b[i]
+        pairs = det != 0
+        i, j, det = i[pairs], j[pairs], det[pairs]
+        crossings = np.column_stack([(c[i] * b[j] - c[j] * b[i]) / det, (a[i] * c[j] - a[j] * c[i]) / det])
+
+        # Axis intercepts (c/a, 0) and (0, c/b), in constraint order
+        intercepts = np.stack([np.column_stack([c / a, np.zeros_like(c)]),
+                               np.column_stack([np.zeros_like(c), c / b])], axis=1).reshape(-1, 2)
+        on_axis = np.column_stack([a != 0, b != 0]).ravel()
+        intercepts = intercepts[on_axis]
+
+    P = np.vstack([crossings, intercepts])
+    P = P[(P[:, 0] >= -1e-9) & (P[:, 1] >= -1e-9)]
+    P = P[_feasible(P, a, b, c, sense)]
+    return [(x, y) for x, y in _unique_points(P).tolist()]
+
+def _line_intersection(l1, l2):
+    det = l1[0] * l2[1] - l2[0] * l1[1]
+    if abs(det) < 1e-12:
+        return None
+    return ((l1[2] * l2[1] - l2[2] * l1[1]) / det, (l1[0] * l2[2] - l2[0] * l1[2]) / det)
+
+def feasible_polygon(constraints, box):
+    """Feasible region in x, y >= 0 clipped to [0, box[0]] x [0, box[1]], as a convex polygon.
+
+    Half-plane intersection: the half-planes a x + b y <= c are sorted by
+    the angle of their normal and swept once with a deque, O(k log k).
+    Returns the vertices in counterclockwise order, [] when empty.
+    Equality constraints give a sliver of width 1e-9.
+    """
+    rows = []
     for a, b, c, sense in constraints:
-        if a != 0:
-            x = c / a
-            if x >= -1e-9 and all(cf(x, 0) for cf in cons_funcs):
-                points.append((x, 0))
-        if b != 0:
-            y = c / b
-            if y >= -1e-9 and all(cf(0, y) for cf in cons_funcs):
-                points.append((0, y))
-
-    # Unique points
-    unique_points = []
-    for p in points:
-        if not any(np.isclose(p[0], q[0]) and np.isclose(p[1], q[1]) for q in unique_points):
-            unique_points.append(p)
+        if sense not in SENSES:
+            return []
+        if sense in ("<=", "="):
+            rows.append((a, b, c + 1e-9))
+        if sense in (">=", "="):
+            rows.append((-a, -b, -c + 1e-9))
+    rows += [(-1.0, 0.0, 0.0), (0.0, -1.0, 0.0), (1.0, 0.0, box[0]), (0.0, 1.0, box[1])]
+    H = np.array(rows, dtype=float)
+    norm = np.hypot(H[:, 0], H[:, 1])
+    if np.any((norm == 0) & (H[:, 2] < 0)):
+        return []  # 0 <= c with c < 0
+    H = H[norm > 0] / norm[norm > 0, None]
+
+    # By angle, and for parallel half-planes only the tightest
+    angle = np.round(np.arctan2(H[:, 1], H[:, 0]), 12)
+    order = np.lexsort((H[:, 2], angle))
+    H, angle = H[order], angle[order]
+    first = np.ones(angle.size, dtype=bool)
+    first[1:] = angle[1:] != angle[:-1]
+    lines = [tuple(h) for h in H[first]]
+
+    def outside(line, point):
+        return point is None or line[0] * point[0] + line[1] * point[1] > line[2] + 1e-12
+
+    hull = deque()
+    for line in lines:
+        while len(hull) >= 2 and outside(line, _line_intersection(hull[-1], hull[-2])):
+            hull.pop()
+        while len(hull) >= 2 and outside(line, _line_intersection(hull[0], hull[1])):
+            hull.popleft()
+        hull.append(line)
+    while len(hull) >= 3 and outside(hull[0], _line_intersection(hull[-1], hull[-2])):
+        hull.pop()
+    while len(hull) >= 3 and outside(hull[-1], _line_intersection(hull[0], hull[1])):
+        hull.popleft()
+    if len(hull) < 3:
+        return []
+
+    hull = list(hull)
+    vertices = [_line_intersection(hull[k], hull[(k + 1) % len(hull)]) for k in range(len(hull))]
+    if any(v is None for v in vertices):
+        return []
+    V = np.array(vertices)
+    # An empty region can leave a "polygon" that violates some half-plane
+    if np.any(V @ H[:, :2].T > H[:, 2] + 1e-7 * (1.0 + np.abs(V).max())):
+        return []
+    return [tuple(v) for v in V.tolist()]
+
+def graphical_solver(opt_type, obj_coeffs, constraints, show=True, save_to=None, image_format=None, cancel=None):
+    """Solve and plot a 2-variable LP.
+
+    With show=True the plot opens in a pyplot window. show=False draws on
+    a standalone Agg figure instead (no pyplot, no display, nothing
+    blocks), for batch jobs and worker processes. save_to (a path or a
+    binary file) writes the plot, as image_format ("png", "svg", ...) or
+    by the file extension; image_format without save_to returns the
+    encoded image as result["image"]. cancel is an optional
+    threading.Event checked between the solve, the drawing and the
+    encoding; once it is set the function returns None.
+    """
+
+    unique_points = feasible_vertices(constraints)
+    if cancel is not None and cancel.is_set():
+        return None
 
     # Status defaults
     status = "optimal"
@@ -106,18 +212,27 @@ def graphical_solver(opt_type, obj_coeffs, constraints):
         max_x, max_y = 10, 10  # default range when no feasible points
 
     x_vals = np.linspace(0, max_x, 400)
-    y_vals = np.linspace(0, max_y, 400)
-    X, Y = np.meshgrid(x_vals, y_vals)
 
-    feasible_region = np.ones_like(X, dtype=bool)
-    for cf in cons_funcs:
-        feasible_region &= cf(X, Y)
+    from matplotlib import colormaps
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Polygon
+    if show:
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=(8, 8))
+    else:
+        fig = Figure(figsize=(8, 8))
+        FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
 
-    plt.figure(figsize=(8, 8))
-    plt.contourf(X, Y, feasible_region, levels=[0.5,1], colors=["#87CEFA"], alpha=0.3)
+    # Feasible region as one exact polygon, clipped to the plotted range
+    region = feasible_polygon(constraints, (max_x, max_y))
+    if region:
+        ax.add_patch(Polygon(region, closed=True, facecolor="#87CEFA", edgecolor="none", alpha=0.3))
 
     # Constraint lines
-    constraint_colors = plt.cm.tab10(np.linspace(0, 1, len(constraints)))  # Creates a color spectrum
+    constraint_colors = colormaps["tab10"](np.linspace(0, 1, len(constraints)))  # Creates a color spectrum
 
     legend_handles = []
 
@@ -127,46 +242,66 @@ def graphical_solver(opt_type, obj_coeffs, constraints):
         label = f"C{i+1}: {format_constraint(a, b, c, sense)}"
         
         if b != 0:  # Non-vertical line
-            plt.plot(x_vals, (c - a * x_vals) / b, 
+            ax.plot(x_vals, (c - a * x_vals) / b, 
                     linestyle='--', 
                     color=color,
                     label=f"Constraint {i+1}: {a:.1f}x + {b:.1f}y {sense} {c:.1f}")
         else:  # Vertical line
-            plt.axvline(c / a, 
+            ax.axvline(c / a, 
                     linestyle='--', 
                     color=color,
                     label=f"Constraint {i+1}: {a:.1f}x {sense} {c:.1f}")
         
         # Create a custom legend entry
-        legend_handles.append(plt.Line2D([], [], color=color, linestyle='--', linewidth=2,label=label))
+        legend_handles.append(Line2D([], [], color=color, linestyle='--', linewidth=2,label=label))
     
     # Add objective function to legend
     obj_label = f"Obj: z = {obj_coeffs[0]:.2f}x + {obj_coeffs[1]:.2f}y ({opt_type})"
     legend_handles.append(
-        plt.Line2D([], [], color='black', linestyle='-', linewidth=2,label=obj_label))
+        Line2D([], [], color='black', linestyle='-', linewidth=2,label=obj_label))
     
     # Add optimal point to legend
     opt_color = 'green' if opt_type == 'max' else 'gold'
     opt_label = f"Optimal ({opt_type})"
-    legend_handles.append(plt.Line2D([], [], color=opt_color, marker='o', linestyle='None',markersize=10, label=opt_label))
+    legend_handles.append(Line2D([], [], color=opt_color, marker='o', linestyle='None',markersize=10, label=opt_label))
 
     # All intersection points
     for p in unique_points:
-        plt.plot(p[0], p[1], 'ro')
-        plt.text(p[0] + 0.1, p[1] + 0.1, f"({p[0]:.2f},{p[1]:.2f})", fontsize=8) 
+        ax.plot(p[0], p[1], 'ro')
+        ax.text(p[0] + 0.1, p[1] + 0.1, f"({p[0]:.2f},{p[1]:.2f})", fontsize=8) 
 
     # Optimal points
     for p in opt_pts:
-        plt.plot(p[0], p[1], 'go' if opt_type == 'max' else 'gold', markersize=10) 
-
-    plt.xlabel('x')
-    plt.ylabel('y')
-    plt.xlim(left=0)  # Start x-axis at 0
-    plt.ylim(bottom=0)  # Start y-axis at 0
-    plt.title(f"LP Graphical Solution - {status.capitalize()}")
-    plt.legend(handles=legend_handles, loc='upper right', bbox_to_anchor=(1.3, 1))
-    plt.tight_layout()
-    plt.grid(True)
-    plt.show()
-    
-    return {'status': status, 'opt_value': opt_val, 'opt_points': opt_pts}
+        ax.plot(p[0], p[1], 'go' if opt_type == 'max' else 'gold', markersize=10) 
+
+    ax.set_xlabel('x')
+    ax.set_ylabel('y')
+    ax.set_xlim(left=0)  # Start x-axis at 0
+    ax.set_ylim(bottom=0)  # Start y-axis at 0
+    ax.set_title(f"LP Graphical Solution - {status.capitalize()}")
+    ax.legend(handles=legend_handles, loc='upper right', bbox_to_anchor=(1.3, 1))
+    fig.tight_layout()
+    ax.grid(True)
+
+    result = {'status': status, 'opt_value': opt_val, 'opt_points': opt_pts}
+    if cancel is not None and cancel.is_set():
+        return None
+    if save_to is not None:
+        fig.savefig(save_to, format=image_format)
+    elif image_format is not None:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=image_format)
+        result['image'] = buffer.getvalue()
+    if show:
+        plt.show()
+    return result
+
+def _render(job):
+    opt_type, obj_coeffs, constraints, path = job
+    return graphical_solver(opt_type, obj_coeffs, constraints, show=False, save_to=path)['status']
+
+def render_plots(jobs, workers=None, chunksize=16):
+    """Render (opt_type, obj_coeffs, constraints, path) jobs headless in a process pool; returns the statuses."""
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(workers) as executor:
+        return list(executor.map(_render, jobs, chunksize=chunksize))
@@ -0,0 +1,246 @@
+import time
+
+import numpy as np
+
+from simplex import SimplexResult, SimplexSolver, SolveStats, SolverState
+from sparse import as_csr, is_sparse
+
+# scipy is optional and imported by the first factorization, not with the module
+_cho_factor = _cho_solve = None
+_scipy_loaded = False
+
+
+def _load_scipy():
+    global _cho_factor, _cho_solve, _scipy_loaded
+    if _scipy_loaded:
+        return
+    _scipy_loaded = True
+    try:
+        from scipy.linalg import cho_factor as _cho_factor, cho_solve as _cho_solve
+    except ImportError:
+        _cho_factor = _cho_solve = None
+
+
+class InteriorPointStats(SolveStats):
+    def __init__(self):
+        super().__init__(pricing=None)
+        self.primal_residual = np.inf  # ||b - A x|| / (1 + ||b||) at the last iterate
+        self.dual_residual = np.inf    # ||c - A^T y - z|| / (1 + ||c||)
+        self.gap = np.inf              # relative duality gap
+        self.mu = np.inf               # complementarity x z / (n + m)
+        self.factor_time = 0.0         # seconds spent forming and factoring A D A^T
+        self.crossover_iterations = 0  # simplex pivots of the crossover
+
+    def __repr__(self):
+        return (f"InteriorPointStats(iterations={self.iterations}, gap={self.gap:.3e}, "
+                f"crossover_iterations={self.crossover_iterations}, solve_time={self.solve_time:.6f})")
+
+
+class _NormalEquations:
+    # Cholesky factor of M = A diag(d_x) A^T + diag(d_s) for the constraint
+    # matrix [A I] of the slack form; raises LinAlgError when M has
+    # non-finite entries or stays indefinite under regularization
+
+    MAX_TRIES = 10  # regularization steps, up to 1e4 times the largest diagonal entry
+
+    def __init__(self, A, d):
+        _load_scipy()
+        m, n = A.shape
+        M = (A * d[:n]) @ A.T
+        M[np.diag_indices(m)] += d[n:]
+        if not np.all(np.isfinite(M)):
+            raise np.linalg.LinAlgError("the normal equations have non-finite entries")
+        # Tiny diagonal regularization keeps the factorization alive when
+        # the iterates approach a degenerate vertex
+        reg = 1e-14 * max(1.0, float(M.diagonal().max()))
+        for _ in range(self.MAX_TRIES):
+            try:
+                if _cho_factor is not None:
+                    self.factor = _cho_factor(M + reg * np.eye(m), lower=True, check_finite=False)
+                else:
+                    self.factor = np.linalg.cholesky(M + reg * np.eye(m))
+                return
+            except np.linalg.LinAlgError:
+                reg *= 100.0
+        raise np.linalg.LinAlgError("the normal equations are not positive definite")
+
+    def solve(self, r):
+        if _cho_solve is not None:
+            return _cho_solve(self.factor, r, check_finite=False)
+        L = self.factor
+        return np.linalg.solve(L.T, np.linalg.solve(L, r))
+
+
+class InteriorPointSolver:
+    """Primal-dual interior-point method (Mehrotra predictor-corrector).
+
+    Solves max/min c x subject to A x <= b, x >= 0 through the slack form
+    [A I] [x; s] = b. Every iteration forms the normal equations
+    A D A^T once, factors them with Cholesky and solves them twice
+    (predictor and corrector), so the work is a few dense BLAS calls and
+    the iteration count grows very slowly with the problem size.
+
+    With crossover=True the interior solution is turned into a vertex by
+    installing the columns with the largest values as a simplex basis
+    and finishing with SimplexSolver; the result then carries a
+    SolverState for warm starts, exactly like a simplex solve.
+    """
+
+    def __init__(self, tol=1e-8, max_iter=200, crossover=False, step=0.99, stall_window=10, simplex=None):
+        self.tol = tol
+        self.max_iter = max_iter
+        self.stall_window = stall_window  # iterations a residual gets to shrink by 10%
+        self.crossover = crossover
+        self.step = step  # fraction of the step to the boundary
+        self.simplex = simplex or SimplexSolver()  # engine for the crossover
+
+    def _product(self, A, v):
+        # [A I] v
+        n = A.shape[1]
+        return A @ v[:n] + v[n:]
+
+    def _transpose_product(self, A, y):
+        # [A I]^T y
+        return np.concatenate([A.T @ y, y])
+
+    def _max_step(self, v, dv):
+        neg = dv < 0
+        if not np.any(neg):
+            return 1.0
+        return min(1.0, float(np.min(-v[neg] / dv[neg])))
+
+    def _starting_point(self, A, b, cost):
+        # Mehrotra's heuristic: least-squares x and (y, z), shifted to be
+        # strictly positive and balanced
+        ones = np.ones(A.shape[0] + A.shape[1])
+        normal = _NormalEquations(A, ones)
+        x = self._transpose_product(A, normal.solve(b))
+        y = normal.solve(self._product(A, cost))
+        z = cost - self._transpose_product(A, y)
+
+        x += max(-1.5 * x.min(), 0.0)
+        z += max(-1.5 * z.min(), 0.0)
+        xz = x @ z
+        x += 0.5 * xz / max(z.sum(), 1e-12) + 1e-3
+        z += 0.5 * xz / max(x.sum(), 1e-12) + 1e-3
+        return x, y, z
+
+    def _direction(self, A, normal, d, r_p, r_d, r_xz, x, z):
+        # Newton step of A dx = r_p, A^T dy + dz = r_d, Z dx + X dz = r_xz
+        dy = normal.solve(r_p - self._product(A, r_xz / z - d * r_d))
+        dz = r_d - self._transpose_product(A, dy)
+        dx = (r_xz - x * dz) / z
+        return dx, dy, dz
+
+    def _iterate(self, A, b, cost, stats):
+        # Minimizes cost [x; s] over the slack form; returns status, x, y, z
+        x, y, z = self._starting_point(A, b, cost)
+        N = x.shape[0]
+        b_norm = 1.0 + np.linalg.norm(b)
+        c_norm = 1.0 + np.linalg.norm(cost)
+        history = []
+
+        for _ in range(self.max_iter):
+            r_p = b - self._product(A, x)
+            r_d = cost - self._transpose_product(A, y) - z
+            mu = (x @ z) / N
+            primal_obj, dual_obj = cost @ x, b @ y
+            stats.primal_residual = np.linalg.norm(r_p) / b_norm
+            stats.dual_residual = np.linalg.norm(r_d) / c_norm
+            stats.gap = abs(primal_obj - dual_obj) / (1.0 + abs(primal_obj))
+            stats.mu = mu
+            if stats.primal_residual < self.tol and stats.dual_residual < self.tol and stats.gap < self.tol:
+                return "optimal", x, y, z
+
+            # Diverging or stalled iterates: x or y blowing up means a ray
+            # (unbounded or infeasible), and so does a residual that stops
+            # shrinking. The status is then settled by the simplex, see solve.
+            if not (np.isfinite(stats.primal_residual) and np.isfinite(stats.dual_residual)) or max(np.max(x) / b_norm, np.max(np.abs(y)) / c_norm) > 1e8:
+                return "diverged", x, y, z
+            history.append((stats.primal_residual, stats.dual_residual))
+            if len(history) > self.stall_window:
+                p_old, d_old = history[-1 - self.stall_window]
+                if (stats.primal_residual > self.tol and stats.primal_residual > 0.9 * p_old) or \
+                        (stats.dual_residual > self.tol and stats.dual_residual > 0.9 * d_old):
+                    return "stalled", x, y, z
+
+            d = x / z
+            start = time.perf_counter()
+            normal = _NormalEquations(A, d)
+            stats.factor_time += time.perf_counter() - start
+
+            # Predictor (affine scaling) direction
+            dx, dy, dz = self._direction(A, normal, d, r_p, r_d, -x * z, x, z)
+            alpha_p = self._max_step(x, dx)
+            alpha_d = self._max_step(z, dz)
+            mu_aff = ((x + alpha_p * dx) @ (z + alpha_d * dz)) / N
+            sigma = (mu_aff / mu) ** 3
+
+            # Corrector with centering, reusing the same factorization
+            r_xz = -x * z - dx * dz + sigma * mu
+            dx, dy, dz = self._direction(A, normal, d, r_p, r_d, r_xz, x, z)
+            alpha_p = min(1.0, self.step * self._max_step(x, dx))
+            alpha_d = min(1.0, self.step * self._max_step(z, dz))
+
+            x += alpha_p * dx
+            y += alpha_d * dy
+            z += alpha_d * dz
+            stats.iterations += 1
+
+        return "iteration_limit", x, y, z
+
+    def _crossover(self, c, A, b, maximize, values, stats):
+        # Install the columns with the largest interior values as a basis in
+        # a fresh simplex tableau, then let the simplex repair and finish it
+        simplex = self.simplex
+        cost = np.zeros(A.shape[0] + A.shape[1])
+        cost[:c.shape[0]] = c if maximize else -c
+        T, basis = simplex._build_tableau(A, b, cost[:c.shape[0]])
+        simplex_stats = simplex._new_stats()
+
+        order = np.argsort(-values, kind="stable")
+        order = order[values[order] > self.tol * (1.0 + values.max())]
+        basis = simplex._install_basis(T, basis, order, simplex_stats)
+        simplex._set_objective(T, basis, cost)
+        status, basis = simplex._reoptimize(T, basis, cost, simplex_stats)
+
+        stats.crossover_iterations = simplex_stats.iterations
+        state = SolverState(T, basis, c, A, b, maximize)
+        result = simplex._make_result(status, state, simplex_stats)
+        result.iterations = stats.iterations
+        result.stats = stats.finish()
+        return result
+
+    def solve(self, c, A, b, maximize=True):
+        """Solve max/min c x subject to A x <= b, x >= 0."""
+
+        if is_sparse(A):
+            # The normal equations are formed densely anyway
+            A = as_csr(A).toarray()
+        c = np.array(c, dtype=float).flatten()
+        A = np.array(A, dtype=float)
+        b = np.array(b, dtype=float).flatten()
+
+        error = self.simplex._check_problem(c, A, b)
+        if error:
+            return SimplexResult("error", message=error)
+
+        stats = InteriorPointStats()
+        m, n = A.shape
+        cost = np.zeros(n + m)
+        cost[:n] = -c if maximize else c
+        try:
+            with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+                status, x, y, z = self._iterate(A, b, cost, stats)
+        except np.linalg.LinAlgError as exc:
+            return SimplexResult("error", message=f"Interior point failed: {exc}.", iterations=stats.iterations,
+                                 stats=stats.finish())
+
+        if self.crossover or status != "optimal":
+            # Without an optimum the iterates only hint at infeasibility or
+            # unboundedness; the simplex started from them decides exactly
+            return self._crossover(c, A, b, maximize, np.nan_to_num(x, nan=0.0, posinf=0.0), stats)
+
+        stats.finish()
+        x = np.maximum(x[:n], 0.0)
+        return SimplexResult("optimal", x=x, z=float(c @ x), iterations=stats.iterations, stats=stats)
@@ -0,0 +1,249 @@
+import copy
+import heapq
+import itertools
+import time
+
+import numpy as np
+
+from simplex import SimplexSolver
+
+
+class MIPStats:
+    def __init__(self):
+        self.nodes = 0               # LP relaxations solved, the root included
+        self.pruned = 0              # nodes cut off by bound or infeasibility
+        self.lp_iterations = 0       # simplex pivots over all nodes
+        self.solve_time = 0.0
+        self.history = []            # (seconds, nodes, incumbent, bound, gap) after every batch of nodes
+        self._start = time.perf_counter()
+
+    @property
+    def nodes_per_sec(self):
+        return self.nodes / self.solve_time if self.solve_time > 0 else 0.0
+
+    def finish(self):
+        self.solve_time = time.perf_counter() - self._start
+        return self
+
+    def as_dict(self):
+        stats = {k: v for k, v in vars(self).items() if not k.startswith("_")}
+        stats["nodes_per_sec"] = self.nodes_per_sec
+        return stats
+
+    def __repr__(self):
+        return (f"MIPStats(nodes={self.nodes}, nodes_per_sec={self.nodes_per_sec:.1f}, "
+                f"lp_iterations={self.lp_iterations}, solve_time={self.solve_time:.6f})")
+
+
+class MIPResult:
+    def __init__(self, status, x=None, z=None, bound=None, gap=None, message="", stats=None):
+        self.status = status  # "optimal", "feasible" (limit hit with an incumbent), "infeasible", "unbounded", "error"
+        self.x = x            # best integer solution found
+        self.z = z            # its objective value
+        self.bound = bound    # best bound on the optimal objective
+        self.gap = gap        # relative gap between z and bound
+        self.message = message
+        self.stats = stats    # MIPStats
+
+    def __repr__(self):
+        return f"MIPResult(status={self.status!r}, x={self.x}, z={self.z}, gap={self.gap}, message={self.message!r})"
+
+
+def _evaluate(solver, state, lower, upper):
+    # Solve one node by re-optimizing the parent's final tableau under the
+    # node's bounds; module level so worker processes can unpickle it
+    return solver.resolve(state, bounds=np.column_stack([lower, upper]))
+
+
+class _Node:
+    __slots__ = ("bound", "depth", "lower", "upper", "state")
+
+    def __init__(self, bound, depth, lower, upper, state):
+        self.bound = bound    # parent's LP value (maximization form)
+        self.depth = depth
+        self.lower = lower
+        self.upper = upper
+        self.state = state    # parent's SolverState, the warm start of this node
+
+
+class BranchAndBound:
+    """Branch-and-bound for LPs with integer variables.
+
+    Every node is an LP relaxation with tightened variable bounds. Nodes are
+    not solved from scratch: a child re-optimizes its parent's final
+    tableau with the dual simplex after the bound change
+    (SimplexSolver.resolve). Branching is on the most fractional integer
+    variable.
+
+    node_selection is "best_bound" (open node with the best LP value
+    first, which tightens the bound fastest) or "depth_first" (deepest
+    node first, which finds incumbents early and keeps the queue small).
+    With workers > 1, batches of open nodes are solved in a process pool;
+    a larger batch_size amortizes the pickling of the parent tableaus at
+    the price of evaluating some nodes a smaller batch would have pruned.
+    """
+
+    NODE_SELECTION = ("best_bound", "depth_first")
+
+    def __init__(self, solver=None, node_selection="best_bound", workers=None, int_tol=1e-6, gap_tol=1e-6,
+                 batch_size=None, max_nodes=100_000, time_limit=None, verbose=False):
+        if node_selection not in self.NODE_SELECTION:
+            raise ValueError(f"Unknown node_selection {node_selection!r}, expected one of {self.NODE_SELECTION}.")
+        solver = solver or SimplexSolver()
+        if solver.presolve:
+            # Nodes warm-start from their parent's final tableau, which a
+            # presolved solve does not keep
+            solver = copy.copy(solver)
+            solver.presolve = False
+        self.solver = solver
+        self.node_selection = node_selection
+        self.workers = workers            # processes for node evaluation, None or 1 to solve in-process
+        self.batch_size = batch_size or (4 * workers if workers and workers > 1 else 1)  # nodes per round
+        self.int_tol = int_tol            # distance from an integer still treated as integral
+        self.gap_tol = gap_tol            # relative gap at which the search stops
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit      # seconds, None for no limit
+        self.verbose = verbose            # print progress about once a second
+
+    def _key(self, node, order):
+        if self.node_selection == "depth_first":
+            return (-node.depth, -node.bound, order)
+        return (-node.bound, order)
+
+    def _branch_variable(self, x, integer):
+        # Most fractional: the largest distance to the nearest integer
+        frac = np.abs(x[integer] - np.round(x[integer]))
+        if frac.size == 0:
+            return None
+        k = int(np.argmax(frac))
+        if frac[k] <= self.int_tol:
+            return None
+        return integer[k]
+
+    def _gap(self, incumbent, bound):
+        if incumbent is None:
+            return np.inf
+        return max(bound - incumbent, 0.0) / max(1.0, abs(incumbent))
+
+    def solve(self, c, A, b, integer, maximize=True, bounds=None):
+        """Solve max/min c x subject to A x <= b, x >= 0 (or bounds), x_j integer for j in integer.
+
+        integer is a list of column indices or a boolean mask.
+        """
+
+        stats = MIPStats()
+        c = np.array(c, dtype=float).flatten()
+        n = c.shape[0]
+        integer = np.asarray(integer)
+        if integer.dtype == bool:
+            integer = np.flatnonzero(integer)
+        integer = integer.astype(int)
+        if integer.size and (integer.min() < 0 or integer.max() >= n):
+            return MIPResult("error", message="Integer column index out of range.", stats=stats.finish())
+
+        root = self.solver.solve(c, A, b, maximize=maximize,
+                                 bounds=bounds if bounds is not None else [(0.0, None)] * n)
+        stats.nodes += 1
+        stats.lp_iterations += root.iterations
+        if root.status != "optimal":
+            message = root.message if root.status != "infeasible" else "Problem is infeasible."
+            if root.status == "unbounded":
+                message = "LP relaxation is unbounded."
+            return MIPResult(root.status, message=message, stats=stats.finish())
+
+        sense = 1.0 if maximize else -1.0
+        lower = root.state.bounds.lower.copy()
+        upper = root.state.bounds.upper.copy()
+        # Integer variables get integral bounds
+        lower[integer] = np.ceil(lower[integer] - self.int_tol)
+        upper[integer] = np.floor(upper[integer] + self.int_tol)
+
+        incumbent, best_x = None, None
+        heap, counter = [], itertools.count()
+        pending = [(_Node(sense * root.z, 0, lower, upper, root.state), root)]
+        last_log = 0.0
+        limit = None
+
+        executor = None
+        if self.workers and self.workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(self.workers)
+        try:
+            while True:
+                # Process solved nodes: prune, update the incumbent or branch
+                for node, result in pending:
+                    if result.status != "optimal":
+                        stats.pruned += 1
+                        continue
+                    value = sense * result.z
+                    if incumbent is not None and value <= incumbent + self.gap_tol * max(1.0, abs(incumbent)):
+                        stats.pruned += 1
+                        continue
+                    j = self._branch_variable(result.x, integer)
+                    if j is None:
+                        incumbent, best_x = value, result.x.copy()
+                        best_x[integer] = np.round(best_x[integer])
+                        continue
+                    v = result.x[j]
+                    down_upper = node.upper.copy()
+                    down_upper[j] = np.floor(v)
+                    up_lower = node.lower.copy()
+                    up_lower[j] = np.ceil(v)
+                    for child in (_Node(value, node.depth + 1, node.lower, down_upper, result.state),
+                                  _Node(value, node.depth + 1, up_lower, node.upper, result.state)):
+                        if child.lower[j] <= child.upper[j]:
+                            order = next(counter)
+                            heapq.heappush(heap, (self._key(child, order), order, child))
+
+                # Drop open nodes the incumbent already beats
+                if incumbent is not None:
+                    cutoff = incumbent + self.gap_tol * max(1.0, abs(incumbent))
+                    kept = [entry for entry in heap if entry[2].bound > cutoff]
+                    stats.pruned += len(heap) - len(kept)
+                    if len(kept) != len(heap):
+                        heap = kept
+                        heapq.heapify(heap)
+
+                bound = max((entry[2].bound for entry in heap), default=incumbent if incumbent is not None else -np.inf)
+                elapsed = time.perf_counter() - stats._start
+                gap = self._gap(incumbent, bound)
+                stats.history.append((elapsed, stats.nodes, None if incumbent is None else sense * incumbent,
+                                      sense * bound, gap))
+                if self.verbose and (elapsed - last_log >= 1.0 or not heap):
+                    last_log = elapsed
+                    print(f"{elapsed:8.2f}s nodes {stats.nodes:8d} ({stats.nodes / max(elapsed, 1e-9):8.1f}/s) "
+                          f"open {len(heap):6d} incumbent {incumbent} bound {sense * bound:.6g} gap {gap:.3%}")
+
+                if not heap or gap <= self.gap_tol:
+                    break
+                if stats.nodes >= self.max_nodes:
+                    limit = "Node limit reached."
+                    break
+                if self.time_limit is not None and elapsed >= self.time_limit:
+                    limit = "Time limit reached."
+                    break
+
+                # Evaluate the next batch of open nodes
+                batch = [heapq.heappop(heap)[2] for _ in range(min(len(heap), self.batch_size))]
+                args = ([self.solver] * len(batch), [node.state for node in batch],
+                        [node.lower for node in batch], [node.upper for node in batch])
+                if executor is not None:
+                    results = list(executor.map(_evaluate, *args))
+                else:
+                    results = list(map(_evaluate, *args))
+                stats.nodes += len(batch)
+                stats.lp_iterations += sum(result.iterations for result in results)
+                pending = list(zip(batch, results))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        stats.finish()
+        if incumbent is None:
+            if limit:
+                return MIPResult("error", bound=sense * bound, message=f"{limit} No integer solution found.", stats=stats)
+            return MIPResult("infeasible", message="No integer solution exists.", stats=stats)
+        z = float(c @ best_x)
+        if limit:
+            return MIPResult("feasible", x=best_x, z=z, bound=sense * bound, gap=gap, message=limit, stats=stats)
+        return MIPResult("optimal", x=best_x, z=z, bound=sense * bound, gap=gap, stats=stats)
@@ -0,0 +1,360 @@
+import numpy as np
+
+from problem_io import LPModel
+from sparse import CSRMatrix, as_csr
+
+SENSES = ("<=", ">=", "==")
+
+
+class LinExpr:
+    """Array of linear expressions, stored as coordinate terms.
+
+    Element p of the flattened array is const.flat[p] plus vals[t] * x[cols[t]]
+    summed over the terms t with rows[t] == p. Arithmetic, indexing, sum
+    and products with constant matrices work on the term arrays as a
+    whole, with NumPy broadcasting, so no Python object is created per
+    term.
+    """
+
+    __array_ufunc__ = None  # NumPy arrays defer to the reflected operators
+
+    def __array__(self, dtype=None, copy=None):
+        # An opaque 0-d object array rather than an array of elements, so
+        # scipy.sparse products fall back to __rmatmul__ as well
+        wrapped = np.empty((), dtype=object)
+        wrapped[()] = self
+        return wrapped
+
+    def __init__(self, rows, cols, vals, const):
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+        self.vals = np.asarray(vals, dtype=float)
+        self.const = np.asarray(const, dtype=float)
+
+    @classmethod
+    def constant(cls, value):
+        empty = np.zeros(0)
+        return cls(empty, empty, empty, value)
+
+    @property
+    def shape(self):
+        return self.const.shape
+
+    @property
+    def size(self):
+        return self.const.size
+
+    @property
+    def ndim(self):
+        return self.const.ndim
+
+    @property
+    def nnz(self):
+        return self.rows.shape[0]
+
+    def __len__(self):
+        return self.shape[0]
+
+    def _take(self, src, shape):
+        # Element p of the result is element src[p] of self (flat indices);
+        # terms are grouped by row and repeated as often as their row is taken
+        src = np.asarray(src, dtype=np.int64).ravel()
+        order = np.argsort(self.rows, kind="stable")
+        counts = np.bincount(self.rows, minlength=self.size)
+        starts = np.cumsum(counts) - counts
+        per = counts[src]
+        first = np.cumsum(per) - per
+        idx = order[np.repeat(starts[src] - first, per) + np.arange(int(per.sum()))]
+        return LinExpr(np.repeat(np.arange(src.shape[0]), per), self.cols[idx], self.vals[idx],
+                       self.const.ravel()[src].reshape(shape))
+
+    def _broadcast(self, shape):
+        if shape == self.shape:
+            return self
+        return self._take(np.broadcast_to(np.arange(self.size).reshape(self.shape), shape), shape)
+
+    def __getitem__(self, key):
+        src = np.arange(self.size).reshape(self.shape)[key]
+        return self._take(src, np.shape(src))
+
+    def __add__(self, other):
+        other = _as_expr(other)
+        shape = np.broadcast_shapes(self.shape, other.shape)
+        a, b = self._broadcast(shape), other._broadcast(shape)
+        return LinExpr(np.concatenate([a.rows, b.rows]), np.concatenate([a.cols, b.cols]),
+                       np.concatenate([a.vals, b.vals]), a.const + b.const)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return LinExpr(self.rows, self.cols, -self.vals, -self.const)
+
+    def __pos__(self):
+        return self
+
+    def __sub__(self, other):
+        return self + -_as_expr(other)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        if isinstance(other, LinExpr):
+            raise ValueError("The product of two expressions is not linear.")
+        coeff = np.asarray(other, dtype=float)
+        shape = np.broadcast_shapes(self.shape, coeff.shape)
+        expr = self._broadcast(shape)
+        return LinExpr(expr.rows, expr.cols, expr.vals * np.broadcast_to(coeff, shape).ravel()[expr.rows],
+                       expr.const * coeff)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return self * (1.0 / np.asarray(other, dtype=float))
+
+    def sum(self, axis=None):
+        """Sum over all elements (a single expression) or along one axis."""
+        if axis is None:
+            return LinExpr(np.zeros(self.nnz), self.cols, self.vals, self.const.sum())
+        axis = axis % self.ndim
+        out = self.const.sum(axis=axis)
+        target = np.broadcast_to(np.expand_dims(np.arange(out.size).reshape(out.shape), axis), self.shape)
+        return LinExpr(target.ravel()[self.rows], self.cols, self.vals, out)
+
+    def dot(self, coeffs):
+        """Sum of coeffs * self, e.g. the objective c x of a variable vector."""
+        return (self * coeffs).sum()
+
+    def __matmul__(self, other):
+        other = np.asarray(other, dtype=float)
+        if other.ndim == 1:
+            return self.dot(other)
+        return _matrix_product(CSRMatrix.from_dense(other.T), self)
+
+    def __rmatmul__(self, other):
+        # M @ x for a dense or sparse M and a vector expression x
+        return _matrix_product(as_csr(other), self)
+
+    def __le__(self, other):
+        return Constraint(self - other, "<=")
+
+    def __ge__(self, other):
+        return Constraint(self - other, ">=")
+
+    def __eq__(self, other):
+        return Constraint(self - other, "==")
+
+    __hash__ = None
+
+    def value(self, x):
+        """Values of the expressions at the point x (over all model variables)."""
+        x = np.asarray(x, dtype=float)
+        return self.const + np.bincount(self.rows, self.vals * x[self.cols], minlength=self.size).reshape(self.shape)
+
+    def __repr__(self):
+        return f"LinExpr(shape={self.shape}, terms={self.nnz})"
+
+
+def _as_expr(value):
+    return value if isinstance(value, LinExpr) else LinExpr.constant(value)
+
+
+def _matrix_product(M, expr):
+    # Row i of M @ expr is the sum of M[i, k] * expr[k]; every nonzero of M
+    # takes the terms of its expr element
+    if expr.ndim != 1 or M.shape[1] != expr.shape[0]:
+        raise ValueError(f"Cannot multiply a {M.shape} matrix by expressions of shape {expr.shape}.")
+    rows = np.repeat(np.arange(M.shape[0]), np.diff(M.indptr))
+    taken = expr._take(M.indices, (M.nnz,))
+    const = np.bincount(rows, M.data * expr.const[M.indices], minlength=M.shape[0])
+    return LinExpr(rows[taken.rows], taken.cols, taken.vals * M.data[taken.rows], const)
+
+
+class Variables(LinExpr):
+    """Block of model variables with a name and an array shape (Model.add_variables)."""
+
+    def __init__(self, name, start, shape):
+        index = start + np.arange(int(np.prod(shape, dtype=np.int64)))
+        super().__init__(index - start, index, np.ones(index.shape[0]), np.zeros(shape))
+        self.name = name
+        self.index = index.reshape(shape)  # model column of every variable
+
+    def value(self, x):
+        return np.asarray(x, dtype=float)[self.index]
+
+    def __repr__(self):
+        return f"Variables({self.name!r}, shape={self.shape})"
+
+
+class Constraint:
+    """Array of constraints expr <= 0, expr >= 0 or expr == 0 from comparing expressions."""
+
+    def __init__(self, expr, sense):
+        if sense not in SENSES:
+            raise ValueError(f"Unknown constraint sense {sense!r}, expected one of {SENSES}.")
+        self.expr = expr
+        self.sense = sense
+
+    @property
+    def shape(self):
+        return self.expr.shape
+
+    def __bool__(self):
+        # Stops chained comparisons such as 0 <= x <= 1 from silently
+        # dropping one side
+        raise ValueError("Constraints have no truth value; add each side with add_constraints.")
+
+    def __repr__(self):
+        return f"Constraint({self.sense!r}, shape={self.shape}, terms={self.expr.nnz})"
+
+
+def _names(name, shape):
+    # name for a single element, else name[i] or name[i,j,...]; the index
+    # strings are built once per axis and gathered
+    if not shape:
+        return np.array([name])
+    labels = None
+    for axis, size in enumerate(shape):
+        digits = np.arange(size).astype(str).reshape([-1 if k == axis else 1 for k in range(len(shape))])
+        part = np.broadcast_to(digits, shape).ravel()
+        labels = part if labels is None else np.char.add(np.char.add(labels, ","), part)
+    return np.char.add(np.char.add(f"{name}[", labels), "]")
+
+
+class Model:
+    """Algebraic LP/MIP model compiled to solver arrays in one pass.
+
+        model = Model("plan")
+        x = model.add_variables("x", (products, plants), upper=capacity)
+        model.add_constraints("demand", x.sum(axis=1) >= demand)
+        model.add_constraints("supply", A @ x[:, 0] <= stock)
+        model.set_objective((cost * x).sum())
+        result = model.solve()
+        model.values(result.x)["x"]
+
+    Variables and constraints come in named blocks of any array shape.
+    compile() concatenates the term arrays of all blocks into an LPModel
+    with a CSR matrix; element names are name[i,j] and only built then.
+    """
+
+    def __init__(self, name=""):
+        self.name = name
+        self.variables = {}    # name -> Variables
+        self.constraints = {}  # name -> model rows of the block, shaped like it
+        self.objective = LinExpr.constant(0.0)
+        self.maximize = False
+        self._bounds = []      # (lower, upper, integer) per variable block
+        self._blocks = []      # (Constraint, first row) per constraint block
+        self.n = 0
+        self.m = 0
+
+    def add_variables(self, name, shape=(), lower=0.0, upper=np.inf, integer=False):
+        """Add a block of variables; bounds broadcast to shape (np.inf / -np.inf for none)."""
+        if name in self.variables:
+            raise ValueError(f"Variables {name!r} already exist.")
+        shape = tuple(int(k) for k in np.atleast_1d(shape))
+        x = Variables(name, self.n, shape)
+        lower = np.broadcast_to(np.asarray(lower, dtype=float), shape).ravel()
+        upper = np.broadcast_to(np.asarray(upper, dtype=float), shape).ravel()
+        if np.any(upper < lower):
+            raise ValueError(f"Upper bounds of {name!r} must not be below the lower bounds.")
+        self._bounds.append((lower, upper, np.broadcast_to(np.asarray(integer, dtype=bool), shape).ravel()))
+        self.variables[name] = x
+        self.n += x.size
+        return x
+
+    def add_constraints(self, name, constraint):
+        """Add a block of constraints (from <=, >= or ==); returns its model rows."""
+        if name in self.constraints:
+            raise ValueError(f"Constraints {name!r} already exist.")
+        if not isinstance(constraint, Constraint):
+            raise ValueError("Expected a constraint built with <=, >= or == on expressions.")
+        if constraint.expr.nnz and constraint.expr.cols.max() >= self.n:
+            raise ValueError(f"Constraints {name!r} use variables of another model.")
+        rows = self.m + np.arange(constraint.expr.size).reshape(constraint.shape)
+        self._blocks.append((constraint, self.m))
+        self.constraints[name] = rows
+        self.m += constraint.expr.size
+        return rows
+
+    def set_objective(self, expr, maximize=False):
+        expr = _as_expr(expr)
+        if expr.size != 1:
+            raise ValueError("The objective must be a single expression; use .sum() or .dot().")
+        self.objective = expr
+        self.maximize = maximize
+
+    def coo(self):
+        """(rows, cols, vals) of the constraint matrix and the row bounds (row_lower, row_upper)."""
+        blocks = [(c.expr, start, c.sense) for c, start in self._blocks]
+        rows = np.concatenate([np.zeros(0, dtype=np.int64)] + [e.rows + start for e, start, _ in blocks])
+        cols = np.concatenate([np.zeros(0, dtype=np.int64)] + [e.cols for e, _, _ in blocks])
+        vals = np.concatenate([np.zeros(0)] + [e.vals for e, _, _ in blocks])
+        rhs = np.concatenate([np.zeros(0)] + [-e.const.ravel() for e, _, _ in blocks])
+        sense = np.repeat([SENSES.index(s) for _, _, s in blocks], [e.size for e, _, _ in blocks])
+        row_lower = np.where(sense == 0, -np.inf, rhs)
+        row_upper = np.where(sense == 1, np.inf, rhs)
+        return rows, cols, vals, row_lower, row_upper
+
+    def compile(self, names=True):
+        """The model as an LPModel (sparse A, ranged rows, bounds, integer markers).
+
+        Rows and columns are named after their blocks (x[0,3]); with names
+        False the string arrays are skipped and the LPModel falls back to
+        R1.., C1.. if names are ever needed.
+        """
+        rows, cols, vals, row_lower, row_upper = self.coo()
+        A = CSRMatrix.from_coo(rows, cols, vals, (self.m, self.n))
+        bounds = [np.concatenate([np.zeros(0, dtype=dtype)] + [b[k] for b in self._bounds])
+                  for k, dtype in ((0, float), (1, float), (2, bool))]
+        objective = self.objective
+        c = np.bincount(objective.cols, objective.vals, minlength=self.n)
+        row_names = col_names = None
+        if names:
+            empty = np.zeros(0, dtype=str)
+            col_names = np.concatenate([empty] + [_names(name, x.shape) for name, x in self.variables.items()])
+            row_names = np.concatenate([empty] + [_names(name, r.shape) for name, r in self.constraints.items()])
+        return LPModel(c, A, row_lower, row_upper, *bounds, maximize=self.maximize,
+                       objective_offset=float(objective.const.sum()), name=self.name, row_names=row_names,
+                       col_names=col_names)
+
+    def solve(self, solver=None):
+        """Compile and solve; the SimplexResult's x and z are in the model's variables and objective.
+
+        Models with integer variables go to mip.BranchAndBound, which needs a
+        SimplexSolver. The revised and interior-point engines take no variable
+        bounds, so for them the bounds are folded into rows (fold_bounds).
+        """
+        from problem_io import fold_bounds
+        from revised import RevisedSimplexSolver
+        from simplex import SimplexSolver
+
+        form = self.compile(names=False).to_standard()
+        solver = solver or SimplexSolver()
+        with_bounds = isinstance(solver, SimplexSolver) and not isinstance(solver, RevisedSimplexSolver)
+        if form.integer.size:
+            if not with_bounds:
+                raise ValueError("Integer models need a SimplexSolver for branch and bound.")
+            from mip import BranchAndBound
+            result = BranchAndBound(solver=solver).solve(form.c, form.A, form.b, form.integer, form.maximize,
+                                                         form.bounds)
+        elif np.any(form.bounds[:, 0] != 0) or np.any(np.isfinite(form.bounds[:, 1])):
+            if with_bounds:
+                result = solver.solve(form.c, form.A, form.b, form.maximize, bounds=form.bounds)
+            else:
+                c, A, b, lower, offset = fold_bounds(form.c, form.A, form.b, form.bounds)
+                result = solver.solve(c, A, b, form.maximize)
+                if result.x is not None:
+                    result.x, result.z = result.x + lower, result.z + offset
+        else:
+            result = solver.solve(form.c, form.A, form.b, form.maximize)
+        if result.x is not None:
+            result.x, result.z = form.recover(result.x), result.z + form.offset
+        return result
+
+    def values(self, x):
+        """A solution over all model variables as {block name: array shaped like the block}."""
+        return {name: block.value(x) for name, block in self.variables.items()}
+
+    def __repr__(self):
+        return f"Model(name={self.name!r}, rows={self.m}, cols={self.n})"
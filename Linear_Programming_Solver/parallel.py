@@ -0,0 +1,196 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from simplex import BatchResult, SimplexSolver
+from sparse import CSRMatrix, as_csr, is_sparse
+
+
+class SharedArrays:
+    """NumPy arrays copied once into multiprocessing.shared_memory blocks.
+
+    arrays maps names to the views on the shared blocks and spec is the
+    small picklable description other processes pass to attach() to get
+    the same views without copying. The creating process owns the blocks:
+    close() (or leaving the with block) unlinks them.
+    """
+
+    def __init__(self, **arrays):
+        self.arrays = {}
+        self.spec = {}
+        self._blocks = []
+        try:
+            for name, value in arrays.items():
+                self.create(name, np.asarray(value))
+        except BaseException:
+            self.close()
+            raise
+
+    def create(self, name, value=None, shape=None, dtype=float):
+        """Add a block holding a copy of value, or an uninitialized one of the given shape."""
+        shape = value.shape if value is not None else shape
+        dtype = np.dtype(value.dtype if value is not None else dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        block = shared_memory.SharedMemory(create=True, size=size)
+        self._blocks.append(block)
+        view = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        if value is not None:
+            view[...] = value
+        self.arrays[name] = view
+        self.spec[name] = (block.name, shape, dtype.str)
+        return view
+
+    def close(self):
+        self.arrays = {}
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _open_block(name):
+    # Attaching processes must not register the block with the resource
+    # tracker (Python 3.13+ takes track=False); the owner unlinks it
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def attach(spec):
+    """Views on the blocks described by SharedArrays.spec, plus the handles that keep them mapped."""
+    views, blocks = {}, []
+    for key, (name, shape, dtype) in spec.items():
+        block = _open_block(name)
+        blocks.append(block)
+        views[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return views, blocks
+
+
+# Worker process state: the solver, the views of the current problem and
+# its dense constraint matrix (the batch tableau is dense, so a shared CSR
+# matrix is expanded once per problem rather than once per chunk)
+_solver = None
+_attached = (None, {}, [])
+_dense = None
+
+
+def _init_worker(solver):
+    global _solver
+    _solver = solver
+
+
+def _views(spec):
+    # Attach once per problem; a new problem releases the previous blocks
+    global _attached, _dense
+    if _attached[0] != spec:
+        old_views, old_blocks = _attached[1], _attached[2]
+        _attached = (None, {}, [])
+        _dense = None
+        old_views.clear()  # blocks cannot be closed while views on them exist
+        for block in old_blocks:
+            block.close()
+        views, blocks = attach(spec)
+        _attached = (spec, views, blocks)
+    return _attached[1]
+
+
+def _shared_matrix(views):
+    global _dense
+    if "A" in views:
+        return views["A"]
+    if _dense is None:
+        _dense = CSRMatrix(views["A_data"], views["A_indices"], views["A_indptr"], views["A_shape"]).toarray()
+    return _dense
+
+
+def _solve_chunk(spec, start, stop, maximize):
+    # Solve scenarios start..stop-1 and write x, z, status and iterations
+    # straight into the shared output blocks; only messages travel back
+    views = _views(spec)
+    c, b = views["c"], views["b"]
+    c = c[start:stop] if c.shape[0] > 1 else c
+    b = b[start:stop] if b.shape[0] > 1 else b
+    batch = _solver.solve_batch(c, _shared_matrix(views), b, maximize)
+    views["x"][start:stop] = batch.x
+    views["z"][start:stop] = batch.z
+    views["status"][start:stop] = batch.status
+    views["iterations"][start:stop] = batch.iterations
+    return {start + i: message for i, message in batch.messages.items()}
+
+
+class ParallelSolver:
+    """Solves batches of LPs sharing A in a process pool without pickling the data.
+
+    c_batch, A and b_batch are copied once into shared memory; workers
+    solve contiguous chunks of scenarios with SimplexSolver.solve_batch on
+    zero-copy views and write their solutions into shared output arrays,
+    so per task only a few indices go out and the messages of non-optimal
+    scenarios come back. The pool is kept between calls; use the solver as
+    a context manager or call close() to stop it.
+    """
+
+    def __init__(self, solver=None, workers=None, chunk_size=None):
+        self.solver = solver or SimplexSolver()
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size  # scenarios per task, default about 4 tasks per worker
+        self._executor = None
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.solver,))
+        return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def solve_batch(self, c_batch, A, b_batch, maximize=True):
+        """Same interface and result (BatchResult) as SimplexSolver.solve_batch."""
+
+        c_batch = np.atleast_2d(np.asarray(c_batch, dtype=float))
+        b_batch = np.atleast_2d(np.asarray(b_batch, dtype=float))
+        k = max(c_batch.shape[0], b_batch.shape[0])
+        if is_sparse(A):
+            A = as_csr(A)
+            matrix = {"A_data": A.data, "A_indices": A.indices, "A_indptr": A.indptr,
+                      "A_shape": np.array(A.shape, dtype=np.int64)}
+        else:
+            A = np.asarray(A, dtype=float)
+            matrix = {"A": A}
+        n = c_batch.shape[1]
+        if len(A.shape) != 2 or A.shape[1] != n or A.shape[0] != b_batch.shape[1] or \
+                c_batch.shape[0] not in (1, k) or b_batch.shape[0] not in (1, k):
+            # Let the serial solver produce the usual error result
+            return self.solver.solve_batch(c_batch, A, b_batch, maximize)
+
+        chunk = self.chunk_size or max(1, -(-k // (4 * self.workers)))
+        with SharedArrays(c=c_batch, b=b_batch, **matrix) as shared:
+            shared.create("x", shape=(k, n))
+            shared.create("z", shape=(k,))
+            shared.create("status", shape=(k,), dtype=np.int8)
+            shared.create("iterations", shape=(k,), dtype=np.int64)
+            pool = self._pool()
+            futures = [pool.submit(_solve_chunk, shared.spec, start, min(start + chunk, k), maximize)
+                       for start in range(0, k, chunk)]
+            messages = {}
+            for future in futures:
+                messages.update(future.result())
+            # Copies, since the blocks are unlinked on leaving the with block
+            out = {name: shared.arrays[name].copy() for name in ("status", "x", "z", "iterations")}
+        return BatchResult(out["status"], out["x"], out["z"], out["iterations"], messages)
@@ -0,0 +1,290 @@
+import time
+
+import numpy as np
+
+
+class PresolveStats:
+    def __init__(self, rows, cols, nnz):
+        self.rows_before, self.cols_before, self.nnz_before = rows, cols, nnz
+        self.rows_after, self.cols_after, self.nnz_after = rows, cols, nnz
+        self.passes = []      # (pass name, rows removed, columns removed, seconds) per pass run
+        self.time = 0.0
+
+    def as_dict(self):
+        return dict(vars(self))
+
+    def __repr__(self):
+        return (f"PresolveStats(rows {self.rows_before}->{self.rows_after}, "
+                f"cols {self.cols_before}->{self.cols_after}, nnz {self.nnz_before}->{self.nnz_after}, "
+                f"time={self.time:.6f})")
+
+
+class PresolveResult:
+    """Reduced problem max/min c x, A x <= b, 0 <= x <= upper plus the postsolve map.
+
+    status is "reduced", or "infeasible" when presolve alone proves it.
+    postsolve() maps a solution of the reduced problem back to the
+    original variables.
+    """
+
+    def __init__(self, status, c, A, b, stats, upper=None, columns=None, lower=None, col_scale=None, fixed=None,
+                 message=""):
+        self.status = status
+        self.c = c
+        self.A = A
+        self.b = b
+        self.upper = upper           # upper bounds of the reduced variables, inf when unbounded
+        self.stats = stats
+        self.message = message
+        self._columns = columns      # original index of every reduced column
+        self._lower = lower          # shift x = lower + col_scale * x'
+        self._col_scale = col_scale
+        self._fixed = fixed          # original values of the removed columns (NaN for kept ones)
+
+    def postsolve(self, x_reduced):
+        x = self._fixed.copy()
+        x[self._columns] = self._lower + self._col_scale * np.asarray(x_reduced, dtype=float)
+        return x
+
+
+class Presolver:
+    """Sequence of LP reductions in front of SimplexSolver.
+
+    Works on the solver's form max/min c x, A x <= b, lower <= x <= upper.
+    Column bounds are tracked internally: lower bounds end up substituted
+    out and upper bounds (given or from singleton rows) are passed on as
+    native bounds of the reduced problem. Bounds implied by the other rows
+    are only used to fix variables, raise lower bounds and detect
+    infeasibility, never to drop the rows that imply them.
+    """
+
+    PASSES = ("empty_rows", "singleton_rows", "fixed_columns", "duplicate_rows",
+              "dominated_columns", "bound_tightening", "redundant_rows")
+
+    def __init__(self, tol=1e-9, passes=PASSES, scale=True, max_rounds=10, scale_passes=4):
+        self.tol = tol
+        self.passes = passes
+        self.scale = scale
+        self.max_rounds = max_rounds
+        self.scale_passes = scale_passes
+
+    def run(self, c, A, b, maximize=True, lower=None, upper=None):
+        start = time.perf_counter()
+        c = np.array(c, dtype=float).flatten()
+        A = np.array(A, dtype=float)
+        b = np.array(b, dtype=float).flatten()
+        m, n = A.shape
+        stats = PresolveStats(m, n, int(np.count_nonzero(A)))
+
+        self.A, self.b = A.copy(), b.copy()
+        self.cost = c if maximize else -c   # maximization form
+        self.rows = np.ones(m, dtype=bool)
+        self.cols = np.ones(n, dtype=bool)
+        self.lower = np.zeros(n) if lower is None else np.array(lower, dtype=float)
+        self.upper = np.full(n, np.inf) if upper is None else np.array(upper, dtype=float)
+        self.fixed = np.full(n, np.nan)
+        self.infeasible = None
+
+        for _ in range(self.max_rounds):
+            changed = False
+            for name in self.passes:
+                rows, cols = int(self.rows.sum()), int(self.cols.sum())
+                t = time.perf_counter()
+                changed |= bool(getattr(self, "_" + name)())
+                stats.passes.append((name, rows - int(self.rows.sum()), cols - int(self.cols.sum()),
+                                     time.perf_counter() - t))
+                if self.infeasible:
+                    stats.time = time.perf_counter() - start
+                    return PresolveResult("infeasible", None, None, None, stats, message=self.infeasible)
+            if not changed:
+                break
+
+        result = self._build(c, maximize, stats)
+        stats.time = time.perf_counter() - start
+        return result
+
+    # -- reductions ---------------------------------------------------------
+
+    def _fix(self, j, value):
+        # Substitute x_j = value and drop the column
+        self.b -= self.A[:, j] * value
+        self.fixed[j] = value
+        self.cols[j] = False
+
+    def _empty_rows(self):
+        nz = np.count_nonzero(self.A[:, self.cols], axis=1)
+        empty = self.rows & (nz == 0)
+        if np.any(self.b[empty] < -self.tol):
+            self.infeasible = "Empty constraint with negative right-hand side."
+        self.rows[empty] = False
+        return np.any(empty)
+
+    def _singleton_rows(self):
+        sub = self.A[:, self.cols]
+        singles = np.where(self.rows & (np.count_nonzero(sub, axis=1) == 1))[0]
+        cols = np.where(self.cols)[0]
+        for i in singles:
+            j = cols[np.flatnonzero(sub[i])[0]]
+            bound = self.b[i] / self.A[i, j]
+            if self.A[i, j] > 0:
+                self.upper[j] = min(self.upper[j], bound)
+            else:
+                self.lower[j] = max(self.lower[j], bound)
+            self.rows[i] = False
+            if self.upper[j] < self.lower[j] - self.tol:
+                self.infeasible = f"Bounds on variable {j} are inconsistent."
+                return True
+        return singles.size > 0
+
+    def _fixed_columns(self):
+        fixed = np.where(self.cols & (self.upper - self.lower <= self.tol))[0]
+        for j in fixed:
+            self._fix(j, self.lower[j])
+        return fixed.size > 0
+
+    def _duplicate_rows(self):
+        # Rows that are positive multiples of each other: keep the tightest.
+        # Rows are scaled by their largest coefficient and the rounded bytes
+        # are used as a dictionary key, so matches are exact, not just hashed.
+        cols = self.cols
+        if not np.any(cols):
+            return False
+        groups = {}
+        removed = False
+        for i in np.where(self.rows)[0]:
+            row = self.A[i, cols]
+            scale = np.abs(row).max()
+            if scale == 0:
+                continue
+            key = np.round(row / scale, 12).tobytes()
+            rhs = self.b[i] / scale
+            k = groups.get(key)
+            if k is None:
+                groups[key] = (i, rhs)
+                continue
+            keep, keep_rhs = k
+            if rhs < keep_rhs:
+                self.rows[keep] = False
+                groups[key] = (i, rhs)
+            else:
+                self.rows[i] = False
+            removed = True
+        return removed
+
+    def _dominated_columns(self):
+        # A column that only consumes resources and does not improve the
+        # objective stays at its lower bound; one that only frees resources
+        # and does not worsen it goes to its (finite) upper bound
+        sub = self.A[self.rows]
+        changed = False
+        for j in np.where(self.cols)[0]:
+            col = sub[:, j]
+            if self.cost[j] <= 0 and np.all(col >= 0):
+                self._fix(j, self.lower[j])
+                changed = True
+            elif self.cost[j] >= 0 and np.all(col <= 0) and np.isfinite(self.upper[j]):
+                self._fix(j, self.upper[j])
+                changed = True
+        return changed
+
+    def _bound_tightening(self):
+        # Implied bounds from the minimum row activities. Raised lower bounds
+        # are kept (they are substituted out later); implied upper bounds
+        # only serve to detect fixed variables and infeasibility.
+        rows, cols = np.where(self.rows)[0], np.where(self.cols)[0]
+        if rows.size == 0 or cols.size == 0:
+            return False
+        A = self.A[np.ix_(rows, cols)]
+        b = self.b[rows]
+        lo, up = self.lower[cols], self.upper[cols]
+
+        pos, neg = A > 0, A < 0
+        inf_count = np.count_nonzero(neg & np.isinf(up), axis=1)
+        up_finite = np.where(np.isinf(up), 0.0, up)
+        min_act = np.where(pos, A * lo, 0.0).sum(axis=1) + np.where(neg, A * up_finite, 0.0).sum(axis=1)
+        if np.any((inf_count == 0) & (min_act > b + self.tol * (1.0 + np.abs(b)))):
+            self.infeasible = "A constraint cannot be satisfied within the variable bounds."
+            return True
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slack = (b - min_act)[:, None]
+            # Both rules use rows whose minimum activity is finite, i.e. no
+            # a < 0 term of the row has an infinite upper bound
+            # a > 0: x_j <= lo_j + slack / a
+            implied_up = np.where(pos & (inf_count[:, None] == 0), lo + slack / A, np.inf).min(axis=0)
+            # a < 0: x_j >= up_j + slack / a (x_j's own upper bound is then finite)
+            own_inf = neg & np.isinf(up)
+            ok = neg & ~own_inf & (inf_count[:, None] == 0)
+            implied_lo = np.where(ok, up_finite + slack / A, -np.inf).max(axis=0)
+
+        margin = 1e-7 * (1.0 + np.abs(lo))
+        raise_lo = implied_lo > lo + margin
+        self.lower[cols[raise_lo]] = implied_lo[raise_lo]
+        new_lo = self.lower[cols]
+        if np.any(np.minimum(implied_up, up) < new_lo - 1e-7 * (1.0 + np.abs(new_lo))):
+            self.infeasible = "Implied variable bounds are inconsistent."
+            return True
+        fixed = np.minimum(implied_up, up) <= new_lo + self.tol
+        for j in cols[fixed]:
+            self._fix(j, self.lower[j])
+        return bool(np.any(raise_lo) or np.any(fixed))
+
+    def _redundant_rows(self):
+        # Rows that hold for every x within the explicit bounds
+        rows, cols = np.where(self.rows)[0], np.where(self.cols)[0]
+        if rows.size == 0:
+            return False
+        A = self.A[np.ix_(rows, cols)]
+        lo, up = self.lower[cols], self.upper[cols]
+        with np.errstate(invalid="ignore"):
+            max_act = np.where(A > 0, A * up, 0.0).sum(axis=1) + np.where(A < 0, A * lo, 0.0).sum(axis=1)
+        redundant = rows[np.nan_to_num(max_act, nan=np.inf) <= self.b[rows] + self.tol]
+        self.rows[redundant] = False
+        return redundant.size > 0
+
+    # -- output -------------------------------------------------------------
+
+    def _build(self, c, maximize, stats):
+        rows, cols = np.where(self.rows)[0], np.where(self.cols)[0]
+        lower = self.lower[cols]
+        A = self.A[np.ix_(rows, cols)]
+        b = self.b[rows] - A @ lower
+
+        col_scale = np.ones(cols.size)
+        if self.scale and A.size:
+            t = time.perf_counter()
+            A, b, col_scale = self._equilibrate(A, b)
+            stats.passes.append(("scaling", 0, 0, time.perf_counter() - t))
+
+        c_red = c[cols] * col_scale
+        upper = (self.upper[cols] - lower) / col_scale
+        stats.rows_after, stats.cols_after = A.shape
+        stats.nnz_after = int(np.count_nonzero(A))
+        fixed = self.fixed.copy()
+        return PresolveResult("reduced", c_red, A, b, stats, upper, cols, lower, col_scale, fixed)
+
+    def _equilibrate(self, A, b):
+        # Geometric-mean row/column scaling: A' = R A C, b' = R b, x = C x'
+        A = A.copy()
+        b = b.copy()
+        col_scale = np.ones(A.shape[1])
+        mask = A != 0
+        with np.errstate(divide="ignore"):
+            for _ in range(self.scale_passes):
+                r = self._scale_factors(np.abs(A), mask, axis=1)
+                A *= r[:, None]
+                b *= r
+                s = self._scale_factors(np.abs(A), mask, axis=0)
+                A *= s
+                col_scale *= s
+        return A, b, col_scale
+
+    def _scale_factors(self, absA, mask, axis):
+        big = np.where(mask, absA, 0.0).max(axis=axis)
+        small = np.where(mask, absA, np.inf).min(axis=axis)
+        return np.where(big > 0, 1.0 / np.sqrt(big * np.where(np.isinf(small), big, small)), 1.0)
+
+
+def presolve(c, A, b, maximize=True, lower=None, upper=None, **options):
+    """Run the default Presolver; see Presolver for the options."""
+    return Presolver(**options).run(c, A, b, maximize, lower, upper)
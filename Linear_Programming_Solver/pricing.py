@@ -0,0 +1,171 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+
+class PricingRule(ABC):
+    """Chooses the entering column of the primal simplex.
+
+    reset() is called with the starting tableau of every primal phase,
+    choose() once per iteration, and update() with the chosen pivot just
+    before the tableau is pivoted, so rules that keep reference weights
+    can update them from the pre-pivot tableau.
+    """
+
+    name = "base"
+
+    def reset(self, T, basis):
+        pass
+
+    @abstractmethod
+    def choose(self, T, basis, tol):
+        """Entering column, or None when no column improves the objective."""
+
+    def update(self, T, basis, row, col):
+        pass
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class DantzigPricing(PricingRule):
+    """Most negative reduced cost over all columns."""
+
+    name = "dantzig"
+
+    def choose(self, T, basis, tol):
+        obj_row = T[-1, :-1]
+        candidates = np.where(obj_row < -tol)[0]
+        if candidates.size == 0:
+            return None
+        return candidates[np.argmin(obj_row[candidates])]
+
+
+class _WeightedPricing(PricingRule):
+    # Largest d_j^2 / w_j among the improving columns
+
+    def reset(self, T, basis):
+        self.weights = np.ones(T.shape[1] - 1)
+
+    def choose(self, T, basis, tol):
+        obj_row = T[-1, :-1]
+        candidates = np.where(obj_row < -tol)[0]
+        if candidates.size == 0:
+            return None
+        d = obj_row[candidates]
+        return candidates[np.argmax(d * d / self.weights[candidates])]
+
+
+class DevexPricing(_WeightedPricing):
+    """Devex approximate steepest edge with a reference framework."""
+
+    name = "devex"
+
+    def update(self, T, basis, row, col):
+        w = self.weights
+        alpha = T[row, :-1]
+        pivot = alpha[col]
+        w_col = w[col]
+        np.maximum(w, (alpha / pivot) ** 2 * w_col, out=w)
+        w[basis[row]] = max(w_col / (pivot * pivot), 1.0)
+
+
+class SteepestEdgePricing(_WeightedPricing):
+    """Exact steepest edge: w_j = 1 + ||B^-1 a_j||^2, updated on every pivot."""
+
+    name = "steepest_edge"
+
+    def reset(self, T, basis):
+        body = T[:-1, :-1]
+        self.weights = 1.0 + np.einsum("ij,ij->j", body, body)
+
+    def update(self, T, basis, row, col):
+        w = self.weights
+        body = T[:-1, :-1]
+        alpha = body[row] / body[row, col]
+        w_col = w[col]
+        dots = body[:, col] @ body
+        w += alpha * (alpha * w_col - 2.0 * dots)
+        np.maximum(w, 1.0 + alpha * alpha, out=w)
+        w[basis[row]] = w_col / (body[row, col] ** 2)
+
+
+class PartialPricing(PricingRule):
+    """Dantzig pricing over one segment of the columns at a time.
+
+    The scan starts at the segment after the last choice and stops at the
+    first segment that has an improving column.
+    """
+
+    name = "partial"
+
+    def __init__(self, segments=8):
+        self.segments = segments
+
+    def reset(self, T, basis):
+        self.bounds = np.linspace(0, T.shape[1] - 1, self.segments + 1).astype(int)
+        self.start = 0
+
+    def choose(self, T, basis, tol):
+        obj_row = T[-1, :-1]
+        for k in range(self.segments):
+            seg = (self.start + k) % self.segments
+            lo, hi = self.bounds[seg], self.bounds[seg + 1]
+            part = obj_row[lo:hi]
+            if part.size and part.min() < -tol:
+                self.start = (seg + 1) % self.segments
+                return lo + int(np.argmin(part))
+        return None
+
+    def __repr__(self):
+        return f"PartialPricing(segments={self.segments})"
+
+
+class MultiplePricing(PricingRule):
+    """Keeps a short list of the most attractive columns from a full scan
+    and chooses among it until none of them improves any more."""
+
+    name = "multiple"
+
+    def __init__(self, size=8):
+        self.size = size
+
+    def reset(self, T, basis):
+        self.candidates = np.empty(0, dtype=int)
+
+    def choose(self, T, basis, tol):
+        obj_row = T[-1, :-1]
+        if self.candidates.size:
+            d = obj_row[self.candidates]
+            best = int(np.argmin(d))
+            if d[best] < -tol:
+                return self.candidates[best]
+
+        # Refill the list from a full scan
+        candidates = np.where(obj_row < -tol)[0]
+        if candidates.size == 0:
+            return None
+        if candidates.size > self.size:
+            keep = np.argpartition(obj_row[candidates], self.size)[:self.size]
+            candidates = candidates[keep]
+        self.candidates = candidates
+        return candidates[np.argmin(obj_row[candidates])]
+
+    def __repr__(self):
+        return f"MultiplePricing(size={self.size})"
+
+
+PRICING_RULES = {
+    rule.name: rule
+    for rule in (DantzigPricing, DevexPricing, SteepestEdgePricing, PartialPricing, MultiplePricing)
+}
+
+
+def make_pricing(pricing):
+    """Return a PricingRule from a rule instance or one of PRICING_RULES' names."""
+    if isinstance(pricing, PricingRule):
+        return pricing
+    try:
+        return PRICING_RULES[pricing]()
+    except KeyError:
+        raise ValueError(f"Unknown pricing rule {pricing!r}, expected one of {sorted(PRICING_RULES)}.") from None
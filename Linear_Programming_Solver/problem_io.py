@@ -0,0 +1,995 @@
+import gzip
+import re
+
+import numpy as np
+
+from sparse import CSRMatrix, as_csr, is_sparse
+
+BLOCK_SIZE = 1 << 24  # bytes of an MPS file tokenized at once
+
+# Fixed MPS field columns (0-based, end exclusive): type, name, name, value, name, value
+FIXED_FIELDS = ((1, 3), (4, 12), (14, 22), (24, 36), (39, 47), (49, 61))
+
+
+class LPModel:
+    """LP or MIP as stored in a model file.
+
+    Constraints are ranges row_lower <= A x <= row_upper and variables are
+    bounded by lower <= x <= upper; infinite entries mean no bound. A is a
+    CSRMatrix. The objective is c x + objective_offset, maximized when
+    maximize is set.
+    """
+
+    def __init__(self, c, A, row_lower, row_upper, lower, upper, integer=None, maximize=False, objective_offset=0.0,
+                 name="", row_names=None, col_names=None, objective_name="obj"):
+        m, n = A.shape
+        self.c = np.asarray(c, dtype=float)
+        self.A = A
+        self.row_lower = np.asarray(row_lower, dtype=float)
+        self.row_upper = np.asarray(row_upper, dtype=float)
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self.integer = np.zeros(n, dtype=bool) if integer is None else np.asarray(integer, dtype=bool)
+        self.maximize = maximize
+        self.objective_offset = objective_offset
+        self.name = name
+        # Default names (R1.., C1..) are only built when first asked for
+        self._row_names = None if row_names is None else np.array(row_names, dtype=str)
+        self._col_names = None if col_names is None else np.array(col_names, dtype=str)
+        self.objective_name = objective_name
+
+    @classmethod
+    def from_arrays(cls, c, A, b, maximize=True):
+        """The solver's problem max/min c x, A x <= b, x >= 0 as a model."""
+        A = CSRMatrix.from_dense(np.asarray(A, dtype=float))
+        m, n = A.shape
+        return cls(c, A, np.full(m, -np.inf), b, np.zeros(n), np.full(n, np.inf), maximize=maximize)
+
+    @property
+    def shape(self):
+        return self.A.shape
+
+    @property
+    def row_names(self):
+        if self._row_names is None:
+            self._row_names = np.char.add("R", np.arange(1, self.shape[0] + 1).astype(str))
+        return self._row_names
+
+    @row_names.setter
+    def row_names(self, names):
+        self._row_names = np.array(names, dtype=str)
+
+    @property
+    def col_names(self):
+        if self._col_names is None:
+            self._col_names = np.char.add("C", np.arange(1, self.shape[1] + 1).astype(str))
+        return self._col_names
+
+    @col_names.setter
+    def col_names(self, names):
+        self._col_names = np.array(names, dtype=str)
+
+    def to_standard(self):
+        """The model in the solver's form, see StandardForm."""
+        return StandardForm(self)
+
+    def __repr__(self):
+        m, n = self.shape
+        return (f"LPModel(name={self.name!r}, rows={m}, cols={n}, nnz={self.A.nnz}, "
+                f"integer={int(self.integer.sum())}, maximize={self.maximize})")
+
+
+class StandardForm:
+    """An LPModel rewritten as max/min c x, A x <= b, lower <= x <= upper.
+
+    Ranged and equality rows become one <= row per finite side. Variables
+    with an infinite lower bound are complemented (x = upper - x') or,
+    when free, split (x = x+ - x-), since the solver needs finite lower
+    bounds. recover() maps a solution back to the model's variables and
+    offset is the objective constant to add to the solver's z.
+    """
+
+    def __init__(self, model):
+        m, n = model.shape
+        lower, upper = model.lower, model.upper
+        free = np.isinf(lower) & np.isinf(upper)
+        flipped = np.isinf(lower) & np.isfinite(upper)
+
+        # One standard column per model column, plus a negated copy for free ones
+        extra = np.flatnonzero(free)
+        self.columns = np.concatenate([np.arange(n), extra])
+        self.signs = np.concatenate([np.where(flipped, -1.0, 1.0), -np.ones(extra.size)])
+        self.shift = np.concatenate([np.where(flipped, upper, 0.0), np.zeros(extra.size)])
+        self.bounds = np.column_stack([
+            np.concatenate([np.where(flipped | free, 0.0, lower), np.zeros(extra.size)]),
+            np.concatenate([np.where(flipped | free, np.inf, upper), np.full(extra.size, np.inf)]),
+        ])
+        self.c = model.c[self.columns] * self.signs
+        self.offset = model.objective_offset + model.c @ np.where(flipped, upper, 0.0)
+        self.maximize = model.maximize
+        self.integer = np.flatnonzero(model.integer[self.columns])
+
+        rows, cols, vals = _coo(model.A)
+        split = free[cols]
+        extra_map = np.full(n, -1)
+        extra_map[extra] = n + np.arange(extra.size)
+        rows = np.concatenate([rows, rows[split]])
+        vals = np.concatenate([vals * self.signs[cols], -vals[split]])
+        cols = np.concatenate([cols, extra_map[cols[split]]])
+
+        # A x <= row_upper - A shift and -A x <= -(row_lower - A shift)
+        shifted = model.A.matvec(np.where(flipped, upper, 0.0))
+        up_rows = np.flatnonzero(np.isfinite(model.row_upper))
+        lo_rows = np.flatnonzero(np.isfinite(model.row_lower))
+        up_map = np.full(m, -1)
+        up_map[up_rows] = np.arange(up_rows.size)
+        lo_map = np.full(m, -1)
+        lo_map[lo_rows] = up_rows.size + np.arange(lo_rows.size)
+        in_up, in_lo = up_map[rows] >= 0, lo_map[rows] >= 0
+        self.A = CSRMatrix.from_coo(np.concatenate([up_map[rows[in_up]], lo_map[rows[in_lo]]]),
+                                    np.concatenate([cols[in_up], cols[in_lo]]),
+                                    np.concatenate([vals[in_up], -vals[in_lo]]),
+                                    (up_rows.size + lo_rows.size, self.columns.size))
+        self.b = np.concatenate([model.row_upper[up_rows] - shifted[up_rows],
+                                 shifted[lo_rows] - model.row_lower[lo_rows]])
+        self._n = n
+
+    def recover(self, x):
+        """Model variables from a solution of the standard form."""
+        out = np.zeros(self._n)
+        np.add.at(out, self.columns, self.shift + self.signs * np.asarray(x, dtype=float))
+        return out
+
+
+def fold_bounds(c, A, b, bounds):
+    """Bounds as rows, for solvers without bounds (revised, interior).
+
+    x = lower + x' with x' >= 0, plus one row x'_j <= upper_j - lower_j per
+    finite upper bound. Returns (c, A, b, lower, offset): add lower to the
+    solver's x and offset (c lower) to its z.
+    """
+    pairs = np.array([[0.0 if lo is None else lo, np.inf if hi is None else hi] for lo, hi in bounds], dtype=float)
+    lower, upper = pairs[:, 0], pairs[:, 1]
+    if not np.all(np.isfinite(lower)):
+        raise ValueError("Lower bounds must be finite.")
+    c = np.asarray(c, dtype=float)
+    capped = np.flatnonzero(np.isfinite(upper))
+    if is_sparse(A):
+        A = as_csr(A)
+        m = A.shape[0]
+        rows = np.repeat(np.arange(m), np.diff(A.indptr))
+        b = np.asarray(b, dtype=float) - A.matvec(lower)
+        A = CSRMatrix.from_coo(np.concatenate([rows, m + np.arange(capped.size)]),
+                               np.concatenate([A.indices, capped]),
+                               np.concatenate([A.data, np.ones(capped.size)]), (m + capped.size, A.shape[1]))
+    else:
+        A = np.asarray(A, dtype=float)
+        b = np.asarray(b, dtype=float) - A @ lower
+        A = np.vstack([A, np.eye(A.shape[1])[capped]])
+    b = np.concatenate([b, upper[capped] - lower[capped]])
+    return c, A, b, lower, float(c @ lower)
+
+
+def _coo(A):
+    rows = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+    return rows, np.asarray(A.indices, dtype=np.int64), A.data
+
+
+def _open(path, mode):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+# -- MPS reading ---------------------------------------------------------------
+
+def _blocks(f, size):
+    # Chunks of whole lines
+    rest = b""
+    while True:
+        data = f.read(size)
+        if not data:
+            if rest:
+                yield rest + b"\n"
+            return
+        data = rest + data
+        cut = data.rfind(b"\n") + 1
+        rest = data[cut:]
+        if cut:
+            yield data[:cut]
+
+
+def _gather(buf, start, stop):
+    # Byte strings buf[start:stop] as one fixed-width "S" array
+    length = stop - start
+    width = max(int(length.max()) if length.size else 1, 1)
+    idx = start[:, None] + np.arange(width)
+    chars = buf[np.minimum(idx, buf.size - 1)]
+    chars[np.arange(width) >= length[:, None]] = 0
+    return np.ascontiguousarray(chars).view(f"S{width}").ravel()
+
+
+def _free_grid(buf, ends):
+    # Whitespace-separated tokens of every line as a (lines, tokens) grid
+    solid = (buf > 32).view(np.int8)
+    edges = np.diff(np.concatenate([[0], solid, [0]]))
+    starts, stops = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    line = np.searchsorted(ends, starts)
+    rank = np.arange(starts.size) - np.searchsorted(line, line)
+    count = np.bincount(line, minlength=ends.size)
+    tokens = _gather(buf, starts, stops)
+    width = max(int(count.max()) if count.size else 0, len(FIXED_FIELDS))
+    grid = np.zeros((ends.size, width), dtype=tokens.dtype)
+    grid[line, rank] = tokens
+    return grid, count
+
+
+def _fixed_grid(buf, line_starts, ends):
+    # Fixed-column fields, trailing blanks removed and empty fields dropped
+    fields = []
+    for lo, hi in FIXED_FIELDS:
+        start = np.minimum(line_starts + lo, ends)
+        stop = np.minimum(line_starts + hi, ends)
+        field = _gather(buf, start, np.maximum(stop, start))
+        fields.append(np.char.rstrip(field))
+    grid = np.stack(fields, axis=1)
+    present = grid != b""
+    count = present.sum(axis=1)
+    # Compact the present fields to the left, keeping their order
+    order = np.argsort(~present, axis=1, kind="stable")
+    return np.take_along_axis(grid, order, axis=1), count
+
+
+class _Lookup:
+    # Name -> index through a sorted copy of the names
+
+    def __init__(self, names, what):
+        self.order = np.argsort(names, kind="stable")
+        self.sorted = names[self.order]
+        self.what = what
+
+    def __call__(self, tokens):
+        if self.sorted.size == 0:
+            found = np.zeros(tokens.size, dtype=bool)
+            pos = np.zeros(tokens.size, dtype=np.int64)
+        else:
+            pos = np.minimum(np.searchsorted(self.sorted, tokens), self.sorted.size - 1)
+            found = self.sorted[pos] == tokens
+        if not np.all(found):
+            missing = tokens[~found][0].decode(errors="replace")
+            raise ValueError(f"Unknown {self.what} {missing!r} in MPS file.")
+        return self.order[pos]
+
+
+class _MPSReader:
+
+    SECTIONS = (b"NAME", b"ROWS", b"COLUMNS", b"RHS", b"RANGES", b"BOUNDS", b"ENDATA", b"OBJSENSE", b"OBJSENCE")
+
+    def __init__(self, fixed):
+        self.fixed = fixed
+        self.section = None
+        self.name = ""
+        self.maximize = False
+        self.row_types, self.row_names = [], []
+        self.col_names, self.col_integer = [], []
+        self.entries = []        # (rows, cols, vals) per chunk
+        self.objective = []      # (cols, vals) per chunk
+        self.rhs, self.ranges, self.bound_events = [], [], []
+        self.n = 0
+        self.last_col = None
+        self.in_integer = False
+        self.rows = None
+
+    def feed(self, block):
+        buf = np.frombuffer(block, dtype=np.uint8)
+        ends = np.flatnonzero(buf == 10)
+        line_starts = np.concatenate([[0], ends[:-1] + 1])
+        first = buf[np.minimum(line_starts, buf.size - 1)]
+        first[line_starts == ends] = 32
+        grid, count = (self._fixed(buf, line_starts, ends) if self.fixed else _free_grid(buf, ends))
+        count[first == ord("*")] = 0
+
+        headers = np.flatnonzero((first > 32) & (first != ord("*")))
+        bounds = np.concatenate([headers, [ends.size]])
+        if headers.size == 0 or headers[0] > 0:
+            self._segment(grid[:bounds[0]], count[:bounds[0]])
+        for k, h in enumerate(headers):
+            self._header(grid[h][:count[h]])
+            self._segment(grid[h + 1:bounds[k + 1]], count[h + 1:bounds[k + 1]])
+
+    def _fixed(self, buf, line_starts, ends):
+        # Header and integer MARKER lines are free format even in fixed files
+        grid, count = _fixed_grid(buf, line_starts, ends)
+        free_grid, free_count = _free_grid(buf, ends)
+        first = buf[np.minimum(line_starts, buf.size - 1)]
+        header = ((first > 32) & (line_starts != ends)) | (free_grid[:, 1] == b"'MARKER'")
+        width = max(grid.shape[1], free_grid.shape[1])
+        dtype = np.promote_types(grid.dtype, free_grid.dtype)
+        out = np.zeros((ends.size, width), dtype=dtype)
+        out[:, :grid.shape[1]] = grid
+        out[header] = b""
+        out[header, :free_grid.shape[1]] = free_grid[header]
+        count[header] = free_count[header]
+        return out, count
+
+    def _header(self, tokens):
+        word = tokens[0].upper()
+        if word not in self.SECTIONS:
+            raise ValueError(f"Unknown MPS section {tokens[0].decode(errors='replace')!r}.")
+        if word == b"NAME":
+            self.name = b" ".join(tokens[1:]).decode()
+        elif word in (b"OBJSENSE", b"OBJSENCE") and len(tokens) > 1:
+            self.maximize = tokens[1].upper().startswith(b"MAX")
+        if word == b"COLUMNS":
+            self._finish_rows()
+        self.section = word
+
+    def _segment(self, grid, count):
+        keep = count > 0
+        grid, count = grid[keep], count[keep]
+        if count.size == 0:
+            return
+        if self.section == b"ROWS":
+            self.row_types.append(np.char.upper(grid[:, 0]))
+            self.row_names.append(grid[:, 1])
+        elif self.section == b"COLUMNS":
+            self._columns(grid, count)
+        elif self.section in (b"RHS", b"RANGES"):
+            target = self.rhs if self.section == b"RHS" else self.ranges
+            target.append(self._pairs(grid, count))
+        elif self.section == b"BOUNDS":
+            self._bounds(grid, count)
+        elif self.section in (b"OBJSENSE", b"OBJSENCE"):
+            self.maximize = grid[-1, 0].upper().startswith(b"MAX")
+
+    def _finish_rows(self):
+        types = np.concatenate(self.row_types) if self.row_types else np.zeros(0, dtype="S1")
+        names = np.concatenate(self.row_names) if self.row_names else np.zeros(0, dtype="S1")
+        objective = np.flatnonzero(types == b"N")
+        if objective.size == 0:
+            raise ValueError("MPS file has no objective (N) row.")
+        self.objective_name = names[objective[0]]
+        keep = np.ones(types.size, dtype=bool)
+        keep[objective[0]] = False
+        self.types, self.names = types[keep], names[keep]
+        # Row index -1 stands for the objective
+        self.rows = _Lookup(np.concatenate([names[keep], names[objective[:1]]]), "row")
+        self.m = int(keep.sum())
+
+    def _row_index(self, tokens):
+        idx = self.rows(tokens)
+        return np.where(idx == self.m, -1, idx)
+
+    def _columns(self, grid, count):
+        marker = grid[:, 1] == b"'MARKER'"
+        if np.any(marker):
+            # INTORG/INTEND markers switch integrality for the lines after them
+            states = np.concatenate([[self.in_integer], grid[marker, 2] == b"'INTORG'"])
+            line_state = states[np.cumsum(marker)]
+            self.in_integer = bool(states[-1])
+            grid, count, line_state = grid[~marker], count[~marker], line_state[~marker]
+        else:
+            line_state = np.full(count.size, self.in_integer)
+        if count.size == 0:
+            return
+
+        names = grid[:, 0]
+        new = np.ones(names.size, dtype=bool)
+        new[1:] = names[1:] != names[:-1]
+        if self.last_col is not None:
+            new[0] = names[0] != self.last_col
+        self.last_col = names[-1]
+        cols = self.n + np.cumsum(new) - 1
+        self.col_names.append(names[new])
+        self.col_integer.append(line_state[new])
+        self.n += int(new.sum())
+
+        second = count >= 5
+        tokens = np.concatenate([grid[:, 1], grid[second, 3]])
+        vals = np.concatenate([grid[:, 2], grid[second, 4]]).astype(np.float64)
+        cols = np.concatenate([cols, cols[second]])
+        rows = self._row_index(tokens)
+        objective = rows < 0
+        self.objective.append((cols[objective], vals[objective]))
+        self.entries.append((rows[~objective], cols[~objective], vals[~objective]))
+
+    def _pairs(self, grid, count):
+        # (row, value) pairs of RHS/RANGES lines; an odd token count means
+        # the line starts with a set name
+        skip = count % 2
+        lines = np.arange(count.size)
+        tokens, vals = [grid[lines, skip]], [grid[lines, skip + 1]]
+        second = count - skip >= 4
+        tokens.append(grid[lines[second], skip[second] + 2])
+        vals.append(grid[lines[second], skip[second] + 3])
+        return self._row_index(np.concatenate(tokens)), np.concatenate(vals).astype(np.float64)
+
+    def _bounds(self, grid, count):
+        kinds = np.char.upper(grid[:, 0])
+        valued = ~np.isin(kinds, (b"FR", b"MI", b"PL", b"BV"))
+        has_set = count == np.where(valued, 4, 3)
+        lines = np.arange(count.size)
+        cols = grid[lines, 1 + has_set]
+        vals = np.where(valued, grid[lines, np.minimum(2 + has_set, grid.shape[1] - 1)], b"0")
+        self.bound_events.append((kinds, cols, vals.astype(np.float64)))
+
+    def model(self):
+        if self.rows is None:
+            raise ValueError("MPS file has no ROWS/COLUMNS sections.")
+        m, n = self.m, self.n
+        col_names = np.concatenate(self.col_names) if self.col_names else np.zeros(0, dtype="S1")
+        integer = np.concatenate(self.col_integer) if self.col_integer else np.zeros(0, dtype=bool)
+
+        if self.entries:
+            rows, cols, vals = (np.concatenate(parts) for parts in zip(*self.entries))
+        else:
+            rows, cols, vals = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+        A = CSRMatrix.from_coo(rows, cols, vals, (m, n))
+        c = np.zeros(n)
+        for obj_cols, obj_vals in self.objective:
+            np.add.at(c, obj_cols, obj_vals)
+
+        rhs = np.zeros(m)
+        offset = 0.0
+        for idx, vals in self.rhs:
+            rhs[idx[idx >= 0]] = vals[idx >= 0]
+            if np.any(idx < 0):
+                offset = -float(vals[idx < 0][-1])
+        ranges = np.full(m, np.nan)
+        for idx, vals in self.ranges:
+            ranges[idx[idx >= 0]] = vals[idx >= 0]
+
+        types = self.types
+        row_lower = np.where((types == b"G") | (types == b"E"), rhs, -np.inf)
+        row_upper = np.where((types == b"L") | (types == b"E"), rhs, np.inf)
+        ranged = ~np.isnan(ranges)
+        r = np.abs(np.where(ranged, ranges, 0.0))
+        row_lower = np.where(ranged & (types == b"L"), rhs - r, row_lower)
+        row_upper = np.where(ranged & (types == b"G"), rhs + r, row_upper)
+        equal = ranged & (types == b"E")
+        row_lower = np.where(equal & (ranges < 0), rhs + ranges, row_lower)
+        row_upper = np.where(equal & (ranges > 0), rhs + ranges, row_upper)
+
+        lower, upper = np.zeros(n), np.full(n, np.inf)
+        self._apply_bounds(lower, upper, integer, col_names)
+        return LPModel(c, A, row_lower, row_upper, lower, upper, integer, self.maximize, offset, self.name,
+                       self.names.astype(str), col_names.astype(str), self.objective_name.decode())
+
+    def _apply_bounds(self, lower, upper, integer, col_names):
+        if not self.bound_events:
+            return
+        kinds, cols, vals = (np.concatenate(parts) for parts in zip(*self.bound_events))
+        cols = _Lookup(col_names, "column")(cols)
+        integer[cols[np.isin(kinds, (b"BV", b"LI", b"UI"))]] = True
+
+        sets_lower = {b"LO": vals, b"LI": vals, b"FX": vals, b"MI": -np.inf, b"FR": -np.inf, b"BV": 0.0}
+        sets_upper = {b"UP": vals, b"UI": vals, b"FX": vals, b"PL": np.inf, b"FR": np.inf, b"BV": 1.0}
+        for target, rules in ((lower, sets_lower), (upper, sets_upper)):
+            new = np.full(kinds.size, np.nan)
+            for kind, value in rules.items():
+                hit = kinds == kind
+                new[hit] = value[hit] if isinstance(value, np.ndarray) else value
+            # Last bound given for a column wins
+            hit = np.flatnonzero(~np.isnan(new))[::-1]
+            _, last = np.unique(cols[hit], return_index=True)
+            target[cols[hit[last]]] = new[hit[last]]
+
+        # An UP bound below zero on a column without a lower bound makes it
+        # unbounded below (the usual MPS convention)
+        has_lower = np.zeros(lower.size, dtype=bool)
+        has_lower[cols[np.isin(kinds, list(sets_lower))]] = True
+        negative_up = np.isin(kinds, (b"UP", b"UI")) & (vals < 0)
+        flip = cols[negative_up & ~has_lower[cols]]
+        lower[flip] = -np.inf
+
+
+def read_mps(path, fixed=False, block_size=BLOCK_SIZE):
+    """Read a free (or, with fixed=True, fixed-column) MPS file into an LPModel.
+
+    The file is read in blocks of whole lines and every block is tokenized
+    and converted with array operations, so no Python object is created
+    per coefficient. Files ending in .gz are decompressed on the fly.
+    """
+    reader = _MPSReader(fixed)
+    with _open(path, "rb") as f:
+        for block in _blocks(f, block_size):
+            reader.feed(block)
+    return reader.model()
+
+
+# -- MPS writing ---------------------------------------------------------------
+
+def _fmt(values):
+    return [repr(float(v)) for v in values]
+
+
+def write_mps(model, path):
+    """Write an LPModel as a free MPS file (gzip-compressed for .gz paths)."""
+    m, n = model.shape
+    for name in (*model.col_names, *model.row_names, model.objective_name):
+        if not name or any(ch.isspace() for ch in name):
+            raise ValueError(f"Name {name!r} cannot be written in the free MPS format.")
+    lo, up = model.row_lower, model.row_upper
+    types = np.where(lo == up, "E", np.where(np.isfinite(up), "L", np.where(np.isfinite(lo), "G", "N")))
+    rhs = np.where(types == "G", lo, np.where(types == "N", 0.0, up))
+    ranged = (types == "L") & np.isfinite(lo)
+    rows, positions, vals = model.A.select_columns(np.arange(n)) if n else (np.zeros(0, int),) * 3
+    counts = np.bincount(positions, minlength=n) if n else np.zeros(0, int)
+    starts = np.concatenate([[0], np.cumsum(counts)])
+    obj = model.objective_name
+
+    with _open(path, "wt") as f:
+        f.write(f"NAME {model.name}\n")
+        if model.maximize:
+            f.write("OBJSENSE\n    MAX\n")
+        f.write(f"ROWS\n N  {obj}\n")
+        f.writelines(f" {t}  {name}\n" for t, name in zip(types, model.row_names))
+        f.write("COLUMNS\n")
+        integer = False
+        for j in range(n):
+            if model.integer[j] != integer:
+                integer = bool(model.integer[j])
+                f.write("    MARKER  'MARKER'  'INTORG'\n" if integer else "    MARKER  'MARKER'  'INTEND'\n")
+            name = model.col_names[j]
+            if model.c[j] != 0 or counts[j] == 0:
+                f.write(f"    {name}  {obj}  {float(model.c[j])!r}\n")
+            seg = slice(starts[j], starts[j + 1])
+            f.writelines(f"    {name}  {r}  {v}\n" for r, v in zip(model.row_names[rows[seg]], _fmt(vals[seg])))
+        if integer:
+            f.write("    MARKER  'MARKER'  'INTEND'\n")
+
+        f.write("RHS\n")
+        nonzero = np.flatnonzero(rhs != 0)
+        f.writelines(f"    RHS  {model.row_names[i]}  {float(rhs[i])!r}\n" for i in nonzero)
+        if model.objective_offset:
+            f.write(f"    RHS  {obj}  {-float(model.objective_offset)!r}\n")
+        if np.any(ranged):
+            f.write("RANGES\n")
+            f.writelines(f"    RNG  {model.row_names[i]}  {float(up[i] - lo[i])!r}\n" for i in np.flatnonzero(ranged))
+
+        f.write("BOUNDS\n")
+        for j in range(n):
+            name, l, u = model.col_names[j], float(model.lower[j]), float(model.upper[j])
+            if model.integer[j] and l == 0 and u == 1:
+                f.write(f" BV BND  {name}\n")
+            elif l == u:
+                f.write(f" FX BND  {name}  {l!r}\n")
+            elif np.isinf(l) and np.isinf(u):
+                f.write(f" FR BND  {name}\n")
+            else:
+                if np.isinf(l):
+                    f.write(f" MI BND  {name}\n")
+                elif l != 0 or u < 0:
+                    f.write(f" LO BND  {name}  {l!r}\n")
+                if np.isfinite(u):
+                    f.write(f" UP BND  {name}  {u!r}\n")
+        f.write("ENDATA\n")
+
+
+# -- CPLEX LP format -----------------------------------------------------------
+
+_LP_SECTION = re.compile(
+    r"^[ \t]*(maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|subject[ \t]+to|such[ \t]+that|s\.t\.|st|"
+    r"bounds?|generals?|gen|integers?|binar(?:y|ies)|bin|end)(?=[ \t]|$)", re.I | re.M)
+_LP_NAME_PATTERN = r"[A-Za-z_!\"#$%&()/,;?@`'{}|~][\w!\"#$%&()/,.;?@`'{}|~\[\]]*"
+_LP_NAME = re.compile(_LP_NAME_PATTERN)
+
+# Token kinds of the LP reader; bytes of a word, comparison, sign, colon and
+# star get the kind of the token they start (-1 is white space)
+_NUM, _NAME, _OP, _SIGN, _COLON, _STAR, _SECTION = range(7)
+_LP_BYTES = np.full(256, _NAME, dtype=np.int8)
+_LP_BYTES[:33] = -1
+_LP_BYTES[list(b"<>=")] = _OP
+_LP_BYTES[list(b"+-")] = _SIGN
+_LP_BYTES[ord(":")] = _COLON
+_LP_BYTES[ord("*")] = _STAR
+
+_MAX, _MIN, _ST, _BOUNDS, _GEN, _BIN, _END = range(7)
+_LP_SECTIONS = {
+    b"max": _MAX, b"maximize": _MAX, b"maximise": _MAX, b"maximum": _MAX,
+    b"min": _MIN, b"minimize": _MIN, b"minimise": _MIN, b"minimum": _MIN,
+    b"subject": _ST, b"such": _ST, b"s.t.": _ST, b"st": _ST,
+    b"bound": _BOUNDS, b"bounds": _BOUNDS,
+    b"gen": _GEN, b"general": _GEN, b"generals": _GEN, b"integer": _GEN, b"integers": _GEN,
+    b"bin": _BIN, b"binary": _BIN, b"binaries": _BIN, b"end": _END,
+}
+_LP_SENSES = {b"<": 0, b"<=": 0, b"=<": 0, b">": 1, b">=": 1, b"=>": 1, b"=": 2}
+_LP_NUMBER = re.compile(rb"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_LP_DIGITS = np.zeros(256, dtype=bool)
+_LP_DIGITS[list(b"0123456789.")] = True
+_LP_NUMERIC = np.zeros(256, dtype=bool)
+_LP_NUMERIC[list(b"0123456789.eE+-")] = True
+
+
+def _lp_tokens(block):
+    # Tokens of a block of whole lines as (kinds, values, texts) arrays
+    buf = np.frombuffer(block, dtype=np.uint8).copy()
+    ends = np.flatnonzero(buf == 10)
+    # Comments run from a backslash to the end of the line
+    slash = np.flatnonzero(buf == ord("\\"))
+    if slash.size:
+        line = np.searchsorted(ends, slash)
+        first = np.concatenate([[True], np.diff(line) > 0])
+        start, stop = slash[first], ends[line[first]]
+        length = stop - start
+        buf[np.arange(length.sum()) + np.repeat(start - np.cumsum(length) + length, length)] = 32
+
+    cls = _LP_BYTES[buf]
+    # The sign of an exponent (1e-5) belongs to its number
+    sign = np.flatnonzero(cls == _SIGN)
+    sign = sign[(sign >= 2) & (sign + 1 < buf.size)]
+    sign = sign[np.isin(buf[sign - 1], list(b"eE")) & _LP_DIGITS[buf[sign - 2]] & _LP_DIGITS[buf[sign + 1]]
+                & (buf[sign + 1] != ord("."))]
+    if sign.size:
+        word = np.flatnonzero((cls == _NAME) & (np.concatenate([[-1], cls[:-1]]) != _NAME))
+        cls[sign[_LP_DIGITS[buf[word[np.searchsorted(word, sign - 1, side="right") - 1]]]]] = _NAME
+
+    token = cls >= 0
+    single = (cls == _SIGN) | (cls == _COLON) | (cls == _STAR)
+    change = cls[1:] != cls[:-1]
+    starts = np.flatnonzero(token & (np.concatenate([[True], change]) | single))
+    stops = np.flatnonzero(token & (np.concatenate([change, [True]]) | single)) + 1
+    kinds = cls[starts]
+    texts = _gather(buf, starts, stops)
+
+    # Section keywords start a line and are followed by white space
+    line = np.searchsorted(ends, starts)
+    head = np.flatnonzero((kinds == _NAME) & np.concatenate([[True], np.diff(line) > 0]) & (buf[stops] <= 32)
+                          & (stops - starts <= 9))
+    lowered = np.char.lower(texts[head])
+    known = np.isin(lowered, list(_LP_SECTIONS))
+    head, lowered = head[known], lowered[known]
+    values = np.zeros(kinds.size)
+    drop = np.zeros(kinds.size, dtype=bool)
+    for k, word in zip(head, lowered):
+        if word in (b"subject", b"such"):
+            # "subject to" and "such that" are two words on one line
+            follow = k + 1 < kinds.size and line[k + 1] == line[k] and buf[stops[k + 1]] <= 32
+            if not follow or texts[k + 1].lower() != (b"to" if word == b"subject" else b"that"):
+                continue
+            drop[k + 1] = True
+        kinds[k] = _SECTION
+        values[k] = _LP_SECTIONS[word]
+
+    kinds, values, texts, starts, stops = kinds[~drop], values[~drop], texts[~drop], starts[~drop], stops[~drop]
+    values[kinds == _SIGN] = np.where(buf[starts[kinds == _SIGN]] == ord("-"), -1.0, 1.0)
+    ops = np.flatnonzero(kinds == _OP)
+    names, inverse = np.unique(texts[ops], return_inverse=True)
+    for k, op in enumerate(names):
+        if op not in _LP_SENSES:
+            raise ValueError(f"Unknown comparison {op.decode()!r} in LP file.")
+        values[ops[inverse == k]] = _LP_SENSES[op]
+
+    words = kinds == _NAME
+    first = buf[starts]
+    number = words & _LP_DIGITS[first]
+    special = np.flatnonzero(words & np.isin(first, list(b"iI")))
+    number[special[np.isin(np.char.lower(texts[special]), (b"inf", b"infinity"))]] = True
+    kinds[number] = _NUM
+    try:
+        values[number] = texts[number].astype(float)
+    except ValueError:
+        # A coefficient may be written against its name ("3x")
+        odd = np.concatenate([[0], np.cumsum(~_LP_NUMERIC[buf])])
+        split = number & _LP_DIGITS[first] & ((odd[stops] > odd[starts]) | np.isin(buf[stops - 1], list(b"eE")))
+        kinds, values, texts = _lp_split_numbers(kinds, values, texts, np.flatnonzero(split))
+    return kinds, values, texts
+
+
+def _lp_split_numbers(kinds, values, texts, split):
+    # Each word in split becomes its leading number and the name after it
+    heads, rests = [], []
+    for word in texts[split]:
+        match = _LP_NUMBER.match(word)
+        rest = word[match.end():] if match else b""
+        if match is None or rest[:1].isdigit() or rest[:1] == b".":
+            raise ValueError(f"Cannot read the number {word.decode(errors='replace')!r} in LP file.")
+        heads.append(match.group())
+        rests.append(rest)
+    texts = texts.astype(np.promote_types(texts.dtype, np.array(rests + heads).dtype))
+    texts[split] = heads
+    number = kinds == _NUM
+    try:
+        values[number] = texts[number].astype(float)
+    except ValueError:
+        raise ValueError("Cannot read a number in LP file.") from None
+    at = split + 1
+    return (np.insert(kinds, at, _NAME), np.insert(values, at, 0.0), np.insert(texts, at, rests))
+
+
+class _LPReader:
+    # Statements of an LP file, taken apart on the token arrays of the whole file
+
+    def __init__(self, kinds, values, texts):
+        keep = kinds != _STAR  # "3 * x" is read as "3 x"
+        self.kinds, self.values, self.texts = kinds[keep], values[keep], texts[keep]
+        kinds, values = self.kinds, self.values
+        size = kinds.size
+        index = np.arange(size)
+
+        # Section of every token; none before the first and after End
+        last = np.maximum.accumulate(np.where(kinds == _SECTION, index, -1))
+        self.section = np.where(last >= 0, values[np.maximum(last, 0)], -1)
+        self.section[(kinds == _SECTION) | (self.section == _END)] = -1
+
+        # Nearest token before and after each one that is not a sign, and the
+        # product of the signs in between
+        solid = kinds != _SIGN
+        last = np.maximum.accumulate(np.where(solid, index, -1))
+        self.prev = np.concatenate([[-1], last])[:-1]
+        after = np.minimum.accumulate(np.where(solid, index, size)[::-1])[::-1]
+        self.next = np.concatenate([after, [size]])[1:]
+        minus = np.concatenate([[0], np.cumsum((kinds == _SIGN) & (values < 0))])
+        self.sign = np.where((minus[index] - minus[self.prev + 1]) % 2, -1.0, 1.0)
+        self.variables = np.zeros(size, dtype=bool)
+
+    def signed(self, k):
+        return self.values[k] * self.sign[k]
+
+    def labels(self, region):
+        # "name:" at the start of a statement
+        colons = np.flatnonzero(region & (self.kinds == _COLON))
+        labels = colons - 1
+        if np.any(labels < 0) or np.any(self.kinds[labels] != _NAME):
+            raise ValueError("A colon in an LP file must follow a name.")
+        return labels
+
+    def terms(self, expression):
+        # Coefficients of the names in an expression and its numbers standing alone
+        kinds = self.kinds
+        names = np.flatnonzero(expression & (kinds == _NAME))
+        before = names - 1
+        coefficient = (before >= 0) & expression[before] & (kinds[before] == _NUM)
+        coefs = np.where(coefficient, self.signed(before), 1.0) * self.sign[names]
+        numbers = np.flatnonzero(expression & (kinds == _NUM))
+        after = np.minimum(numbers + 1, kinds.size - 1)
+        alone = numbers[~(expression[after] & (kinds[after] == _NAME) & (after > numbers))]
+        self.variables[names] = True
+        return names, coefs, alone
+
+    def objective(self):
+        region = (self.section == _MAX) | (self.section == _MIN)
+        labels = self.labels(region)
+        expression = region & ((self.kinds == _NAME) | (self.kinds == _NUM))
+        expression[labels] = False
+        names, coefs, alone = self.terms(expression)
+        sections = np.flatnonzero((self.kinds == _SECTION) & (self.values <= _MIN))
+        maximize = bool(sections.size) and self.values[sections[-1]] == _MAX
+        name = self.texts[labels[0]].decode() if labels.size else "obj"
+        return names, coefs, float(self.signed(alone).sum()), maximize, name
+
+    def rows(self):
+        kinds = self.kinds
+        region = self.section == _ST
+        labels = self.labels(region)
+        ops = np.flatnonzero(region & (kinds == _OP))
+
+        # "lo <= expression <= hi": a number starting its statement, then a comparison
+        lo = ops - 1
+        start = self.prev[np.maximum(lo, 0)]
+        starts = ((start < 0) | (kinds[start] == _COLON) | (kinds[start] == _SECTION)
+                  | ((kinds[start] == _NUM) & (kinds[self.prev[start]] == _OP)))
+        ranged = (lo >= 0) & (kinds[np.maximum(lo, 0)] == _NUM) & starts
+        ops, range_ops = ops[~ranged], ops[ranged]
+
+        rhs = self.next[ops]
+        if np.any(rhs >= kinds.size) or np.any(kinds[np.minimum(rhs, kinds.size - 1)] != _NUM):
+            raise ValueError("Expected a number after a comparison in LP file.")
+        m = rhs.size
+        row = np.searchsorted(rhs, np.arange(kinds.size))
+        if np.any(region & (kinds != _SIGN) & (row >= m)):
+            raise ValueError("Constraint without a comparison in LP file.")
+
+        expression = region & ((kinds == _NAME) | (kinds == _NUM))
+        expression[np.concatenate([labels, rhs, range_ops - 1])] = False
+        names, coefs, alone = self.terms(expression)
+        constant = np.bincount(row[alone], weights=self.signed(alone), minlength=m)
+
+        value, sense = self.signed(rhs), self.values[ops]
+        row_lower = np.where(sense >= 1, value, -np.inf)
+        row_upper = np.where(sense != 1, value, np.inf)
+        row_lower[row[range_ops]] = self.signed(range_ops - 1)
+        row_upper[row[range_ops]] = value[row[range_ops]]
+
+        row_names = np.char.add("R", np.arange(1, m + 1).astype(str))
+        if labels.size:
+            row_names = row_names.astype(object)
+            row_names[row[labels]] = np.char.decode(self.texts[labels], "utf-8")
+        return row[names], names, coefs, row_lower - constant, row_upper - constant, row_names
+
+    def bounds(self):
+        # (token of the variable, lower or nan, upper or nan) per bound, in file order
+        kinds = self.kinds
+        region = self.section == _BOUNDS
+        ops = np.flatnonzero(region & (kinds == _OP))
+        left, right = self.prev[ops], self.next[ops]
+        both = (left >= 0) & (right < kinds.size)
+        right = np.minimum(right, kinds.size - 1)
+        name_first = both & (kinds[left] == _NAME) & (kinds[right] == _NUM)
+        name_last = both & (kinds[left] == _NUM) & (kinds[right] == _NAME)
+        if not np.all(name_first | name_last):
+            raise ValueError("A bound in an LP file must compare a name with a number.")
+        column = np.where(name_first, left, right)
+        value = self.signed(np.where(name_first, right, left))
+        # Seen from the variable, "v <= x" is "x >= v"
+        sense = self.values[ops]
+        sense = np.where(name_last & (sense < 2), 1 - sense, sense)
+        lower = np.where(sense >= 1, value, np.nan)
+        upper = np.where(sense != 1, value, np.nan)
+
+        words = np.flatnonzero(region & (kinds == _NAME))
+        free = words[(words > 0) & (np.char.lower(self.texts[words]) == b"free")]
+        free = free[kinds[free - 1] == _NAME]
+        order = np.argsort(np.concatenate([ops, free]), kind="stable")
+        self.variables[region & (kinds == _NAME)] = True
+        self.variables[free] = False
+        return (np.concatenate([column, free - 1])[order],
+                np.concatenate([lower, np.full(free.size, -np.inf)])[order],
+                np.concatenate([upper, np.full(free.size, np.inf)])[order])
+
+    def integers(self, section):
+        names = np.flatnonzero((self.section == section) & (self.kinds == _NAME))
+        self.variables[names] = True
+        return names
+
+    def model(self):
+        obj_names, obj_coefs, offset, maximize, objective_name = self.objective()
+        rows, row_tokens, coefs, row_lower, row_upper, row_names = self.rows()
+        bound_tokens, bound_lower, bound_upper = self.bounds()
+        general, binary = self.integers(_GEN), self.integers(_BIN)
+
+        # Columns are numbered by first appearance
+        tokens = np.flatnonzero(self.variables)
+        names, first, inverse = np.unique(self.texts[tokens], return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        rank = np.empty(order.size, dtype=np.int64)
+        rank[order] = np.arange(order.size)
+        column = np.full(self.kinds.size, -1, dtype=np.int64)
+        column[tokens] = rank[inverse.ravel()]
+        n, m = names.size, row_lower.size
+
+        c = np.bincount(column[obj_names], weights=obj_coefs, minlength=n)
+        A = CSRMatrix.from_coo(rows, column[row_tokens], coefs, (m, n))
+        lower, upper = np.zeros(n), np.full(n, np.inf)
+        cols = column[bound_tokens]
+        for target, value in ((lower, bound_lower), (upper, bound_upper)):
+            # Last bound given for a column wins
+            hit = np.flatnonzero(~np.isnan(value))[::-1]
+            _, last = np.unique(cols[hit], return_index=True)
+            target[cols[hit[last]]] = value[hit[last]]
+        lower[column[binary]] = 0.0
+        upper[column[binary]] = 1.0
+        integer = np.zeros(n, dtype=bool)
+        integer[column[np.concatenate([general, binary])]] = True
+        return LPModel(c, A, row_lower, row_upper, lower, upper, integer, maximize, offset, "",
+                       row_names, np.char.decode(names[order], "utf-8"), objective_name)
+
+
+def read_lp(path, block_size=BLOCK_SIZE):
+    """Read a CPLEX LP file into an LPModel.
+
+    As in read_mps, the file is tokenized in blocks of whole lines with
+    array operations, and the statements are then taken apart on the token
+    arrays of the whole file, so no Python object is created per term.
+    """
+    parts = []
+    with _open(path, "rb") as f:
+        for block in _blocks(f, block_size):
+            parts.append(_lp_tokens(block))
+    if not parts:
+        parts.append((np.zeros(0, dtype=np.int8), np.zeros(0), np.zeros(0, dtype="S1")))
+    return _LPReader(*(np.concatenate(arrays) for arrays in zip(*parts))).model()
+
+
+def _lp_number(v):
+    return "inf" if v == np.inf else "-inf" if v == -np.inf else repr(float(v))
+
+
+def _lp_terms(cols, vals, names, per_line=8):
+    parts = []
+    for k, (j, v) in enumerate(zip(cols, vals)):
+        sign = "-" if v < 0 else "+"
+        term = f"{sign} {abs(float(v))!r} {names[j]}"
+        parts.append(("\n   " if k and k % per_line == 0 else " ") + term)
+    return "".join(parts) if parts else " 0 " + names[0] if len(names) else " 0"
+
+
+def write_lp(model, path):
+    """Write an LPModel as a CPLEX LP file."""
+    m, n = model.shape
+    names = model.col_names
+    for name in (*names, *model.row_names, model.objective_name):
+        if not _LP_NAME.fullmatch(name) or _LP_SECTION.match(name) or name.lower() in ("inf", "infinity", "free"):
+            raise ValueError(f"Name {name!r} cannot be written in the LP format.")
+    with _open(path, "wt") as f:
+        f.write(f"\\ Problem: {model.name}\n")
+        f.write("Maximize\n" if model.maximize else "Minimize\n")
+        # Every column is listed in the objective, zeros included, so a reader
+        # numbering columns by first appearance keeps their order
+        f.write(f" {model.objective_name}:{_lp_terms(np.arange(n), model.c, names)}")
+        if model.objective_offset:
+            f.write(f" {'-' if model.objective_offset < 0 else '+'} {abs(float(model.objective_offset))!r}")
+        f.write("\nSubject To\n")
+        A = model.A
+        for i in range(m):
+            cols, vals = A.row_entries(i)
+            expr = _lp_terms(cols, vals, names)
+            lo, up = model.row_lower[i], model.row_upper[i]
+            if lo == up:
+                f.write(f" {model.row_names[i]}:{expr} = {_lp_number(up)}\n")
+            elif np.isfinite(lo) and np.isfinite(up):
+                f.write(f" {model.row_names[i]}: {_lp_number(lo)} <={expr} <= {_lp_number(up)}\n")
+            elif np.isfinite(up):
+                f.write(f" {model.row_names[i]}:{expr} <= {_lp_number(up)}\n")
+            else:
+                f.write(f" {model.row_names[i]}:{expr} >= {_lp_number(lo)}\n")
+        f.write("Bounds\n")
+        for j in range(n):
+            l, u = model.lower[j], model.upper[j]
+            if l == 0 and u == np.inf:
+                continue
+            if np.isinf(l) and np.isinf(u):
+                f.write(f" {names[j]} free\n")
+            elif l == u:
+                f.write(f" {names[j]} = {_lp_number(l)}\n")
+            else:
+                f.write(f" {_lp_number(l)} <= {names[j]} <= {_lp_number(u)}\n")
+        integer = np.flatnonzero(model.integer)
+        if integer.size:
+            f.write("Generals\n")
+            f.writelines(f" {names[j]}\n" for j in integer)
+        f.write("End\n")
+
+
+def read_problem(path, **options):
+    """Read an MPS or LP model, chosen by the file extension (.gz allowed)."""
+    name = str(path).lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".lp"):
+        return read_lp(path)
+    return read_mps(path, **options)
+
+
+def write_problem(model, path):
+    name = str(path).lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".lp"):
+        write_lp(model, path)
+    else:
+        write_mps(model, path)
+
+
+# -- Dense tables --------------------------------------------------------------
+
+# A table holds one problem max/min c x, A x <= b as a (m + 1) x (n + 1)
+# array: the first row is c (its last entry is unused), the others [A | b]
+
+def read_table(path):
+    """c, A, b from a table in a .npy or CSV file (empty CSV fields read as 0)."""
+    if str(path).lower().endswith(".npy"):
+        table = np.load(path, allow_pickle=False)
+    else:
+        # Only empty fields are filled with 0; a non-numeric one stays NaN
+        table = np.genfromtxt(path, delimiter=",", ndmin=2, usemask=True).filled(0.0)
+    table = np.asarray(table, dtype=float)
+    if table.ndim != 2 or table.shape[0] < 2 or table.shape[1] < 2:
+        raise ValueError(f"{path}: a table needs an objective row and at least one constraint row.")
+    if not np.all(np.isfinite(table[:, :-1])) or not np.all(np.isfinite(table[1:, -1])):
+        raise ValueError(f"{path}: the table has missing or non-numeric entries.")
+    return table[0, :-1].copy(), table[1:, :-1].copy(), table[1:, -1].copy()
+
+
+def write_table(path, c, A, b):
+    """Write c, A, b as a table, to .npy or else CSV."""
+    A = np.asarray(A, dtype=float)
+    table = np.zeros((A.shape[0] + 1, A.shape[1] + 1))
+    table[0, :-1] = c
+    table[1:, :-1] = A
+    table[1:, -1] = b
+    if str(path).lower().endswith(".npy"):
+        with open(path, "wb") as f:
+            np.save(f, table)
+    else:
+        np.savetxt(path, table, delimiter=",", fmt="%.17g")
@@ -0,0 +1,314 @@
+import time
+
+import numpy as np
+
+from simplex import SimplexResult, SimplexSolver, SolveStats
+from sparse import CSRMatrix, as_csr, is_sparse
+
+# scipy is optional (the NumPy LU below is the fallback) and is imported
+# by the first BasisFactor rather than with this module, which keeps it
+# out of the startup of processes that never factor a basis
+_lu_factor = _lu_solve = _csc_matrix = _splu = None
+_scipy_loaded = False
+
+
+def _load_scipy():
+    global _lu_factor, _lu_solve, _csc_matrix, _splu, _scipy_loaded
+    if _scipy_loaded:
+        return
+    _scipy_loaded = True
+    try:
+        from scipy.linalg import lu_factor as _lu_factor, lu_solve as _lu_solve
+        from scipy.sparse import csc_matrix as _csc_matrix
+        from scipy.sparse.linalg import splu as _splu
+    except ImportError:
+        _lu_factor = _lu_solve = _csc_matrix = _splu = None
+
+
+def _lu_factor_np(B):
+    # Doolittle LU with partial pivoting, same (lu, piv) layout as scipy.linalg.lu_factor
+    LU = np.array(B, dtype=float)
+    m = LU.shape[0]
+    piv = np.arange(m)
+    for k in range(m):
+        p = k + int(np.argmax(np.abs(LU[k:, k])))
+        if LU[p, k] == 0.0:
+            raise np.linalg.LinAlgError("Singular basis matrix.")
+        piv[k] = p
+        if p != k:
+            LU[[k, p]] = LU[[p, k]]
+        LU[k + 1:, k] /= LU[k, k]
+        LU[k + 1:, k + 1:] -= np.outer(LU[k + 1:, k], LU[k, k + 1:])
+    return LU, piv
+
+
+def _lu_solve_np(lu_piv, rhs, trans=0):
+    LU, piv = lu_piv
+    x = np.array(rhs, dtype=float)
+    m = x.shape[0]
+    if trans == 0:
+        # B = P L U  ->  apply the row swaps, then L (unit) and U solves
+        for k in range(m):
+            p = piv[k]
+            if p != k:
+                x[k], x[p] = x[p], x[k]
+        for k in range(m):
+            x[k + 1:] -= LU[k + 1:, k] * x[k]
+        for k in range(m - 1, -1, -1):
+            x[k] /= LU[k, k]
+            x[:k] -= LU[:k, k] * x[k]
+    else:
+        # B^T = U^T L^T P^T  ->  U^T and L^T solves, then undo the swaps
+        for k in range(m):
+            x[k] /= LU[k, k]
+            x[k + 1:] -= LU[k, k + 1:] * x[k]
+        for k in range(m - 1, -1, -1):
+            x[:k] -= LU[k, :k] * x[k]
+        for k in range(m - 1, -1, -1):
+            p = piv[k]
+            if p != k:
+                x[k], x[p] = x[p], x[k]
+    return x
+
+
+class BasisFactor:
+    """LU factorization of the basis matrix plus a product-form eta file.
+
+    After a refactorization B = L U. Each basis change appends an eta
+    column, so the current inverse is E_k ... E_1 (L U)^-1.
+    """
+
+    def __init__(self, m):
+        _load_scipy()
+        self.m = m
+        self.lu = None    # None means the basis is the identity (all slacks)
+        self.etas = []    # (pivot row, pivot value, nonzero rows, nonzero values)
+        self.updates = 0  # eta columns added since the last refactorization
+
+    def refactor(self, B=None):
+        if B is None:
+            self.lu = None
+        elif hasattr(B, "tocsc"):
+            self.lu = _splu(B.tocsc())
+        elif _lu_factor is not None:
+            self.lu = _lu_factor(B, check_finite=False)
+        else:
+            self.lu = _lu_factor_np(B)
+        self.etas = []
+        self.updates = 0
+
+    def _solve(self, rhs, trans):
+        if self.lu is None:
+            return np.array(rhs, dtype=float)
+        if hasattr(self.lu, "solve"):  # scipy SuperLU object
+            return self.lu.solve(np.asarray(rhs, dtype=float), trans="T" if trans else "N")
+        if _lu_solve is not None:
+            return _lu_solve(self.lu, rhs, trans=trans, check_finite=False)
+        return _lu_solve_np(self.lu, rhs, trans=trans)
+
+    def ftran(self, a):
+        # Solve B x = a
+        x = self._solve(a, 0)
+        for r, dr, idx, vals in self.etas:
+            xr = x[r] / dr
+            if xr != 0.0:
+                x[idx] -= xr * vals
+            x[r] = xr
+        return x
+
+    def btran(self, c):
+        # Solve B^T y = c
+        y = np.array(c, dtype=float)
+        for r, dr, idx, vals in reversed(self.etas):
+            y[r] = (y[r] + dr * y[r] - vals @ y[idx]) / dr
+        return self._solve(y, 1)
+
+    def update(self, row, d):
+        # Eta columns are stored by their nonzeros only
+        idx = np.flatnonzero(d)
+        self.etas.append((row, d[row], idx, d[idx]))
+        self.updates += 1
+
+
+class RevisedSimplexSolver(SimplexSolver):
+    """Revised simplex on the same problem form as SimplexSolver.
+
+    Only the basis factorization and the basic solution are kept; the
+    pricing and ratio test work on one column of A at a time, so the
+    (m+1) x (n+m+1) tableau is never formed. A may be dense, a CSRMatrix
+    or a scipy.sparse matrix; sparse input stays sparse and the slack
+    columns are never materialized.
+    """
+
+    def __init__(self, tol=1e-9, max_iter=10_000, refactor_every=50, anti_cycling="bland", cycle_window=50):
+        if anti_cycling not in ("bland", None):
+            raise ValueError(f"Unknown anti_cycling rule {anti_cycling!r}, expected 'bland' or None.")
+        super().__init__(tol=tol, max_iter=max_iter, anti_cycling=anti_cycling, cycle_window=cycle_window)
+        self.refactor_every = refactor_every
+
+    def _column(self, A, j):
+        m, n = A.shape
+        if j < n:
+            return A.col(j) if isinstance(A, CSRMatrix) else A[:, j]
+        e = np.zeros(m)
+        e[j - n] = 1.0
+        return e
+
+    def _price(self, A, y):
+        # A^T y, the only full pass over A per iteration
+        return A.rmatvec(y) if isinstance(A, CSRMatrix) else A.T @ y
+
+    def _basis_matrix(self, A, basis):
+        m, n = A.shape
+        B = np.zeros((m, m))
+        structural = basis < n
+        B[:, structural] = A[:, basis[structural]]
+        slack = np.where(~structural)[0]
+        B[basis[slack] - n, slack] = 1.0
+        return B
+
+    def _sparse_basis_matrix(self, A, basis):
+        m, n = A.shape
+        structural = np.where(basis < n)[0]
+        slack = np.where(basis >= n)[0]
+        rows, pos, vals = A.select_columns(basis[structural])
+        rows = np.concatenate([rows, basis[slack] - n])
+        cols = np.concatenate([structural[pos], slack])
+        vals = np.concatenate([vals, np.ones(slack.shape[0])])
+        return _csc_matrix((vals, (rows, cols)), shape=(m, m))
+
+    def _reinvert(self, A, basis, factor):
+        # Product-form reinversion: rebuild the eta file from the identity by
+        # pivoting the basic columns in one at a time. Used for sparse input
+        # when no sparse LU is available; the basis order may change.
+        m, n = A.shape
+        factor.refactor(None)
+        new_basis = np.arange(n, n + m)
+        free = basis != new_basis
+        for j in basis[free]:
+            d = factor.ftran(self._column(A, j))
+            rows = np.where(free)[0]
+            r = rows[np.argmax(np.abs(d[rows]))]
+            if abs(d[r]) <= self.tol:
+                raise np.linalg.LinAlgError("Singular basis matrix.")
+            factor.update(r, d)
+            new_basis[r] = j
+            free[r] = False
+        factor.updates = 0
+        return new_basis
+
+    def _refactor(self, A, basis, factor):
+        if not isinstance(A, CSRMatrix):
+            factor.refactor(self._basis_matrix(A, basis))
+        elif _splu is not None:
+            factor.refactor(self._sparse_basis_matrix(A, basis))
+        else:
+            basis[:] = self._reinvert(A, basis, factor)
+
+    def _ratio_test(self, x_B, alpha, basis=None):
+        # With basis (Bland's rule), ties go to the lowest basic index
+        mask = alpha > self.tol
+        if not np.any(mask):
+            return None  # Unbounded
+        rows = np.where(mask)[0]
+        ratios = x_B[rows] / alpha[rows]
+        if basis is None:
+            return rows[np.argmin(ratios)]
+        ties = rows[ratios <= ratios.min() + self.tol]
+        return ties[np.argmin(basis[ties])]
+
+    def _optimize_basis(self, A, b, cost, basis, factor, x_B, stats):
+        m, n = A.shape
+        # More than cycle_window degenerate pivots in a row switch to
+        # Bland's rule until the objective moves again
+        degenerate_run = 0
+        fallback = False
+        iters = 0
+        while iters < self.max_iter:
+            iters += 1
+            # Pricing: duals from the basis, then reduced costs of [A I]
+            start = time.perf_counter()
+            y = factor.btran(cost[basis])
+            reduced = np.empty(n + m)
+            reduced[:n] = self._price(A, y) - cost[:n]
+            reduced[n:] = y
+            if fallback:
+                candidates = np.flatnonzero(reduced < -self.tol)
+                col = candidates[0] if candidates.size else None
+            else:
+                col = self._choose_entering(reduced)
+            stats.pricing_time += time.perf_counter() - start
+            if col is None:
+                return "optimal", x_B
+
+            alpha = factor.ftran(self._column(A, col))
+            row = self._ratio_test(x_B, alpha, basis if fallback else None)
+            if row is None:
+                return "unbounded", x_B
+
+            theta = x_B[row] / alpha[row]
+            if theta <= self.tol:
+                stats.degenerate_pivots += 1
+                degenerate_run += 1
+                if self.anti_cycling and not fallback and degenerate_run > self.cycle_window:
+                    fallback = True
+                    stats.fallback_switches += 1
+            else:
+                degenerate_run = 0
+                fallback = False
+            x_B -= theta * alpha
+            x_B[row] = theta
+            basis[row] = col
+            factor.update(row, alpha)
+            stats.iterations += 1
+
+            # A product-form reinversion costs about as much as the etas it
+            # rebuilds, so it is never redone before that many new updates
+            if factor.updates >= max(self.refactor_every, len(factor.etas) - factor.updates):
+                self._refactor(A, basis, factor)
+                x_B = factor.ftran(b)
+
+        return "iteration_limit", x_B
+
+    def solve(self, c, A, b, maximize=True):
+
+        c = np.array(c, dtype=float).flatten()
+        A = as_csr(A) if is_sparse(A) else np.array(A, dtype=float)
+        b = np.array(b, dtype=float).flatten()
+
+        error = self._check_problem(c, A, b)
+        if error is None and np.any(b < 0):
+            # The revised engine starts from the slack basis with a primal phase only
+            error = "All b values must be non-negative for <= constraints."
+        if error:
+            return SimplexResult("error", message=error)
+
+        m, n = A.shape
+        cost = np.zeros(n + m)
+        cost[:n] = c if maximize else -c
+
+        # Start from the all-slack basis, whose factorization is the identity
+        basis = np.arange(n, n + m)
+        factor = BasisFactor(m)
+        x_B = b.copy()
+
+        stats = SolveStats()
+        try:
+            status, x_B = self._optimize_basis(A, b, cost, basis, factor, x_B, stats)
+        except np.linalg.LinAlgError as e:
+            return SimplexResult("error", message=f"Basis factorization failed: {e}", iterations=stats.iterations, stats=stats.finish())
+
+        if status == "unbounded":
+            return SimplexResult("unbounded", message="Objective is unbounded.", iterations=stats.iterations, stats=stats.finish())
+        if status != "optimal":
+            return SimplexResult("error", message=f"Simplex did not converge: {status}", iterations=stats.iterations, stats=stats.finish())
+
+        x = np.zeros(n)
+        structural = basis < n
+        x[basis[structural]] = x_B[structural]
+
+        z = cost[basis] @ x_B
+        if not maximize:
+            z = -z
+
+        return SimplexResult("optimal", x=x, z=z, iterations=stats.iterations, stats=stats.finish())
@@ -1,130 +1,1233 @@
-import numpy as np
-
-class SimplexResult:
-    def __init__(self, status, x=None, z=None, message=""):
-        self.status = status          # "optimal", "unbounded", "infeasible", "error"
-        self.x = x                    # primal solution (original variable space)
-        self.z = z                    # objective value 
-        self.message = message
-
-    def __repr__(self):
-        return f"SimplexResult(status={self.status!r}, x={self.x}, z={self.z}, message={self.message!r})"
-
-class SimplexSolver:
-
-    def __init__(self, tol=1e-9, max_iter=10_000):
-        self.tol = tol
-        self.max_iter = max_iter
-
-    def _pivot(self, T, row, col):
-        pivot = T[row, col] #pivot element
-        T[row, :] /= pivot  #Normalize the pivot row
-        m, n = T.shape
-        for r in range(m): #Gaussian elemination to update the table
-            if r != row:
-                T[r, :] -= T[r, col] * T[row, :]
-
-    def _choose_entering(self, row):
-
-        candidates = np.where(row < -self.tol)[0]
-        if candidates.size == 0:
-            return None
-        return candidates[np.argmin(row[candidates])]
-
-    def _choose_leaving(self, T, col):
-        rhs = T[:-1, -1]
-        col_vals = T[:-1, col]
-        mask = col_vals > self.tol
-
-        if not np.any(mask):
-            return None  # Unbounded
-        ratios = rhs[mask] / col_vals[mask]
-        idx = np.argmin(ratios)
-
-        leaving_rows = np.where(mask)[0]
-        return leaving_rows[idx]
-
-    def _build_tableau(self, A, b, c):
-
-        m, n = A.shape     
-        # Add slack variables
-        slack_matrix = np.eye(m)
-        full_A = np.hstack([A, slack_matrix])     
-        # Initial basis consists of slack variables
-        basis = list(range(n, n + m))     
-        # Objective row (maximization)
-        c_full = np.zeros(n + m)
-        c_full[:n] = -c  
-        c_full[n:] = 0       
-        # Build tableau
-        T = np.zeros((m + 1, n + m + 1))
-        T[:-1, :n + m] = full_A
-        T[:-1, -1] = b
-        T[-1, :n + m] = c_full
-        
-        return T, basis
-
-    def _optimize_tableau(self, T, basis):
-
-        iters = 0
-        while iters < self.max_iter:
-            iters += 1
-            obj_row = T[-1, :-1]
-            col = self._choose_entering(obj_row)
-            if col is None:
-                return "optimal", basis  
-
-            row = self._choose_leaving(T, col)
-            if row is None:
-                return "unbounded", basis
-
-            self._pivot(T, row, col)
-            basis[row] = col
-
-        return "iteration_limit", basis
-
-    def solve(self, c, A, b, maximize=True):
-
-        c = np.array(c, dtype=float).flatten()
-        A = np.array(A, dtype=float)
-        b = np.array(b, dtype=float).flatten()
-
-        if A.shape[0] != b.shape[0]:
-            return SimplexResult("error", message="Number of constraints in A and b don't match.")
-        if A.shape[1] != c.shape[0]:
-            return SimplexResult("error", message="Objective length must equal number of variables.")
-
-        # Convert minimization to maximization
-        c_eff = c.copy()
-        if not maximize:
-            c_eff = -c_eff
-
-        # Ensure b >= 0 
-        for i in range(len(b)):
-            if b[i] < 0:
-                return SimplexResult("error", message="All b values must be non-negative for <= constraints.")
-
-        # Build and solve tableau
-        T, basis = self._build_tableau(A, b, c_eff)
-        status, basis = self._optimize_tableau(T, basis)
-
-        if status == "unbounded":
-            return SimplexResult("unbounded", message="Objective is unbounded.")
-        if status != "optimal":
-            return SimplexResult("error", message=f"Simplex did not converge: {status}")
-
-        # Extract solution
-        m, n = A.shape[0], A.shape[1]
-        x = np.zeros(n)
-        
-        # Find values of basic variables
-        for i in range(m):
-            bj = basis[i]
-            if bj < n:  
-                x[bj] = T[i, -1]
-
-        z = T[-1, -1]
-        if not maximize:
-            z = -z
-
-        return SimplexResult("optimal", x=x, z=z)
\ No newline at end of file
+import time
+
+import numpy as np
+
+from pricing import make_pricing
+from sparse import is_sparse
+
+class SimplexResult:
+    def __init__(self, status, x=None, z=None, message="", iterations=0, state=None, stats=None):
+        self.status = status          # "optimal", "unbounded", "infeasible", "stopped" (by the callback), "error"
+        self.x = x                    # primal solution (original variable space)
+        self.z = z                    # objective value 
+        self.message = message
+        self.iterations = iterations  # simplex pivots performed
+        self.state = state            # SolverState for warm starts; None on input errors, after presolve
+                                      # and from the revised engine (sparse A)
+        self.stats = stats            # SolveStats: pricing rule, timings
+        self.presolve = None          # PresolveStats when the solver ran presolve
+        self.basis = None             # final basis of a SolveCache hit, for solve(basis=...); solves keep it in state
+        self._sensitivity = None
+
+    @property
+    def sensitivity(self):
+        """Sensitivity report of an optimal result with a state, computed on first use; else None."""
+        if self._sensitivity is None and self.status == "optimal" and self.state is not None:
+            self._sensitivity = Sensitivity(self.state)
+        return self._sensitivity
+
+    def __repr__(self):
+        return f"SimplexResult(status={self.status!r}, x={self.x}, z={self.z}, message={self.message!r})"
+
+class SolveStats:
+    def __init__(self, pricing="dantzig"):
+        self.iterations = 0
+        self.pricing = pricing        # name of the pricing rule
+        self.pricing_time = 0.0       # seconds spent choosing entering columns
+        self.ratio_test_time = 0.0    # seconds spent choosing leaving rows (dual simplex: the entering column)
+        self.pivot_time = 0.0         # seconds spent updating the tableau
+        self.solve_time = 0.0         # seconds from the start of the solve to the result
+        self.degenerate_pivots = 0    # pivots with a zero step length
+        self.fallback_switches = 0    # times cycling was detected and the anti-cycling rule took over
+        self.bound_flips = 0          # entering variables moved to their opposite bound without a pivot
+        self.basis_size = 0           # structural (non-slack) variables in the final basis
+        self.objective_history = None # [(iteration, objective)] with SimplexSolver(trace=True)
+        self._start = time.perf_counter()
+
+    def finish(self):
+        self.solve_time = time.perf_counter() - self._start
+        return self
+
+    def as_dict(self):
+        return {k: v for k, v in vars(self).items() if not k.startswith("_")}
+
+    def __repr__(self):
+        return f"SolveStats(iterations={self.iterations}, pricing={self.pricing!r}, solve_time={self.solve_time:.6f})"
+
+class SolverState:
+    """Final tableau and basis of a solve, reusable by the resolve methods.
+
+    T has the _build_tableau layout: n structural columns, m slack columns
+    and the RHS, with the objective row last. The slack block of T is
+    always B^-1 of the current basis.
+    """
+
+    def __init__(self, T, basis, c, A, b, maximize, bounds=None):
+        self.T = T
+        self.basis = basis
+        self.c = c
+        self.A = A
+        self.b = b
+        self.maximize = maximize
+        self.bounds = bounds  # VariableBounds of a bounded solve, else None
+
+    @property
+    def shape(self):
+        return self.A.shape
+
+    def cost(self):
+        # Objective over structural and slack columns in maximization form
+        m, n = self.A.shape
+        cost = np.zeros(n + m)
+        cost[:n] = self.c if self.maximize else -self.c
+        return cost
+
+    def copy(self):
+        bounds = self.bounds.copy() if self.bounds is not None else None
+        return SolverState(self.T.copy(), list(self.basis), self.c.copy(), self.A.copy(), self.b.copy(), self.maximize,
+                           bounds)
+
+class VariableBounds:
+    """Bounds lower <= x <= upper of the structural variables of a tableau.
+
+    The tableau works on the shifted variables x' = x - lower with
+    0 <= x' <= width; slacks have infinite width. While flipped[j] is set,
+    column j of T is complemented (x'_j = width_j - x''_j), which is how a
+    nonbasic variable sits at its upper bound without an extra row.
+    """
+
+    def __init__(self, lower, upper, m):
+        self.lower = lower
+        self.upper = upper
+        self.width = np.concatenate([upper - lower, np.full(m, np.inf)])
+        self.flipped = np.zeros(self.width.shape[0], dtype=bool)
+
+    def copy(self):
+        bounds = VariableBounds(self.lower.copy(), self.upper.copy(), 0)
+        bounds.width = self.width.copy()
+        bounds.flipped = self.flipped.copy()
+        return bounds
+
+    def flip(self, T, j):
+        # Move nonbasic j to its other bound: complement the column and
+        # carry the change of its value into the RHS and the objective
+        T[:, -1] -= T[:, j] * self.width[j]
+        T[:, j] *= -1.0
+        self.flipped[j] = not self.flipped[j]
+
+    def uncomplement(self, T, basis, j):
+        # Undo the complement of column j. A basic j also has its row
+        # negated, which keeps the slack block equal to B^-1; the caller
+        # rebuilds the RHS and objective row.
+        T[:, j] *= -1.0
+        if j in basis:
+            T[basis.index(j)] *= -1.0
+        self.flipped[j] = False
+
+    def rhs(self, A, b):
+        # Right-hand side of the shifted, complemented system
+        n = A.shape[1]
+        flipped = self.flipped[:n]
+        return b - A @ self.lower - A[:, flipped] @ self.width[:n][flipped]
+
+    def cost(self, cost):
+        # Cost of the complemented columns and the constant they contribute
+        flipped = self.flipped
+        return np.where(flipped, -cost, cost), cost[flipped] @ self.width[flipped]
+
+    def solution(self, T, basis, n):
+        values = np.where(self.flipped, self.width, 0.0)
+        basis = np.asarray(basis, dtype=int)
+        rhs = T[:-1, -1]
+        values[basis] = np.where(self.flipped[basis], self.width[basis] - rhs, rhs)
+        return self.lower + values[:n]
+
+class BatchResult:
+    """Results of solve_batch, one row per scenario.
+
+    Statuses are stored as small integer codes into STATUSES; indexing a
+    BatchResult gives back an ordinary SimplexResult.
+    """
+
+    STATUSES = ("optimal", "unbounded", "infeasible", "error")
+
+    def __init__(self, status, x, z, iterations, messages):
+        self.status = status          # int8 codes into STATUSES
+        self.x = x                    # (k, n) primal solutions, NaN rows when not optimal
+        self.z = z                    # (k,) objective values, NaN when not optimal
+        self.iterations = iterations  # (k,) pivots per scenario
+        self.messages = messages      # {scenario index: message} for non-optimal scenarios
+
+    def __len__(self):
+        return self.z.shape[0]
+
+    def __getitem__(self, i):
+        status = self.STATUSES[self.status[i]]
+        if status != "optimal":
+            return SimplexResult(status, message=self.messages.get(i, ""), iterations=int(self.iterations[i]))
+        return SimplexResult(status, x=self.x[i].copy(), z=float(self.z[i]), iterations=int(self.iterations[i]))
+
+    def status_names(self):
+        return [self.STATUSES[code] for code in self.status]
+
+    def __repr__(self):
+        solved = int(np.count_nonzero(self.status == 0))
+        return f"BatchResult(scenarios={len(self)}, optimal={solved})"
+
+def _primal_solution(T, basis, bounds, n):
+    # Structural x of the current basis
+    if bounds is not None:
+        return bounds.solution(T, basis, n)
+    x = np.zeros(n)
+    B = np.asarray(basis)
+    structural = B < n
+    x[B[structural]] = T[:-1, -1][structural]
+    return x
+
+class Sensitivity:
+    """Sensitivity analysis read off an optimal tableau (SimplexResult.sensitivity).
+
+    All values are in the problem's own sense (maximization or
+    minimization):
+
+    shadow_prices[i]  change of the optimal value per unit increase of b_i
+    reduced_costs[j]  c_j - y A_j, zero for basic variables
+    rhs_ranges        (m, 2) interval of each b_i, the others fixed, over
+                      which the basis stays optimal (the value is then
+                      linear in b_i with slope shadow_prices[i])
+    cost_ranges       (n, 2) interval of each c_j over which the solution
+                      x stays optimal
+    """
+
+    def __init__(self, state, tol=1e-9):
+        T, basis, bounds = state.T, np.asarray(state.basis), state.bounds
+        m, n = state.shape
+        sign = 1.0 if state.maximize else -1.0
+        obj = T[-1, :-1]
+        # Complemented columns (variables at their upper bound) flip the sign
+        # of their tableau entries
+        flip = np.where(bounds.flipped, -1.0, 1.0) if bounds is not None else np.ones(n + m)
+        basic = np.zeros(n + m, dtype=bool)
+        basic[basis] = True
+
+        self.basis = basis.copy()
+        self.shadow_prices = sign * obj[n:n + m]
+        self.reduced_costs = np.where(basic[:n], 0.0, -sign * flip[:n] * obj[:n])
+
+        # RHS ranging: b_i + delta moves the basic values by delta * B^-1 e_i,
+        # which must stay within [0, width] in every row
+        rhs = T[:-1, -1]
+        width = bounds.width[basis] if bounds is not None else np.full(m, np.inf)
+        B_inv = T[:-1, n:n + m]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            up_rows = B_inv > tol
+            down_rows = B_inv < -tol
+            low = np.where(up_rows, -rhs[:, None] / B_inv, np.where(down_rows, (width - rhs)[:, None] / B_inv, -np.inf))
+            high = np.where(up_rows, (width - rhs)[:, None] / B_inv, np.where(down_rows, -rhs[:, None] / B_inv, np.inf))
+        self.rhs_ranges = np.column_stack([state.b + low.max(axis=0), state.b + high.min(axis=0)])
+
+        # Cost ranging on the complemented maximization costs (change eps):
+        # a nonbasic column stays optimal while its reduced cost stays >= 0,
+        # a basic one while every nonbasic reduced cost in its row does
+        eps_low = np.full(n, -np.inf)
+        eps_high = np.where(basic[:n], np.inf, obj[:n])
+        nonbasic = ~basic
+        rows = np.flatnonzero(basis < n)
+        if rows.size:
+            R = T[rows][:, :-1][:, nonbasic]
+            d = obj[nonbasic]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                low = np.where(R > tol, -d / R, -np.inf).max(axis=1)
+                high = np.where(R < -tol, d / -R, np.inf).min(axis=1)
+            eps_low[basis[rows]] = low
+            eps_high[basis[rows]] = high
+        # eps = sign * flip * (change of c_j)
+        scale = sign * flip[:n]
+        bounds_eps = np.column_stack([eps_low, eps_high]) / scale[:, None]
+        self.cost_ranges = state.c[:, None] + np.sort(bounds_eps, axis=1)
+
+    def __repr__(self):
+        return f"Sensitivity(rows={self.shadow_prices.shape[0]}, cols={self.reduced_costs.shape[0]})"
+
+class ParametricResult:
+    """Optimal value along b + t d or c + t d (SimplexSolver.parametric_rhs / parametric_cost).
+
+    The optimal value is piecewise linear in t. t holds the breakpoints,
+    from 0 to the end of the range or to where the problem stops having
+    an optimum (status "infeasible" or "unbounded" beyond it); z[k] and
+    x[k] are the optimal value and an optimal solution at t[k], and
+    bases[k] is the optimal basis between t[k] and t[k + 1].
+    """
+
+    def __init__(self, status, t, z, x, bases, iterations=0, message=""):
+        self.status = status          # "optimal" over the whole range, "infeasible", "unbounded" or "error"
+        self.t = np.asarray(t, dtype=float)
+        self.z = np.asarray(z, dtype=float)
+        self.x = x                    # (k, n) array of solutions
+        self.bases = bases
+        self.iterations = iterations  # pivots and bound flips along the sweep
+        self.message = message
+
+    @property
+    def slopes(self):
+        # Slope of z on each segment
+        return np.diff(self.z) / np.diff(self.t)
+
+    def value(self, t):
+        """Optimal value at t (NaN outside the covered range)."""
+        order = np.argsort(self.t)
+        ts, zs = self.t[order], self.z[order]
+        t = np.asarray(t, dtype=float)
+        if ts.size == 0:
+            return np.full(t.shape, np.nan)
+        z = np.interp(t, ts, zs)
+        return np.where((t < ts[0] - 1e-12) | (t > ts[-1] + 1e-12), np.nan, z)
+
+    def __repr__(self):
+        return (f"ParametricResult(status={self.status!r}, breakpoints={self.t.shape[0]}, "
+                f"t=[{self.t[0] if self.t.size else 0:g}, {self.t[-1] if self.t.size else 0:g}])")
+
+class SimplexSolver:
+
+    METHODS = ("primal", "dual")
+    ANTI_CYCLING = ("bland", "perturb", None)
+
+    def __init__(self, tol=1e-9, max_iter=10_000, pivot_block_size=1 << 18, method="primal", pricing="dantzig",
+                 anti_cycling="bland", cycle_window=50, perturbation=1e-7, presolve=False, trace=False,
+                 callback=None, callback_every=1):
+        self.tol = tol
+        self.max_iter = max_iter
+        self.method = method  # "primal" or "dual" simplex for cold solves
+        self.pricing = make_pricing(pricing)  # PricingRule for the primal simplex
+        if anti_cycling not in self.ANTI_CYCLING:
+            raise ValueError(f"Unknown anti_cycling rule {anti_cycling!r}, expected one of {self.ANTI_CYCLING}.")
+        self.anti_cycling = anti_cycling  # fallback once cycling is detected, None to disable
+        self.cycle_window = cycle_window  # consecutive degenerate pivots treated as stalling
+        self.perturbation = perturbation  # relative size of the RHS perturbation
+        self.presolve = presolve  # run presolve.Presolver before dense solves
+        self.pivot_block_size = pivot_block_size  # elements per block of the pivot update
+        # Instrumentation: trace records the objective after every iteration
+        # in stats.objective_history; callback(stats, objective) is called
+        # every callback_every iterations and stops the solve (status
+        # "stopped") by returning True. The objective is the tableau's, i.e.
+        # in maximization form. Both off costs one test per iteration.
+        self.trace = trace
+        self.callback = callback
+        self.callback_every = max(1, int(callback_every))
+        self._pivot_buffer = None
+
+    def _pivot(self, T, row, col):
+        pivot_row = T[row]
+        pivot_row /= T[row, col]  #Normalize the pivot row
+        factors = T[:, col].copy()
+        factors[row] = 0.0  #the pivot row itself is left untouched
+
+        # Gaussian elimination as a rank-1 update T -= factors * pivot_row,
+        # done in row blocks through a reusable buffer so no m x n
+        # temporary is allocated per pivot
+        m, n = T.shape
+        block = max(1, min(m, self.pivot_block_size // n))
+        buf = self._pivot_buffer
+        if buf is None or buf.shape[1] != n or buf.shape[0] < block or buf.dtype != T.dtype:
+            buf = self._pivot_buffer = np.empty((block, n), dtype=T.dtype)
+        for start in range(0, m, block):
+            stop = min(start + block, m)
+            out = buf[:stop - start]
+            np.multiply(factors[start:stop, None], pivot_row, out=out)
+            np.subtract(T[start:stop], out, out=T[start:stop])
+
+    def _choose_entering(self, row):
+
+        candidates = np.where(row < -self.tol)[0]
+        if candidates.size == 0:
+            return None
+        return candidates[np.argmin(row[candidates])]
+
+    def _choose_leaving(self, T, col):
+        rhs = T[:-1, -1]
+        col_vals = T[:-1, col]
+        mask = col_vals > self.tol
+
+        if not np.any(mask):
+            return None  # Unbounded
+        ratios = rhs[mask] / col_vals[mask]
+        idx = np.argmin(ratios)
+
+        leaving_rows = np.where(mask)[0]
+        return leaving_rows[idx]
+
+    def _bounded_ratio_test(self, T, basis, col, bounds):
+        # Ratio test with upper bounds: a basic variable may leave at zero
+        # (alpha > 0) or at its upper bound (alpha < 0). Returns the row and
+        # whether it leaves at its upper bound; row None means the entering
+        # variable reaches its own bound first (or nothing limits it).
+        rhs = T[:-1, -1]
+        alpha = T[:-1, col]
+        width = bounds.width[basis]
+        step, row, to_upper = bounds.width[col], None, False
+
+        rows = np.where(alpha > self.tol)[0]
+        if rows.size:
+            ratios = np.maximum(rhs[rows], 0.0) / alpha[rows]
+            k = np.argmin(ratios)
+            if ratios[k] < step:
+                step, row = ratios[k], rows[k]
+
+        rows = np.where((alpha < -self.tol) & np.isfinite(width))[0]
+        if rows.size:
+            ratios = np.maximum(width[rows] - rhs[rows], 0.0) / -alpha[rows]
+            k = np.argmin(ratios)
+            if ratios[k] < step:
+                row, to_upper = rows[k], True
+        return row, to_upper
+
+    def _choose_bland(self, T, basis):
+        # Bland's rule: lowest-index improving column, and among the rows
+        # tied in the ratio test the one whose basic variable has the lowest index
+        candidates = np.where(T[-1, :-1] < -self.tol)[0]
+        if candidates.size == 0:
+            return None, None
+        col = candidates[0]
+        col_vals = T[:-1, col]
+        rows = np.where(col_vals > self.tol)[0]
+        if rows.size == 0:
+            return col, None
+        ratios = T[rows, -1] / col_vals[rows]
+        ties = rows[ratios <= ratios.min() + self.tol]
+        return col, ties[np.argmin(np.asarray(basis)[ties])]
+
+    def _perturb_rhs(self, T):
+        # Small positive RHS perturbation; returns it so it can be tracked and removed
+        m = T.shape[0] - 1
+        rng = np.random.default_rng(m)
+        delta = np.zeros(m + 1)
+        delta[:-1] = self.perturbation * (1.0 + np.abs(T[:-1, -1])) * rng.uniform(0.5, 1.0, m)
+        T[:, -1] += delta
+        return delta
+
+    def _check_problem(self, c, A, b):
+        if A.shape[0] != b.shape[0]:
+            return "Number of constraints in A and b don't match."
+        if A.shape[1] != c.shape[0]:
+            return "Objective length must equal number of variables."
+        return None
+
+    def _build_tableau(self, A, b, c):
+
+        m, n = A.shape
+        # Initial basis consists of slack variables
+        basis = list(range(n, n + m))
+        # Build tableau; A is copied straight in (it may be a read-only
+        # shared view), the slack block is the identity
+        T = np.zeros((m + 1, n + m + 1))
+        T[:-1, :n] = A
+        T[np.arange(m), n + np.arange(m)] = 1.0
+        T[:-1, -1] = b
+        # Objective row (maximization)
+        T[-1, :n] = -c
+
+        return T, basis
+
+    def _new_stats(self):
+        stats = SolveStats(self.pricing.name)
+        if self.trace:
+            stats.objective_history = []
+        return stats
+
+    def _monitor(self, T, stats):
+        # Trace and callback after an iteration; True asks to stop
+        objective = float(T[-1, -1])
+        if self.trace:
+            stats.objective_history.append((stats.iterations, objective))
+        if self.callback is not None and stats.iterations % self.callback_every == 0:
+            return bool(self.callback(stats, objective))
+        return False
+
+    def _optimize_tableau(self, T, basis, stats=None, bounds=None):
+
+        if stats is None:
+            stats = self._new_stats()
+        pricing = self.pricing
+        start = time.perf_counter()
+        pricing.reset(T, basis)
+        stats.pricing_time += time.perf_counter() - start
+
+        # Cycling detection: a run of degenerate pivots that revisits a basis
+        # or exceeds cycle_window switches to the anti-cycling rule
+        degenerate_run = 0
+        seen = set()
+        fallback = False
+        delta = None  # RHS perturbation in the current basis, while active
+        monitored = self.trace or self.callback is not None
+
+        iters = 0
+        while iters < self.max_iter:
+            iters += 1
+            start = time.perf_counter()
+            if fallback and self.anti_cycling == "bland":
+                col, row = self._choose_bland(T, basis)
+            else:
+                col = pricing.choose(T, basis, self.tol)
+                row = None
+            stats.pricing_time += time.perf_counter() - start
+
+            if col is None:
+                if delta is None:
+                    return "optimal", basis
+                # Remove the perturbation; the basis stays dual feasible, so
+                # any RHS entry it leaves negative is repaired by the dual simplex
+                T[:, -1] -= delta
+                delta = None
+                fallback = False
+                status, basis = self._dual_optimize_tableau(T, basis, stats, bounds)
+                if status != "optimal":
+                    return status, basis
+                pricing.reset(T, basis)
+                continue
+
+            to_upper = False
+            start = time.perf_counter()
+            if bounds is not None:
+                row, to_upper = self._bounded_ratio_test(T, basis, col, bounds)
+                stats.ratio_test_time += time.perf_counter() - start
+                if row is None and np.isfinite(bounds.width[col]):
+                    # The entering variable reaches its other bound first
+                    bounds.flip(T, col)
+                    stats.bound_flips += 1
+                    stats.iterations += 1
+                    if monitored and self._monitor(T, stats):
+                        return self._stop(T, delta), basis
+                    continue
+            elif row is None:
+                row = self._choose_leaving(T, col)
+                stats.ratio_test_time += time.perf_counter() - start
+            if row is None:
+                if delta is not None:
+                    T[:, -1] -= delta
+                return "unbounded", basis
+
+            step = bounds.width[basis[row]] - T[row, -1] if to_upper else T[row, -1]
+            if step <= self.tol:
+                stats.degenerate_pivots += 1
+                degenerate_run += 1
+                if self.anti_cycling and not fallback:
+                    key = hash(tuple(sorted(basis)))
+                    if key in seen or degenerate_run > self.cycle_window:
+                        fallback = True
+                        stats.fallback_switches += 1
+                        if self.anti_cycling == "perturb":
+                            delta = self._perturb_rhs(T)
+                            continue
+                    seen.add(key)
+            else:
+                degenerate_run = 0
+                seen.clear()
+                if fallback and self.anti_cycling == "bland":
+                    fallback = False
+
+            if delta is not None:
+                # Carry the perturbation through the pivot with the RHS
+                factors = T[:, col].copy()
+                d_row = delta[row] / factors[row]
+                delta -= factors * d_row
+                delta[row] = d_row
+
+            start = time.perf_counter()
+            pricing.update(T, basis, row, col)
+            stats.pricing_time += time.perf_counter() - start
+            start = time.perf_counter()
+            leaving = basis[row]
+            self._pivot(T, row, col)
+            basis[row] = col
+            if to_upper:
+                bounds.flip(T, leaving)
+            stats.pivot_time += time.perf_counter() - start
+            stats.iterations += 1
+            if monitored and self._monitor(T, stats):
+                return self._stop(T, delta), basis
+
+        if delta is not None:
+            T[:, -1] -= delta
+        return "iteration_limit", basis
+
+    def _stop(self, T, delta):
+        # Early termination requested by the callback
+        if delta is not None:
+            T[:, -1] -= delta
+        return "stopped"
+
+    def _dual_optimize_tableau(self, T, basis, stats=None, bounds=None):
+        # Dual simplex: the objective row stays >= 0 while negative RHS
+        # entries are pivoted out with the dual ratio test. With bounds, a
+        # basic variable above its upper bound leaves at that bound.
+
+        if stats is None:
+            stats = self._new_stats()
+        if T.shape[0] == 1:
+            return "optimal", basis  # no rows, nothing can be infeasible
+        monitored = self.trace or self.callback is not None
+        iters = 0
+        while iters < self.max_iter:
+            iters += 1
+            start = time.perf_counter()
+            rhs = T[:-1, -1]
+            to_upper = False
+            if bounds is None:
+                row = int(np.argmin(rhs))
+                infeasibility = -rhs[row]
+            else:
+                over = rhs - bounds.width[basis]
+                row = int(np.argmax(np.maximum(-rhs, over)))
+                to_upper = over[row] > -rhs[row]
+                infeasibility = over[row] if to_upper else -rhs[row]
+            if infeasibility <= self.tol:
+                stats.ratio_test_time += time.perf_counter() - start
+                return "optimal", basis
+
+            row_vals = T[row, :-1] if to_upper else -T[row, :-1]
+            candidates = np.where(row_vals > self.tol)[0]
+            candidates = candidates[candidates != basis[row]]
+            if candidates.size == 0:
+                stats.ratio_test_time += time.perf_counter() - start
+                return "infeasible", basis
+            ratios = T[-1, candidates] / row_vals[candidates]
+            col = candidates[np.argmin(ratios)]
+            if ratios.min() <= self.tol:
+                stats.degenerate_pivots += 1
+            stats.ratio_test_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            leaving = basis[row]
+            self._pivot(T, row, col)
+            basis[row] = col
+            if to_upper:
+                bounds.flip(T, leaving)
+            stats.pivot_time += time.perf_counter() - start
+            stats.iterations += 1
+            if monitored and self._monitor(T, stats):
+                return "stopped", basis
+
+        return "iteration_limit", basis
+
+    def _set_objective(self, T, basis, cost, bounds=None):
+        # Objective row of the current basis: c_B B^-1 [A I] - c
+        constant = 0.0
+        if bounds is not None:
+            cost, constant = bounds.cost(cost)
+        cost_B = cost[basis]
+        T[-1, :-1] = cost_B @ T[:-1, :-1] - cost
+        T[-1, -1] = cost_B @ T[:-1, -1] + constant
+
+    def _dual_solve(self, T, basis, cost, stats, bounds=None):
+        # Dual simplex from the current basis. Negative reduced costs are
+        # first shifted to random positive values (cost shifting) so the
+        # start is dual feasible; the shift is removed once the basis is
+        # primal feasible and the primal simplex finishes from there.
+        obj_row = T[-1, :-1]
+        shifted = obj_row < -self.tol
+        if np.any(shifted):
+            obj_row[shifted] = np.random.default_rng(0).uniform(1.0, 2.0, np.count_nonzero(shifted))
+        status, basis = self._dual_optimize_tableau(T, basis, stats, bounds)
+        if status != "optimal":
+            return status, basis
+        if np.any(shifted):
+            self._set_objective(T, basis, cost, bounds)
+        return self._optimize_tableau(T, basis, stats, bounds)
+
+    def _reoptimize(self, T, basis, cost, stats, bounds=None):
+        # Pick the engine by which feasibility the current basis still has
+        rhs = T[:-1, -1]
+        feasible = np.all(rhs >= -self.tol)
+        if bounds is not None:
+            feasible = feasible and np.all(rhs <= bounds.width[basis] + self.tol)
+        if feasible:
+            return self._optimize_tableau(T, basis, stats, bounds)
+        return self._dual_solve(T, basis, cost, stats, bounds)
+
+    def _install_basis(self, T, basis, columns, stats):
+        # Pivot the given columns into the basis in order, each into the
+        # not yet claimed row with the largest entry; columns that are
+        # dependent on the ones already installed are skipped
+        claimed = np.zeros(T.shape[0] - 1, dtype=bool)
+        position = {j: i for i, j in enumerate(basis)}
+        for col in columns:
+            row = position.get(col)
+            if row is None:
+                col_vals = np.where(claimed, 0.0, np.abs(T[:-1, col]))
+                row = int(np.argmax(col_vals))
+                if col_vals[row] <= 1e-7:
+                    continue
+                del position[basis[row]]
+                self._pivot(T, row, col)
+                basis[row] = col
+                position[col] = row
+                stats.iterations += 1
+            claimed[row] = True
+            if claimed.all():
+                break
+        return basis
+
+    def _make_result(self, status, state, stats):
+        stats.finish()
+        stats.basis_size = int(np.count_nonzero(np.asarray(state.basis) < state.shape[1]))
+        if status == "unbounded":
+            return SimplexResult("unbounded", message="Objective is unbounded.", iterations=stats.iterations, state=state, stats=stats)
+        if status == "infeasible":
+            return SimplexResult("infeasible", message="Problem is infeasible.", iterations=stats.iterations, state=state, stats=stats)
+        if status == "stopped":
+            # x of the current basis, which is only feasible if the stop
+            # came during the primal simplex
+            result = self._make_result("optimal", state, stats)
+            result.status, result.message = "stopped", f"Stopped by callback after {stats.iterations} iterations."
+            return result
+        if status != "optimal":
+            return SimplexResult("error", message=f"Simplex did not converge: {status}", iterations=stats.iterations, state=state, stats=stats)
+
+        T, basis = state.T, state.basis
+        m, n = state.shape
+        if state.bounds is not None:
+            x = state.bounds.solution(T, basis, n)
+            return SimplexResult("optimal", x=x, z=float(state.c @ x), iterations=stats.iterations, state=state,
+                                 stats=stats)
+        x = np.zeros(n)
+
+        # Find values of basic variables
+        for i in range(m):
+            bj = basis[i]
+            if bj < n:
+                x[bj] = T[i, -1]
+
+        z = T[-1, -1]
+        if not state.maximize:
+            z = -z
+
+        return SimplexResult("optimal", x=x, z=z, iterations=stats.iterations, state=state, stats=stats)
+
+    def _revised_handles(self, method, b, bounds, basis):
+        # Whether the revised engine supports every option of this solve
+        b = np.asarray(b, dtype=float)
+        return (method == "primal" and not self.presolve and bounds is None and basis is None
+                and not np.any(b < 0) and self.pricing.name == "dantzig" and self.anti_cycling != "perturb"
+                and not self.trace and self.callback is None)
+
+    def _parse_bounds(self, bounds, n):
+        # (n, 2) pairs of (lower, upper); None stands for 0 and +inf
+        pairs = np.array([[0.0 if lo is None else lo, np.inf if hi is None else hi] for lo, hi in bounds], dtype=float)
+        if pairs.shape != (n, 2):
+            return None, None, "Bounds must give one (lower, upper) pair per variable."
+        lower, upper = pairs[:, 0], pairs[:, 1]
+        if not np.all(np.isfinite(lower)):
+            return None, None, "Lower bounds must be finite."
+        if np.any(upper < lower):
+            return None, None, "Upper bounds must not be below lower bounds."
+        return lower, upper, None
+
+    def solve(self, c, A, b, maximize=True, method=None, bounds=None, basis=None):
+        """Solve max/min c x subject to A x <= b, x >= 0.
+
+        method is "primal" or "dual" (default: the solver's method). The
+        dual simplex suits problems that are dual feasible from the start,
+        e.g. minimizing nonnegative costs; negative b entries are allowed
+        with either method.
+
+        bounds replaces x >= 0 by lower <= x <= upper, one (lower, upper)
+        pair per variable. Bounds are handled in the ratio test by bound
+        flipping, so they add no rows to the tableau.
+
+        basis warm-starts a dense solve from the columns of an earlier
+        basis (j < n structural, n + i the slack of row i), e.g. the
+        final basis of a solve with the same A: they are pivoted in and
+        the simplex repairs the result. It is ignored with presolve.
+
+        Sparse A (CSRMatrix or scipy.sparse) goes to the revised engine,
+        which keeps A sparse but only runs the primal simplex from the
+        slack basis with Dantzig pricing and Bland's rule against cycling,
+        and keeps no tableau, so its result has no state. Sparse input
+        that needs anything else (the dual method, presolve, bounds, a
+        basis, negative b, another pricing rule, anti_cycling="perturb",
+        trace or callback) is densified and solved on the tableau.
+
+        With presolve the final tableau belongs to the reduced problem, so
+        the result has no state: resolve, the resolve-style methods and
+        result.sensitivity need a solver without presolve.
+        """
+
+        method = method or self.method
+        if method not in self.METHODS:
+            return SimplexResult("error", message=f"Unknown method {method!r}, expected one of {self.METHODS}.")
+
+        if is_sparse(A) and self._revised_handles(method, b, bounds, basis):
+            # The dense tableau would fill in, so sparse input goes through
+            # the revised engine, which keeps A sparse and the slacks implicit
+            from revised import RevisedSimplexSolver
+            return RevisedSimplexSolver(tol=self.tol, max_iter=self.max_iter, anti_cycling=self.anti_cycling,
+                                        cycle_window=self.cycle_window).solve(c, A, b, maximize)
+        if is_sparse(A):
+            A = A.toarray()
+
+        c = np.array(c, dtype=float).flatten()
+        A = np.array(A, dtype=float)
+        b = np.array(b, dtype=float).flatten()
+
+        error = self._check_problem(c, A, b)
+        if error:
+            return SimplexResult("error", message=error)
+        lower = upper = None
+        if bounds is not None:
+            lower, upper, error = self._parse_bounds(bounds, c.shape[0])
+            if error:
+                return SimplexResult("error", message=error)
+        if basis is not None:
+            basis = np.asarray(basis, dtype=int).flatten()
+            if np.any((basis < 0) | (basis >= c.shape[0] + b.shape[0])):
+                return SimplexResult("error", message="Basis column index out of range.")
+
+        if self.presolve:
+            return self._solve_presolved(c, A, b, maximize, method, lower, upper)
+        return self._solve_tableau(c, A, b, maximize, method, lower, upper, basis)
+
+    def _solve_presolved(self, c, A, b, maximize, method, lower=None, upper=None):
+        # Solve the reduced problem, then map x back; the returned state
+        # belongs to the reduced problem, so none is attached
+        from presolve import Presolver
+
+        reduced = Presolver(tol=self.tol).run(c, A, b, maximize, lower, upper)
+        if reduced.status == "infeasible":
+            result = SimplexResult("infeasible", message=reduced.message)
+        else:
+            result = self._solve_tableau(reduced.c, reduced.A, reduced.b, maximize, method,
+                                         np.zeros(reduced.c.shape[0]), reduced.upper)
+            result.state = None
+            if result.status == "optimal":
+                result.x = reduced.postsolve(result.x)
+                result.z = c @ result.x
+        result.presolve = reduced.stats
+        return result
+
+    def _solve_tableau(self, c, A, b, maximize, method, lower=None, upper=None, start=None):
+
+        # Convert minimization to maximization
+        c_eff = c.copy()
+        if not maximize:
+            c_eff = -c_eff
+
+        # Build and solve tableau; with bounds it is built on x - lower
+        bounds = None
+        if lower is not None:
+            bounds = VariableBounds(lower, upper, A.shape[0])
+            T, basis = self._build_tableau(A, bounds.rhs(A, b), c_eff)
+        else:
+            T, basis = self._build_tableau(A, b, c_eff)
+        stats = self._new_stats()
+        cost = np.zeros(T.shape[1] - 1)
+        cost[:c_eff.shape[0]] = c_eff
+        if start is not None:
+            # Warm start: pivot the given columns in, then let whichever
+            # simplex the basis is feasible for finish (as in crossover)
+            basis = self._install_basis(T, basis, start, stats)
+            self._set_objective(T, basis, cost, bounds)
+            status, basis = self._reoptimize(T, basis, cost, stats, bounds)
+        elif method == "dual":
+            status, basis = self._dual_solve(T, basis, cost, stats, bounds)
+        else:
+            status, basis = self._reoptimize(T, basis, cost, stats, bounds)
+
+        state = SolverState(T, basis, c, A, b, maximize, bounds)
+        return self._make_result(status, state, stats)
+
+    def resolve(self, state, b=None, c=None, bounds=None):
+        """Re-optimize a previous solve after changing b, c and/or bounds.
+
+        Starts from the final basis in state (which is left untouched): a
+        new RHS or new bounds keep the basis dual feasible and are repaired
+        with the dual simplex, a new objective keeps it primal feasible and
+        is finished with the primal simplex.
+        """
+
+        state = state.copy()
+        m, n = state.shape
+        T, basis = state.T, state.basis
+        if b is not None:
+            b = np.array(b, dtype=float).flatten()
+            if b.shape[0] != m:
+                return SimplexResult("error", message="Number of constraints in A and b don't match.")
+            state.b = b
+        if c is not None:
+            c = np.array(c, dtype=float).flatten()
+            if c.shape[0] != n:
+                return SimplexResult("error", message="Objective length must equal number of variables.")
+            state.c = c
+        if bounds is not None:
+            lower, upper, error = self._parse_bounds(bounds, n)
+            if error:
+                return SimplexResult("error", message=error)
+            if state.bounds is None:
+                state.bounds = VariableBounds(np.zeros(n), np.full(n, np.inf), m)
+            # Complemented columns need a finite upper bound to stay complemented
+            for j in np.where(state.bounds.flipped[:n] & np.isinf(upper))[0]:
+                state.bounds.uncomplement(T, basis, j)
+            state.bounds.lower, state.bounds.upper = lower, upper
+            state.bounds.width[:n] = upper - lower
+
+        if state.bounds is not None:
+            T[:-1, -1] = T[:-1, n:n + m] @ state.bounds.rhs(state.A, state.b)
+        elif b is not None:
+            T[:-1, -1] = T[:-1, n:n + m] @ b
+        cost = state.cost()
+        self._set_objective(T, basis, cost, state.bounds)
+
+        stats = self._new_stats()
+        status, state.basis = self._reoptimize(T, basis, cost, stats, state.bounds)
+        return self._make_result(status, state, stats)
+
+    def add_constraint(self, state, a, b_i):
+        """Re-optimize after appending the constraint a x <= b_i."""
+
+        if state.bounds is not None:
+            return SimplexResult("error", message="Structural changes are not supported for bounded problems.")
+
+        a = np.array(a, dtype=float).flatten()
+        m, n = state.shape
+        if a.shape[0] != n:
+            return SimplexResult("error", message="Constraint length must equal number of variables.")
+
+        # New row and slack column; the objective row stays last
+        T = np.zeros((m + 2, n + m + 2))
+        T[:m, :n + m] = state.T[:-1, :-1]
+        T[:m, -1] = state.T[:-1, -1]
+        T[-1, :n + m] = state.T[-1, :-1]
+        T[-1, -1] = state.T[-1, -1]
+
+        # Express the new row in terms of the current basis
+        row = np.zeros(n + m + 2)
+        row[:n] = a
+        row[n + m] = 1.0
+        row[-1] = b_i
+        basis = list(state.basis)
+        row -= row[basis] @ T[:m]
+        T[m] = row
+        basis.append(n + m)
+
+        state = SolverState(T, basis, state.c.copy(), np.vstack([state.A, a]), np.append(state.b, b_i), state.maximize)
+        stats = self._new_stats()
+        status, state.basis = self._reoptimize(T, basis, state.cost(), stats)
+        return self._make_result(status, state, stats)
+
+    def remove_constraint(self, state, i):
+        """Re-optimize after deleting constraint i."""
+
+        if state.bounds is not None:
+            return SimplexResult("error", message="Structural changes are not supported for bounded problems.")
+
+        state = state.copy()
+        m, n = state.shape
+        T, basis = state.T, state.basis
+        stats = self._new_stats()
+        slack = n + i
+
+        if slack not in basis:
+            # Bring the slack into the basis first, keeping the RHS feasible when possible
+            col = T[:-1, slack]
+            rows = np.where(col > self.tol)[0]
+            if rows.size:
+                row = rows[np.argmin(T[rows, -1] / col[rows])]
+            else:
+                row = int(np.argmax(np.abs(col)))
+            self._pivot(T, row, slack)
+            basis[row] = slack
+            stats.iterations += 1
+
+        # With the slack basic in row r, no other row depends on constraint i
+        row = basis.index(slack)
+        T = np.delete(np.delete(T, row, axis=0), slack, axis=1)
+        basis = [j - 1 if j > slack else j for k, j in enumerate(basis) if k != row]
+
+        state = SolverState(T, basis, state.c, np.delete(state.A, i, axis=0), np.delete(state.b, i), state.maximize)
+        status, state.basis = self._reoptimize(T, basis, state.cost(), stats)
+        return self._make_result(status, state, stats)
+
+    def add_variable(self, state, a, c_j):
+        """Re-optimize after appending a variable with column a and cost c_j."""
+
+        if state.bounds is not None:
+            return SimplexResult("error", message="Structural changes are not supported for bounded problems.")
+
+        a = np.array(a, dtype=float).flatten()
+        m, n = state.shape
+        if a.shape[0] != m:
+            return SimplexResult("error", message="Column length must equal number of constraints.")
+
+        # Column in the current basis: B^-1 a, reduced cost y a - c_j
+        column = np.empty(m + 1)
+        column[:-1] = state.T[:-1, n:n + m] @ a
+        column[-1] = state.T[-1, n:n + m] @ a - (c_j if state.maximize else -c_j)
+        T = np.insert(state.T, n, column, axis=1)
+        basis = [j + 1 if j >= n else j for j in state.basis]
+
+        state = SolverState(T, basis, np.append(state.c, c_j), np.column_stack([state.A, a]), state.b.copy(), state.maximize)
+        stats = self._new_stats()
+        status, state.basis = self._reoptimize(T, basis, state.cost(), stats)
+        return self._make_result(status, state, stats)
+
+    def remove_variable(self, state, j):
+        """Re-optimize after deleting variable j."""
+
+        if state.bounds is not None:
+            return SimplexResult("error", message="Structural changes are not supported for bounded problems.")
+
+        state = state.copy()
+        T, basis = state.T, state.basis
+        stats = self._new_stats()
+
+        if j in basis:
+            # Pivot it out on the row entry that disturbs the duals least
+            row = basis.index(j)
+            row_vals = T[row, :-1].copy()
+            row_vals[j] = 0.0
+            cols = np.where(np.abs(row_vals) > self.tol)[0]
+            if cols.size == 0:
+                return SimplexResult("error", message=f"Variable {j} cannot be removed from the basis.")
+            col = cols[np.argmin(np.abs(T[-1, cols] / row_vals[cols]))]
+            self._pivot(T, row, col)
+            basis[row] = col
+            stats.iterations += 1
+
+        T = np.delete(T, j, axis=1)
+        basis = [k - 1 if k > j else k for k in basis]
+
+        state = SolverState(T, basis, np.delete(state.c, j), np.delete(state.A, j, axis=1), state.b, state.maximize)
+        status, state.basis = self._reoptimize(T, basis, state.cost(), stats)
+        return self._make_result(status, state, stats)
+
+    def _parametric_start(self, state, direction, size, t_end):
+        # Optimal copy of state and the direction as a vector; a negative
+        # range is swept as a positive one along -direction
+        if np.ndim(direction) == 0:
+            index = int(direction)
+            if not 0 <= index < size:
+                return None, None, None, "Parametric index out of range."
+            direction = np.zeros(size)
+            direction[index] = 1.0
+        direction = np.array(direction, dtype=float).flatten()
+        if direction.shape[0] != size:
+            return None, None, None, "Direction length does not match the problem."
+        sign = -1.0 if t_end < 0 else 1.0
+        state = state.copy()
+        stats = self._new_stats()
+        self._set_objective(state.T, state.basis, state.cost(), state.bounds)
+        status, state.basis = self._reoptimize(state.T, state.basis, state.cost(), stats, state.bounds)
+        if status != "optimal":
+            return None, None, None, f"No optimum at t = 0 ({status})."
+        return state, sign * direction, sign, None
+
+    def _parametric_point(self, state, c, sign, t, points):
+        x = _primal_solution(state.T, state.basis, state.bounds, state.shape[1])
+        points.append((sign * t, float(c @ x), x, list(state.basis)))
+
+    def _parametric_result(self, status, points, iterations, message=""):
+        t, z, x, bases = zip(*points)
+        # The basis recorded at a breakpoint is the one of the segment ending there
+        return ParametricResult(status, t, z, np.array(x), list(bases[1:]), iterations, message)
+
+    def parametric_rhs(self, state, direction, t_end):
+        """Optimal value as b moves to b + t direction, t from 0 to t_end.
+
+        direction is a vector over the rows or the index of one row (vary
+        that b_i alone). Starting from the optimal basis of state, the
+        basic values move linearly in t until one reaches a bound; only
+        there the dual simplex pivots, so the sweep costs one pivot per
+        breakpoint instead of a solve per value of t.
+        """
+
+        m, n = state.shape
+        state, d, sign, error = self._parametric_start(state, direction, m, t_end)
+        if error:
+            return ParametricResult("error", [], [], np.zeros((0, n)), [], message=error)
+        T, basis, bounds = state.T, state.basis, state.bounds
+        t_end = abs(t_end)
+        t, iterations, points = 0.0, 0, []
+        self._parametric_point(state, state.c, sign, t, points)
+        while True:
+            rate = T[:-1, n:n + m] @ d
+            rhs = T[:-1, -1]
+            width = bounds.width[basis] if bounds is not None else np.full(m, np.inf)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                to_zero = np.where(rate < -self.tol, rhs / -rate, np.inf)
+                to_upper = np.where(rate > self.tol, (width - rhs) / rate, np.inf)
+            steps = np.maximum(np.minimum(to_zero, to_upper), 0.0)
+            row = int(np.argmin(steps)) if m else 0
+            step = steps[row] if m else np.inf
+            t = min(t + step, t_end)
+
+            # Exact RHS and objective at t, as in resolve
+            b = state.b + t * d
+            T[:-1, -1] = T[:-1, n:n + m] @ (bounds.rhs(state.A, b) if bounds is not None else b)
+            self._set_objective(T, basis, state.cost(), bounds)
+            if t >= t_end:
+                self._parametric_point(state, state.c, sign, t, points)
+                return self._parametric_result("optimal", points, iterations)
+            if step > self.tol:
+                self._parametric_point(state, state.c, sign, t, points)
+
+            # Dual simplex pivot on the row that reached its bound
+            leaves_upper = to_upper[row] < to_zero[row]
+            row_vals = T[row, :-1] if leaves_upper else -T[row, :-1]
+            candidates = np.where(row_vals > self.tol)[0]
+            candidates = candidates[candidates != basis[row]]
+            if candidates.size == 0:
+                return self._parametric_result("infeasible", points, iterations,
+                                               f"Infeasible beyond t = {sign * t:g}.")
+            col = candidates[np.argmin(T[-1, candidates] / row_vals[candidates])]
+            leaving = basis[row]
+            self._pivot(T, row, col)
+            basis[row] = col
+            if leaves_upper:
+                bounds.flip(T, leaving)
+            iterations += 1
+            if iterations >= self.max_iter:
+                return self._parametric_result("error", points, iterations, "Iteration limit reached.")
+
+    def parametric_cost(self, state, direction, t_end):
+        """Optimal value as c moves to c + t direction, t from 0 to t_end.
+
+        direction is a vector over the variables or the index of one
+        variable. The reduced costs move linearly in t until one reaches
+        zero; only there the primal simplex pivots (or flips a bound).
+        """
+
+        m, n = state.shape
+        state, d, sign, error = self._parametric_start(state, direction, n, t_end)
+        if error:
+            return ParametricResult("error", [], [], np.zeros((0, n)), [], message=error)
+        T, basis, bounds = state.T, state.basis, state.bounds
+        c0 = state.c.copy()
+        t_end = abs(t_end)
+        t, iterations, points = 0.0, 0, []
+        self._parametric_point(state, c0, sign, t, points)
+        while True:
+            # Rate of change of the objective row, in the tableau's
+            # maximization form with complemented columns
+            g = np.zeros(n + m)
+            g[:n] = d if state.maximize else -d
+            if bounds is not None:
+                g, _ = bounds.cost(g)
+            rate = g[basis] @ T[:-1, :-1] - g
+            obj = T[-1, :-1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                steps = np.where(rate < -self.tol, np.maximum(obj, 0.0) / -rate, np.inf)
+            steps[basis] = np.inf
+            col = int(np.argmin(steps))
+            step = steps[col]
+            t = min(t + step, t_end)
+
+            state.c = c0 + t * d
+            self._set_objective(T, basis, state.cost(), bounds)
+            if t >= t_end:
+                self._parametric_point(state, state.c, sign, t, points)
+                return self._parametric_result("optimal", points, iterations)
+            if step > self.tol:
+                self._parametric_point(state, state.c, sign, t, points)
+
+            # Primal simplex step with column col entering
+            if bounds is not None:
+                row, leaves_upper = self._bounded_ratio_test(T, basis, col, bounds)
+                if row is None and np.isfinite(bounds.width[col]):
+                    bounds.flip(T, col)
+                    iterations += 1
+                    continue
+            else:
+                row, leaves_upper = self._choose_leaving(T, col), False
+            if row is None:
+                return self._parametric_result("unbounded", points, iterations,
+                                               f"Unbounded beyond t = {sign * t:g}.")
+            leaving = basis[row]
+            self._pivot(T, row, col)
+            basis[row] = col
+            if leaves_upper:
+                bounds.flip(T, leaving)
+            iterations += 1
+            if iterations >= self.max_iter:
+                return self._parametric_result("error", points, iterations, "Iteration limit reached.")
+
+    def solve_batch(self, c_batch, A, b_batch, maximize=True):
+        """Solve many LPs that share A and differ only in c and b.
+
+        c_batch is (k, n) and b_batch is (k, m); either may also be a single
+        vector used for every scenario. The tableau body is built once and
+        each scenario starts from the previous scenario's final basis: only
+        the RHS column and objective row are recomputed from it, then the
+        primal or dual simplex re-optimizes, whichever the basis allows.
+        """
+
+        b_batch = np.array(b_batch, dtype=float)
+        c_batch = np.array(c_batch, dtype=float)
+        if is_sparse(A):
+            A = A.toarray()
+        A = np.asarray(A, dtype=float)  # only read, so shared views are not copied
+        m, n = A.shape
+
+        if b_batch.ndim == 1:
+            b_batch = b_batch[None, :]
+        if c_batch.ndim == 1:
+            c_batch = c_batch[None, :]
+        k = max(b_batch.shape[0], c_batch.shape[0])
+
+        status = np.zeros(k, dtype=np.int8)
+        x_out = np.full((k, n), np.nan)
+        z_out = np.full(k, np.nan)
+        iterations = np.zeros(k, dtype=np.int64)
+        messages = {}
+        error_code = BatchResult.STATUSES.index("error")
+
+        error = None
+        if b_batch.shape[1] != m:
+            error = "Number of constraints in A and b don't match."
+        elif c_batch.shape[1] != n:
+            error = "Objective length must equal number of variables."
+        elif b_batch.shape[0] not in (1, k) or c_batch.shape[0] not in (1, k):
+            error = "c_batch and b_batch must have the same number of scenarios."
+        if error:
+            status[:] = error_code
+            messages = dict.fromkeys(range(k), error)
+            return BatchResult(status, x_out, z_out, iterations, messages)
+
+        # The slack-basis tableau body depends only on A
+        T0, basis0 = self._build_tableau(A, np.zeros(m), np.zeros(n))
+        T, basis = None, None
+        cost = np.zeros(n + m)
+
+        for i in range(k):
+            b = b_batch[i if b_batch.shape[0] > 1 else 0]
+            c = c_batch[i if c_batch.shape[0] > 1 else 0]
+            cost[:n] = c if maximize else -c
+
+            # Warm start: the slack block of the previous tableau is B^-1
+            if T is not None:
+                T[:-1, -1] = T[:-1, n:n + m] @ b
+            else:
+                T, basis = T0.copy(), list(basis0)
+                T[:-1, -1] = b
+            self._set_objective(T, basis, cost)
+
+            stats = self._new_stats()
+            result, basis = self._reoptimize(T, basis, cost, stats)
+            iterations[i] = stats.iterations
+            if result == "optimal":
+                x = x_out[i]
+                x[:] = 0.0
+                B = np.asarray(basis)
+                structural = B < n
+                x[B[structural]] = T[:-1, -1][structural]
+                z_out[i] = T[-1, -1] if maximize else -T[-1, -1]
+            elif result == "unbounded":
+                status[i] = BatchResult.STATUSES.index("unbounded")
+                messages[i] = "Objective is unbounded."
+            elif result == "infeasible":
+                status[i] = BatchResult.STATUSES.index("infeasible")
+                messages[i] = "Problem is infeasible."
+                T = None
+            else:
+                status[i] = error_code
+                messages[i] = f"Simplex did not converge: {result}"
+
+        return BatchResult(status, x_out, z_out, iterations, messages)
\ No newline at end of file
@@ -0,0 +1,123 @@
+import numpy as np
+
+
+class CSRMatrix:
+    """Minimal compressed-sparse-row matrix used by the simplex engines.
+
+    Only the operations the solvers need are provided: products with A and
+    A^T, column access (through a lazily built CSC copy of the index
+    arrays) and conversion to a dense array. scipy.sparse matrices are
+    accepted anywhere a CSRMatrix is, see as_csr.
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices)
+        self.indptr = np.asarray(indptr)
+        self.shape = (int(shape[0]), int(shape[1]))
+        self._row_ids = None
+        self._csc = None
+
+    @classmethod
+    def from_dense(cls, A):
+        A = np.asarray(A, dtype=float)
+        rows, cols = np.nonzero(A)
+        indptr = np.zeros(A.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=A.shape[0]), out=indptr[1:])
+        return cls(A[rows, cols], cols, indptr, A.shape)
+
+    @classmethod
+    def from_coo(cls, rows, cols, vals, shape):
+        """Build from coordinate arrays, summing duplicate entries."""
+        m, n = int(shape[0]), int(shape[1])
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        vals = np.asarray(vals, dtype=float)
+        keys = rows * n + cols
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        if keys.size:
+            starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            vals = np.add.reduceat(vals[order], starts)
+            keys = keys[starts]
+        else:
+            vals = vals[order]
+        rows, cols = np.divmod(keys, max(n, 1))
+        indptr = np.zeros(m + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=m), out=indptr[1:])
+        return cls(vals, cols, indptr, (m, n))
+
+    @classmethod
+    def from_scipy(cls, S):
+        S = S.tocsr()
+        return cls(S.data, S.indices, S.indptr, S.shape)
+
+    @property
+    def nnz(self):
+        return int(self.indptr[-1])
+
+    def _rows(self):
+        if self._row_ids is None:
+            self._row_ids = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return self._row_ids
+
+    def _columns(self):
+        # CSC view of the same entries: (column pointer, row indices, values)
+        if self._csc is None:
+            order = np.argsort(self.indices, kind="stable")
+            colptr = np.zeros(self.shape[1] + 1, dtype=np.int64)
+            np.cumsum(np.bincount(self.indices, minlength=self.shape[1]), out=colptr[1:])
+            self._csc = (colptr, self._rows()[order], self.data[order])
+        return self._csc
+
+    def matvec(self, x):
+        return np.bincount(self._rows(), weights=self.data * x[self.indices], minlength=self.shape[0])
+
+    def rmatvec(self, y):
+        return np.bincount(self.indices, weights=self.data * y[self._rows()], minlength=self.shape[1])
+
+    def col_entries(self, j):
+        colptr, rows, data = self._columns()
+        return rows[colptr[j]:colptr[j + 1]], data[colptr[j]:colptr[j + 1]]
+
+    def select_columns(self, cols):
+        """Entries of the given columns as (rows, positions in cols, values)."""
+        colptr, rows, data = self._columns()
+        cols = np.asarray(cols)
+        starts = colptr[cols]
+        counts = colptr[cols + 1] - starts
+        total = int(counts.sum())
+        first = np.cumsum(counts) - counts
+        idx = np.repeat(starts - first, counts) + np.arange(total)
+        return rows[idx], np.repeat(np.arange(cols.shape[0]), counts), data[idx]
+
+    def col(self, j):
+        x = np.zeros(self.shape[0])
+        rows, vals = self.col_entries(j)
+        x[rows] = vals
+        return x
+
+    def row_entries(self, i):
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:stop], self.data[start:stop]
+
+    def toarray(self):
+        A = np.zeros(self.shape)
+        A[self._rows(), self.indices] = self.data
+        return A
+
+    def __repr__(self):
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz})"
+
+
+def is_sparse(A):
+    # scipy.sparse matrices are recognised without importing scipy
+    return isinstance(A, CSRMatrix) or hasattr(A, "tocsr")
+
+
+def as_csr(A):
+    if isinstance(A, CSRMatrix):
+        return A
+    if hasattr(A, "tocsr"):
+        return CSRMatrix.from_scipy(A)
+    return CSRMatrix.from_dense(A)
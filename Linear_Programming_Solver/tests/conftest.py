@@ -0,0 +1,46 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# The solver modules import each other as top-level modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _random_lp(rng, m, n, negative_b=False):
+    # Small c, A, b with mixed-sign A; negative_b makes some rows >= rows
+    A = rng.uniform(-1.0, 3.0, (m, n))
+    b = rng.uniform(1.0, 10.0, m)
+    if negative_b:
+        b[rng.random(m) < 0.3] *= -0.2
+    c = rng.uniform(-2.0, 5.0, n)
+    return c, A, b
+
+
+@pytest.fixture
+def random_lp():
+    """random_lp(rng, m, n, negative_b=False) -> c, A, b of a small random LP."""
+    return _random_lp
+
+
+@pytest.fixture
+def highs():
+    """Reference solve with scipy's HiGHS: (status, z) in the problem's own sense."""
+    linprog = pytest.importorskip("scipy.optimize").linprog
+
+    def solve(c, A, b, maximize=True, bounds=None):
+        c = np.asarray(c, dtype=float)
+        result = linprog(-c if maximize else c, A_ub=A, b_ub=b, bounds=bounds if bounds is not None else (0, None),
+                         method="highs")
+        status = {0: "optimal", 2: "infeasible", 3: "unbounded"}.get(result.status, "error")
+        if status != "optimal":
+            return status, None
+        return status, -result.fun if maximize else result.fun
+
+    return solve
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from simplex import BatchResult, SimplexSolver
+
+
+def test_batch_matches_single_solves(rng, random_lp):
+    c, A, b = random_lp(rng, 5, 6)
+    c_batch = c + 0.5 * rng.standard_normal((25, 6))
+    b_batch = b * rng.uniform(0.2, 1.5, (25, 5))
+    b_batch[3] = -1.0  # infeasible scenario
+    solver = SimplexSolver()
+    batch = solver.solve_batch(c_batch, A, b_batch)
+    assert len(batch) == 25
+    for i in range(25):
+        single = solver.solve(c_batch[i], A, b_batch[i])
+        assert batch[i].status == single.status
+        if single.status == "optimal":
+            assert batch.z[i] == pytest.approx(single.z, abs=1e-7)
+    assert batch.status_names()[3] == "infeasible"
+
+
+def test_batch_broadcasts_a_single_vector(rng, random_lp):
+    c, A, b = random_lp(rng, 4, 4)
+    batch = SimplexSolver().solve_batch(c, A, np.vstack([b, 2 * b]), maximize=False)
+    assert len(batch) == 2
+    assert batch.status_names() == [SimplexSolver().solve(c, A, bi, False).status for bi in (b, 2 * b)]
+
+
+def test_batch_shape_errors():
+    batch = SimplexSolver().solve_batch(np.ones((2, 2)), np.ones((1, 2)), np.ones((3, 1)))
+    assert set(batch.status) == {BatchResult.STATUSES.index("error")}
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from benchmarks import CORPUS, COMPARE_SLACK, bench_suite, compare, generate_lp
+from sparse import is_sparse
+
+LP_FAMILIES = [family for family in CORPUS if family != "graphical"]
+
+
+def _dense(A):
+    return A.toarray() if is_sparse(A) else np.asarray(A)
+
+
+@pytest.mark.parametrize("family", list(CORPUS))
+def test_generate_lp_is_deterministic(family):
+    size = CORPUS[family][0]
+    first, again, other = generate_lp(family, size, 3), generate_lp(family, size, 3), generate_lp(family, size, 4)
+    if family == "graphical":
+        np.testing.assert_array_equal(first[0], again[0])
+        assert first[1] == again[1] and first[1] != other[1]
+        return
+    for x, y in zip(first[:3], again[:3]):
+        np.testing.assert_array_equal(_dense(x), _dense(y))
+    assert first[3] == again[3]
+    if family != "klee_minty":  # not random
+        assert not all(np.array_equal(_dense(x), _dense(y)) for x, y in zip(first[:3], other[:3]))
+
+
+@pytest.mark.parametrize("family", LP_FAMILIES)
+def test_corpus_problems_are_feasible(highs, family):
+    for size in CORPUS[family][:2]:
+        c, A, b, maximize = generate_lp(family, size)
+        status, _ = highs(c, _dense(A), b, maximize)
+        assert status == "optimal"
+
+
+def test_graphical_problems_have_a_region():
+    from graphical import feasible_vertices
+
+    for size in CORPUS["graphical"]:
+        _, constraints = generate_lp("graphical", size)
+        assert len(feasible_vertices(constraints)) >= 3
+
+
+def test_unknown_family():
+    with pytest.raises(ValueError):
+        generate_lp("tiny", 3)
+
+
+def test_bench_suite_records():
+    report = bench_suite({"dense": (5,), "graphical": (6,)}, repeats=1)
+    lp, polygon = report["results"]
+    assert lp["case"] == "dense/5" and lp["status"] == "optimal" and lp["shape"] == [5, 10]
+    assert polygon["case"] == "graphical/6" and polygon["vertices"] >= 3
+    assert report["meta"]["repeats"] == 1
+
+
+def _report(**record):
+    return {"results": [dict({"case": "dense/25", "status": "optimal", "iterations": 40, "time": 0.5,
+                              "peak_memory": 1 << 20}, **record)]}
+
+
+def test_compare():
+    baseline = _report()
+    assert compare(_report(time=0.55), baseline) == []
+    assert compare(_report(time=0.6 + 2 * COMPARE_SLACK["time"]), baseline)[0]["metric"] == "time"
+    assert compare(_report(iterations=49), baseline)[0]["metric"] == "iterations"
+    (flag,) = compare(_report(status="infeasible"), baseline)
+    assert (flag["metric"], flag["baseline"], flag["current"]) == ("status", "optimal", "infeasible")
+    # Growth within the absolute slack is noise on tiny cases
+    tiny = _report(time=1e-4)
+    assert compare(_report(time=5e-4), tiny) == []
+    assert compare(_report(case="sparse/100", time=10.0), baseline) == []
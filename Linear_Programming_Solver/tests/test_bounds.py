@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from simplex import SimplexSolver
+
+
+def _random_bounds(rng, n):
+    return [(float(rng.uniform(0, 1)) if rng.random() < 0.5 else 0.0,
+             float(rng.uniform(1, 3)) if rng.random() < 0.7 else None) for _ in range(n)]
+
+
+@pytest.mark.parametrize("maximize", [True, False])
+def test_bounded_lps_match_reference(highs, rng, random_lp, maximize):
+    solver = SimplexSolver()
+    for _ in range(40):
+        c, A, b = random_lp(rng, rng.integers(2, 7), rng.integers(2, 7), negative_b=True)
+        bounds = _random_bounds(rng, A.shape[1])
+        result = solver.solve(c, A, b, maximize, bounds=bounds)
+        status, z = highs(c, A, b, maximize, bounds)
+        assert result.status == status
+        if status == "optimal":
+            assert result.z == pytest.approx(z, abs=1e-6)
+            lower = np.array([lo for lo, _ in bounds])
+            upper = np.array([np.inf if hi is None else hi for _, hi in bounds])
+            assert np.all(result.x >= lower - 1e-9) and np.all(result.x <= upper + 1e-9)
+
+
+def test_resolve_with_new_bounds(highs, rng, random_lp):
+    c, A, b = random_lp(rng, 4, 5)
+    solver = SimplexSolver()
+    result = solver.solve(c, A, b, bounds=_random_bounds(rng, 5))
+    for _ in range(10):
+        bounds = _random_bounds(rng, 5)
+        warm = solver.resolve(result.state, bounds=bounds)
+        status, z = highs(c, A, b, bounds=bounds)
+        assert warm.status == status
+        if status == "optimal":
+            assert warm.z == pytest.approx(z, abs=1e-6)
+
+
+def test_invalid_bounds():
+    result = SimplexSolver().solve([1, 1], [[1, 1]], [4], bounds=[(2, 1), (0, None)])
+    assert result.status == "error"
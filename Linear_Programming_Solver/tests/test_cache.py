@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from cache import SolveCache, matrix_key, problem_key
+from simplex import SimplexSolver
+from sparse import CSRMatrix
+
+
+def test_problem_key():
+    c, A, b = [3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18]
+    key = problem_key(c, A, b)
+    assert key == problem_key(np.array(c, dtype=float), np.array(A), np.array(b))
+    assert problem_key([0.0, 5], A, b) == problem_key([-0.0, 5], A, b)
+    assert key != problem_key(c, A, b, maximize=False)
+    assert key != problem_key(c, A, [4, 12, 19])
+    assert key != problem_key(c, A, b, bounds=[(0, 1), (0, None)])
+    assert matrix_key(A) != matrix_key(CSRMatrix.from_dense(np.array(A, dtype=float)))
+
+
+def test_hits_match_solves(rng, random_lp):
+    c, A, b = random_lp(rng, 5, 6)
+    cache = SolveCache()
+    first = cache.solve(c, A, b)
+    again = cache.solve(list(c), A.tolist(), b)
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    assert again.status == first.status == SimplexSolver().solve(c, A, b).status
+    assert again.z == pytest.approx(first.z)
+    np.testing.assert_array_equal(again.x, first.x)
+    again.x[0] = -1.0  # callers get copies
+    assert cache.solve(c, A, b).x[0] == first.x[0]
+
+
+def test_warm_start_from_the_same_matrix(rng, random_lp):
+    c, A, b = random_lp(rng, 6, 8)
+    cache = SolveCache()
+    cache.solve(c, A, b)
+    result = cache.solve(c, A, 1.1 * b)
+    assert cache.stats.warm_starts == 1
+    assert result.z == pytest.approx(SimplexSolver().solve(c, A, 1.1 * b).z)
+    assert cache.basis(A) is not None and cache.basis(A + 1.0) is None
+
+
+def test_lru_eviction(rng, random_lp):
+    c, A, b = random_lp(rng, 3, 3)
+    cache = SolveCache(max_entries=2)
+    for scale in (1.0, 2.0, 1.0, 3.0):
+        cache.solve(c, A, scale * b)
+    assert len(cache) == 2 and cache.stats.evictions == 1
+    cache.solve(c, A, b)  # used most recently before 3.0, so still held
+    cache.solve(c, A, 2.0 * b)
+    assert (cache.stats.hits, cache.stats.misses) == (2, 4)
+    with pytest.raises(ValueError):
+        SolveCache(max_entries=0)
+
+
+def test_errors_are_not_cached():
+    cache = SolveCache()
+    assert cache.solve([1, 1], [[1, 1]], [1, 2]).status == "error"
+    assert len(cache) == 0
+
+
+def test_disk_store(tmp_path, rng, random_lp):
+    c, A, b = random_lp(rng, 4, 5)
+    first = SolveCache(path=str(tmp_path)).solve(c, A, b)
+    other = SolveCache(path=str(tmp_path))
+    assert problem_key(c, A, b, tol=other.solver.tol) in other
+    result = other.solve(c, A, b)
+    assert other.stats.disk_hits == 1 and other.stats.misses == 0
+    assert result.z == pytest.approx(first.z)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_hits_carry_the_basis(tmp_path, rng, random_lp):
+    c, A, b = random_lp(rng, 6, 8)
+    solver = SimplexSolver()
+    cache = SolveCache(solver, path=str(tmp_path))
+    first = cache.solve(c, A, b)
+    memory_hit = cache.solve(c, A, b)
+    disk_hit = SolveCache(solver, path=str(tmp_path)).solve(c, A, b)
+    for hit in (memory_hit, disk_hit):
+        assert hit.state is None
+        np.testing.assert_array_equal(hit.basis, first.state.basis)
+    # The basis warm-starts a nearby problem
+    warm = solver.solve(c, A, 1.01 * b, basis=memory_hit.basis)
+    assert warm.z == pytest.approx(solver.solve(c, A, 1.01 * b).z)
+    assert warm.iterations <= 1
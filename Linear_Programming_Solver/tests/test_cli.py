@@ -0,0 +1,63 @@
+import json
+
+import numpy as np
+import pytest
+
+import cli
+
+
+def _run(tmp_path, *args):
+    out = tmp_path / "out.jsonl"
+    cli.main([*map(str, args), "-w", "1", "-o", str(out)])
+    return {record["id"]: record for record in map(json.loads, out.read_text().splitlines())}
+
+
+def test_json_and_npz_problems(tmp_path):
+    (tmp_path / "a.json").write_text(json.dumps({"c": [3, 5], "A": [[1, 0], [0, 2], [3, 2]], "b": [4, 12, 18]}))
+    (tmp_path / "b.json").write_text(json.dumps({"c": [1, 1], "A": [[1, -1]], "b": [1]}))
+    np.savez(tmp_path / "c.npz", c=[1.0, 1.0], A=[[1.0, 1.0]], b=[2.0], maximize=False)
+    records = _run(tmp_path, tmp_path / "a.json", tmp_path / "b.json", tmp_path / "c.npz")
+    by_name = {key.rsplit("/", 1)[-1]: value for key, value in records.items()}
+    assert by_name["a.json"]["status"] == "optimal" and by_name["a.json"]["z"] == pytest.approx(36.0)
+    assert by_name["b.json"]["status"] == "unbounded"
+    assert by_name["c.npz"]["z"] == pytest.approx(0.0)
+
+
+def test_integer_problem(tmp_path):
+    problem = {"c": [10, 13, 7], "A": [[4, 6, 3]], "b": [10], "bounds": [[0, 1]] * 3, "integer": [0, 1, 2]}
+    (tmp_path / "knapsack.json").write_text(json.dumps(problem))
+    (record,) = _run(tmp_path, tmp_path / "knapsack.json").values()
+    assert record["z"] == pytest.approx(23.0)
+
+
+@pytest.mark.parametrize("solver", ["simplex", "revised", "interior"])
+@pytest.mark.parametrize("bounded", [False, True])
+def test_model_file_with_each_solver(tmp_path, solver, bounded):
+    # Regression: model files always passed bounds, which the revised and
+    # interior-point engines do not take
+    from problem_io import LPModel, write_mps
+    from sparse import CSRMatrix
+
+    A = CSRMatrix.from_dense(np.array([[1.0, 2.0], [3.0, 1.0]]))
+    lower, upper = ([0.5, 1.0], [1.5, np.inf]) if bounded else ([0.0, 0.0], [np.inf, np.inf])
+    write_mps(LPModel([3.0, 2.0], A, [-np.inf, -np.inf], [8.0, 9.0], lower, upper, maximize=True), tmp_path / "m.mps")
+    (record,) = _run(tmp_path, tmp_path / "m.mps", "--solver", solver).values()
+    assert record["status"] == "optimal"
+    assert record["z"] == pytest.approx(11.0 if bounded else 12.0, abs=1e-6)
+    np.testing.assert_allclose(record["x"], [1.5, 3.25] if bounded else [2.0, 3.0], atol=1e-6)
+
+
+@pytest.mark.parametrize("suffix", [".mps", ".lp"])
+def test_presolve_with_integer_model_file(tmp_path, suffix):
+    # Regression: branch and bound crashed on the state-less root of a presolved solve
+    from problem_io import LPModel, write_problem
+    from sparse import CSRMatrix
+
+    A = CSRMatrix.from_dense(np.array([[1.0, 2.0], [3.0, 1.0]]))
+    model = LPModel([1.0, 1.0], A, [-np.inf, -np.inf], [4.0, 6.0], [0.0, 0.0], [np.inf, np.inf],
+                    integer=[True, True], maximize=True)
+    write_problem(model, tmp_path / f"m{suffix}")
+    (record,) = _run(tmp_path, tmp_path / f"m{suffix}", "--presolve").values()
+    assert record["status"] == "optimal"
+    assert record["z"] == pytest.approx(2.0)
+    np.testing.assert_allclose(record["x"], np.round(record["x"]))
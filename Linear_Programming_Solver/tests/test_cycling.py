@@ -0,0 +1,26 @@
+import pytest
+
+from simplex import SimplexSolver
+
+# Beale's example: Dantzig's rule with lowest-index ties cycles forever
+C = [0.75, -150.0, 0.02, -6.0]
+A = [[0.25, -60.0, -0.04, 9.0], [0.5, -90.0, -0.02, 3.0], [0.0, 0.0, 1.0, 0.0]]
+B = [0.0, 0.0, 1.0]
+
+
+@pytest.mark.parametrize("rule", ["bland", "perturb"])
+def test_anti_cycling_solves_beale(rule):
+    result = SimplexSolver(anti_cycling=rule, cycle_window=10).solve(C, A, B)
+    assert result.status == "optimal"
+    assert result.z == pytest.approx(0.05)
+    assert result.stats.degenerate_pivots > 0
+
+
+def test_without_protection_the_iteration_limit_is_hit():
+    result = SimplexSolver(anti_cycling=None, max_iter=200).solve(C, A, B)
+    assert result.status != "optimal"
+
+
+def test_unknown_rule():
+    with pytest.raises(ValueError):
+        SimplexSolver(anti_cycling="random")
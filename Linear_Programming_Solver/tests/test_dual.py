@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from simplex import SimplexSolver
+
+
+@pytest.mark.parametrize("maximize", [True, False])
+def test_dual_matches_reference(highs, rng, random_lp, maximize):
+    solver = SimplexSolver(method="dual")
+    for _ in range(40):
+        c, A, b = random_lp(rng, rng.integers(2, 7), rng.integers(2, 7), negative_b=True)
+        result = solver.solve(c, A, b, maximize)
+        status, z = highs(c, A, b, maximize)
+        assert result.status == status
+        if status == "optimal":
+            assert result.z == pytest.approx(z, abs=1e-6)
+
+
+def test_dual_with_bounds(highs, rng, random_lp):
+    solver = SimplexSolver(method="dual")
+    for _ in range(20):
+        c, A, b = random_lp(rng, 4, 5, negative_b=True)
+        bounds = [(float(rng.uniform(0, 0.5)), float(rng.uniform(1, 3))) for _ in range(5)]
+        result = solver.solve(c, A, b, bounds=bounds)
+        status, z = highs(c, A, b, bounds=bounds)
+        assert result.status == status
+        if status == "optimal":
+            assert result.z == pytest.approx(z, abs=1e-6)
+
+
+def test_no_rows():
+    # Regression: the dual phase used to crash on an empty right-hand side
+    solver = SimplexSolver(method="dual")
+    assert solver.solve([1, 2], np.zeros((0, 2)), []).status == "unbounded"
+    result = solver.solve([1, 2], np.zeros((0, 2)), [], maximize=False)
+    assert result.status == "optimal" and result.z == 0.0
+
+
+def test_no_rows_with_bounds():
+    result = SimplexSolver(method="dual").solve([1, -2], np.zeros((0, 2)), [], bounds=[(1, 3), (0.5, 2)])
+    assert result.status == "optimal"
+    np.testing.assert_allclose(result.x, [3.0, 0.5])
+    assert result.z == pytest.approx(2.0)
@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from graphical import feasible_polygon, feasible_vertices, graphical_solver
+
+
+def _baseline_vertices(constraints):
+    # The original enumeration: every pair of lines, then the axis
+    # intercepts, each point checked against every constraint in Python
+    def satisfies(x, y, a, b, c, sense):
+        if sense == "<=":
+            return a * x + b * y <= c + 1e-9
+        elif sense == ">=":
+            return a * x + b * y >= c - 1e-9
+        elif sense == "=":
+            return np.isclose(a * x + b * y, c, atol=1e-9)
+        return False
+
+    def feasible(x, y):
+        return all(satisfies(x, y, *con) for con in constraints)
+
+    points = []
+    for i in range(len(constraints)):
+        for j in range(i + 1, len(constraints)):
+            a1, b1, c1, _ = constraints[i]
+            a2, b2, c2, _ = constraints[j]
+            A = np.array([[a1, b1], [a2, b2]], dtype=float)
+            if np.linalg.det(A) != 0:
+                x, y = np.linalg.solve(A, [c1, c2])
+                if x >= -1e-9 and y >= -1e-9 and feasible(x, y):
+                    points.append((x, y))
+    for a, b, c, sense in constraints:
+        if a != 0 and c / a >= -1e-9 and feasible(c / a, 0):
+            points.append((c / a, 0))
+        if b != 0 and c / b >= -1e-9 and feasible(0, c / b):
+            points.append((0, c / b))
+    unique = []
+    for p in points:
+        if not any(np.isclose(p[0], q[0]) and np.isclose(p[1], q[1]) for q in unique):
+            unique.append(p)
+    return unique
+
+
+def _assert_same_points(points, expected):
+    assert len(points) == len(expected)
+    if expected:
+        P, E = np.array(points), np.array(expected, dtype=float)
+        np.testing.assert_allclose(P[np.lexsort(P.T[::-1])], E[np.lexsort(E.T[::-1])], rtol=1e-7, atol=1e-9)
+
+
+def _random_constraints(rng, k):
+    # Small integer coefficients, so parallel lines and several lines
+    # through one point are common
+    constraints = []
+    for _ in range(k):
+        a, b = rng.integers(-3, 4, 2)
+        c = rng.integers(-2, 13)
+        constraints.append((float(a), float(b), float(c), rng.choice(["<=", "<=", ">=", "="], p=[0.4, 0.2, 0.3, 0.1])))
+    return constraints
+
+
+CASES = {
+    "parallel": [(1, 1, 4, "<="), (2, 2, 6, "<="), (1, 1, 1, ">="), (1, -1, 2, "<=")],
+    "degenerate": [(1, 1, 4, "<="), (1, 0, 2, "<="), (0, 1, 2, "<="), (1, -1, 0, "<=")],
+    "unbounded": [(1, 1, 2, ">="), (1, -1, 1, "<="), (-1, 2, 2, "<=")],
+    "equality": [(1, 2, 4, "="), (1, 0, 3, "<=")],
+    "infeasible": [(1, 1, 1, "<="), (1, 1, 3, ">=")],
+    "zero row": [(0, 0, 1, "<="), (1, 1, 2, "<=")],
+}
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_vertices_of_special_cases(name):
+    constraints = CASES[name]
+    _assert_same_points(feasible_vertices(constraints), _baseline_vertices(constraints))
+
+
+def test_vertices_match_pairwise_enumeration(rng):
+    for _ in range(200):
+        constraints = _random_constraints(rng, rng.integers(1, 9))
+        _assert_same_points(feasible_vertices(constraints), _baseline_vertices(constraints))
+
+
+def _area(polygon):
+    x, y = np.array(polygon).T
+    return 0.5 * (x @ np.roll(y, -1) - y @ np.roll(x, -1))  # positive when counterclockwise
+
+
+def test_polygon_of_a_known_region():
+    # x + y <= 4, x <= 3, y <= 2: the 3 x 2 rectangle less the corner x + y > 4
+    constraints = [(1, 1, 4, "<="), (1, 0, 3, "<="), (0, 1, 2, "<=")]
+    polygon = feasible_polygon(constraints, (10, 10))
+    assert _area(polygon) == pytest.approx(5.5, abs=1e-6)
+    np.testing.assert_allclose(sorted(polygon), [(0, 0), (0, 2), (2, 2), (3, 0), (3, 1)], atol=1e-6)
+    # Counterclockwise, starting anywhere on the ring
+    start = polygon.index(min(polygon))
+    ring = polygon[start:] + polygon[:start]
+    np.testing.assert_allclose(ring, [(0, 0), (3, 0), (3, 1), (2, 2), (0, 2)], atol=1e-6)
+
+
+def test_polygon_is_clipped_to_the_box():
+    # x - y <= 1 cuts the triangle below y = x - 1 off the 4 x 3 box
+    polygon = feasible_polygon([(1, -1, 1, "<=")], (4, 3))
+    assert _area(polygon) == pytest.approx(12.0 - 4.5, abs=1e-6)
+
+
+@pytest.mark.parametrize("constraints", [CASES["infeasible"], [(1, 1, -1, "<=")], [(0, 0, -1, "<=")],
+                                         [(1, 1, 1, "<=")] + [(1, 0, 2, "!=")]])
+def test_empty_polygon(constraints):
+    assert feasible_polygon(constraints, (10, 10)) == []
+
+
+def test_infeasible_problem_has_no_region():
+    pytest.importorskip("matplotlib")
+    result = graphical_solver("max", [1, 1], CASES["infeasible"], show=False)
+    assert result["status"] == "infeasible" and result["opt_points"] == []
+
+
+@pytest.mark.parametrize("image_format, magic", [("png", b"\x89PNG\r\n\x1a\n"), ("svg", b"<svg")])
+def test_headless_export(tmp_path, image_format, magic):
+    pytest.importorskip("matplotlib")
+    constraints = [(1, 1, 4, "<="), (1, 0, 3, "<="), (0, 1, 2, "<=")]
+    result = graphical_solver("max", [2, 1], constraints, show=False, image_format=image_format)
+    assert result["status"] == "optimal" and result["opt_value"] == pytest.approx(7.0)
+    image = result["image"]
+    assert magic in image[:512]
+    path = tmp_path / f"plot.{image_format}"
+    graphical_solver("max", [2, 1], constraints, show=False, save_to=str(path))
+    assert magic in path.read_bytes()[:512]
+
+
+def test_render_plots(tmp_path):
+    pytest.importorskip("matplotlib")
+    from graphical import render_plots
+
+    jobs = [("max", [2, 1], [(1, 1, 4, "<=")], str(tmp_path / "a.png")),
+            ("max", [1, 1], CASES["infeasible"], str(tmp_path / "b.png"))]
+    assert render_plots(jobs, workers=2, chunksize=1) == ["optimal", "infeasible"]
+    for name in ("a.png", "b.png"):
+        assert (tmp_path / name).read_bytes().startswith(b"\x89PNG")
+
+
+def test_cancel():
+    import threading
+
+    cancel = threading.Event()
+    cancel.set()
+    assert graphical_solver("max", [2, 1], [(1, 1, 4, "<=")], show=False, image_format="png", cancel=cancel) is None
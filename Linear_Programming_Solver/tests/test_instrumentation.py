@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from simplex import SimplexSolver
+
+
+@pytest.fixture
+def lp(rng, random_lp):
+    return random_lp(rng, 12, 15)
+
+
+@pytest.mark.parametrize("maximize", [True, False])
+def test_trace_is_monotone_and_ends_at_z(rng, random_lp, maximize):
+    c, A, b = random_lp(rng, 12, 15)
+    if not maximize:
+        c = -np.abs(c)  # a minimization with room to improve from x = 0
+    result = SimplexSolver(trace=True).solve(c, A, b, maximize)
+    history = result.stats.objective_history
+    assert result.status == "optimal"
+    assert [k for k, _ in history] == list(range(1, result.iterations + 1))
+    objective = np.array([value for _, value in history])
+    assert np.all(np.diff(objective) >= -1e-9)  # maximization form
+    assert objective[-1] == pytest.approx(result.z if maximize else -result.z)
+
+
+def test_callback_stops_the_solve(lp):
+    c, A, b = lp
+    full = SimplexSolver().solve(c, A, b)
+    assert full.iterations > 3
+    seen = []
+
+    def stop_at_three(stats, objective):
+        seen.append(objective)
+        return stats.iterations >= 3
+
+    result = SimplexSolver(callback=stop_at_three).solve(c, A, b)
+    assert result.status == "stopped" and result.iterations == 3
+    # x of the basis reached: feasible, with the objective the callback saw
+    assert np.all(result.x >= 0) and np.all(A @ result.x <= b + 1e-9)
+    assert c @ result.x == pytest.approx(seen[-1])
+    assert result.z == pytest.approx(seen[-1]) and result.z < full.z
+
+
+@pytest.mark.parametrize("every", [1, 2, 5])
+def test_callback_every(lp, every):
+    c, A, b = lp
+    calls = []
+    result = SimplexSolver(callback=lambda stats, objective: calls.append(stats.iterations), callback_every=every).solve(
+        c, A, b)
+    assert calls == list(range(every, result.iterations + 1, every))
+
+
+@pytest.mark.parametrize("method", ["primal", "dual"])
+def test_monitoring_leaves_the_solve_unchanged(rng, random_lp, method):
+    c, A, b = random_lp(rng, 10, 12, negative_b=True)
+    plain = SimplexSolver(method=method).solve(c, A, b)
+    watched = SimplexSolver(method=method, trace=True, callback=lambda stats, objective: False).solve(c, A, b)
+    assert plain.stats.objective_history is None
+    assert watched.status == plain.status and watched.iterations == plain.iterations
+    if plain.status == "optimal":
+        np.testing.assert_array_equal(watched.x, plain.x)
+        assert watched.z == plain.z
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+import interior_point
+from interior_point import InteriorPointSolver
+from sparse import CSRMatrix
+
+
+@pytest.mark.parametrize("crossover", [False, True])
+def test_random_lps_match_reference(highs, rng, random_lp, crossover):
+    solver = InteriorPointSolver(crossover=crossover)
+    for _ in range(30):
+        c, A, b = random_lp(rng, rng.integers(2, 8), rng.integers(2, 8), negative_b=True)
+        maximize = bool(rng.integers(2))
+        result = solver.solve(c, A, b, maximize)
+        status, z = highs(c, A, b, maximize)
+        assert result.status == status
+        if status == "optimal":
+            assert result.z == pytest.approx(z, abs=1e-5)
+            if crossover:
+                assert result.state is not None
+
+
+def test_sparse_input():
+    A = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]])
+    result = InteriorPointSolver().solve([3, 5], CSRMatrix.from_dense(A), [4, 12, 18])
+    assert result.z == pytest.approx(36.0, abs=1e-6)
+
+
+@pytest.mark.parametrize("bad", [np.nan, np.inf])
+def test_non_finite_input_is_an_error(bad):
+    # Regression: the regularization loop never ended on a NaN matrix
+    result = InteriorPointSolver().solve([1, 1], [[1, bad]], [1])
+    assert result.status == "error"
+
+
+def test_regularization_is_bounded():
+    A = np.eye(2)
+    with pytest.raises(np.linalg.LinAlgError):
+        interior_point._NormalEquations(A, np.array([1.0, -1e9, 0.0, 0.0]))
+
+
+def test_regularization_without_scipy(monkeypatch):
+    monkeypatch.setattr(interior_point, "_scipy_loaded", True)
+    monkeypatch.setattr(interior_point, "_cho_factor", None)
+    monkeypatch.setattr(interior_point, "_cho_solve", None)
+    assert InteriorPointSolver().solve([1, 1], [[1, np.nan]], [1]).status == "error"
+    assert InteriorPointSolver().solve([3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18]).z == pytest.approx(36.0)
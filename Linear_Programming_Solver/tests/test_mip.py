@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from mip import BranchAndBound
+from simplex import SimplexSolver
+
+
+@pytest.fixture
+def highs_mip():
+    linprog = pytest.importorskip("scipy.optimize").linprog
+
+    def solve(c, A, b, integer, maximize=True):
+        integrality = np.zeros(len(c))
+        integrality[integer] = 1
+        result = linprog(-np.asarray(c) if maximize else c, A_ub=A, b_ub=b, integrality=integrality,
+                         method="highs")
+        if result.status != 0:
+            return None
+        return -result.fun if maximize else result.fun
+
+    return solve
+
+
+@pytest.mark.parametrize("node_selection", ["best_bound", "depth_first"])
+def test_random_mips_match_reference(highs_mip, rng, node_selection):
+    for _ in range(25):
+        m, n = rng.integers(2, 5), rng.integers(2, 6)
+        A = rng.uniform(0.0, 5.0, (m, n))
+        b = rng.uniform(5.0, 20.0, m)
+        c = rng.uniform(0.5, 5.0, n)
+        integer = np.flatnonzero(rng.random(n) < 0.7)
+        result = BranchAndBound(node_selection=node_selection).solve(c, A, b, integer)
+        z = highs_mip(c, A, b, integer)
+        assert result.status == "optimal"
+        assert result.z == pytest.approx(z, abs=1e-6)
+        np.testing.assert_allclose(result.x[integer], np.round(result.x[integer]))
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_knapsack(workers):
+    result = BranchAndBound(workers=workers).solve([10, 13, 7], [[4, 6, 3]], [10], [0, 1, 2], bounds=[(0, 1)] * 3)
+    assert result.z == pytest.approx(23.0)
+    np.testing.assert_allclose(result.x, [1, 1, 0])
+
+
+def test_infeasible_and_unknown_selection():
+    assert BranchAndBound().solve([1.0], [[2.0], [-2.0]], [1.0, -0.5], [0]).status == "infeasible"
+    with pytest.raises(ValueError):
+        BranchAndBound(node_selection="random")
+
+
+def test_presolve_solver(highs_mip):
+    solver = SimplexSolver(presolve=True)
+    result = BranchAndBound(solver=solver).solve([1, 1], [[1, 2], [3, 1]], [4, 6], integer=[0, 1])
+    assert result.status == "optimal"
+    assert result.z == pytest.approx(highs_mip([1, 1], [[1, 2], [3, 1]], [4, 6], [0, 1]))
+    assert solver.presolve  # the caller's solver is left alone
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from modeling import Model
+from sparse import CSRMatrix
+
+
+def _transport(rng, integer=False):
+    plants, markets = 3, 4
+    supply = rng.uniform(20.0, 40.0, plants)
+    demand = rng.uniform(5.0, 15.0, markets)
+    cost = rng.uniform(1.0, 9.0, (plants, markets))
+    model = Model("transport")
+    x = model.add_variables("x", (plants, markets), upper=12.0, integer=integer)
+    model.add_constraints("supply", x.sum(axis=1) <= supply)
+    model.add_constraints("demand", x.sum(axis=0) >= demand)
+    model.add_constraints("mix", CSRMatrix.from_dense(np.array([[1.0, -1.0, 0.0]])) @ x[:, 0] == 0.0)
+    model.set_objective((cost * x).sum() + 5.0)
+    return model, x, (supply, demand, cost)
+
+
+def _reference(data, integer=False):
+    # The same model written out by hand for HiGHS
+    linprog = pytest.importorskip("scipy.optimize").linprog
+    supply, demand, cost = data
+    plants, markets = cost.shape
+    A_ub = np.vstack([np.kron(np.eye(plants), np.ones(markets)), -np.kron(np.ones(plants), np.eye(markets))])
+    b_ub = np.concatenate([supply, -demand])
+    A_eq = np.zeros((1, plants * markets))
+    A_eq[0, 0], A_eq[0, markets] = 1.0, -1.0
+    result = linprog(cost.ravel(), A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=[0.0], bounds=(0, 12.0),
+                     integrality=np.ones(plants * markets) if integer else None, method="highs")
+    assert result.status == 0
+    return result.fun + 5.0
+
+
+def test_expressions_match_dense_algebra(rng):
+    model = Model()
+    x = model.add_variables("x", (2, 3))
+    y = model.add_variables("y", 3)
+    M = rng.standard_normal((4, 3))
+    value = rng.uniform(0.0, 1.0, model.n)
+    X, Y = value[:6].reshape(2, 3), value[6:]
+    np.testing.assert_allclose((2 * x - 1).value(value), 2 * X - 1)
+    np.testing.assert_allclose(x.sum(axis=0).value(value), X.sum(axis=0))
+    np.testing.assert_allclose((x[1] + y / 2).value(value), X[1] + Y / 2)
+    np.testing.assert_allclose((M @ y).value(value), M @ Y)
+    np.testing.assert_allclose(y.dot([1.0, 2.0, 3.0]).value(value), Y @ [1.0, 2.0, 3.0])
+    np.testing.assert_allclose((3.0 - x).sum().value(value), (3.0 - X).sum())
+
+
+def test_compile():
+    model = Model("small")
+    x = model.add_variables("x", 2, upper=[4.0, np.inf])
+    model.add_constraints("cap", x[0] + 2 * x[1] <= 8.0)
+    model.set_objective(x.sum(), maximize=True)
+    lp = model.compile()
+    np.testing.assert_array_equal(lp.A.toarray(), [[1.0, 2.0]])
+    assert list(lp.col_names) == ["x[0]", "x[1]"] and list(lp.row_names) == ["cap"]
+    np.testing.assert_array_equal(lp.upper, [4.0, np.inf])
+    result = model.solve()
+    assert result.z == pytest.approx(6.0)
+    np.testing.assert_allclose(model.values(result.x)["x"], [4.0, 2.0])
+
+
+def test_transport_against_highs(rng):
+    model, x, data = _transport(rng)
+    result = model.solve()
+    assert result.status == "optimal"
+    assert result.z == pytest.approx(_reference(data), abs=1e-7)
+    flows = model.values(result.x)["x"]
+    assert np.all(flows <= 12.0 + 1e-9)
+    assert flows[0, 0] == pytest.approx(flows[1, 0])
+
+
+def test_integer_transport_against_highs(rng):
+    model, x, data = _transport(rng, integer=True)
+    result = model.solve()
+    assert result.status == "optimal"
+    assert result.z == pytest.approx(_reference(data, integer=True), abs=1e-7)
+    flows = model.values(result.x)["x"]
+    np.testing.assert_allclose(flows, np.round(flows), atol=1e-7)
+
+
+@pytest.mark.parametrize("engine", ["revised", "interior"])
+def test_bounds_without_solver_support(rng, highs, engine):
+    # Neither engine takes variable bounds, so solve() folds them into rows
+    from interior_point import InteriorPointSolver
+    from revised import RevisedSimplexSolver
+
+    A = rng.uniform(0.5, 2.0, (3, 5))
+    b = rng.uniform(20.0, 30.0, 3)
+    c = rng.uniform(1.0, 5.0, 5) + [6.0, 0.0, 6.0, 6.0, 0.0]  # the capped columns sit at their bounds
+    lower, upper = np.full(5, 0.5), np.array([4.0, np.inf, 3.0, 6.0, np.inf])
+    model = Model("production")
+    x = model.add_variables("x", 5, lower=lower, upper=upper)
+    model.add_constraints("capacity", A @ x <= b)
+    model.set_objective(x.dot(c), maximize=True)
+    solver = RevisedSimplexSolver() if engine == "revised" else InteriorPointSolver()
+    result = model.solve(solver)
+    assert result.status == "optimal"
+    status, z = highs(c, A, b, True, list(zip(lower, upper)))
+    assert status == "optimal"
+    assert result.z == pytest.approx(z, abs=1e-6)
+    values = model.values(result.x)["x"]
+    assert np.all(values >= lower - 1e-6) and np.all(values <= upper + 1e-6)
+    np.testing.assert_allclose(values[[0, 2, 3]], upper[[0, 2, 3]], atol=1e-6)
+
+
+def test_model_errors():
+    model = Model()
+    x = model.add_variables("x", 2)
+    with pytest.raises(ValueError):
+        model.add_variables("x", 3)
+    with pytest.raises(ValueError):
+        model.add_variables("y", 2, lower=1.0, upper=0.0)
+    with pytest.raises(ValueError):
+        model.add_constraints("bad", x.sum())
+    with pytest.raises(ValueError):
+        model.set_objective(x)
+    other = Model()
+    other.add_variables("z", 5)
+    with pytest.raises(ValueError):
+        model.add_constraints("foreign", other.variables["z"].sum() <= 1.0)
+    model.add_variables("n", 1, integer=True)
+    with pytest.raises(ValueError):
+        from revised import RevisedSimplexSolver
+        model.solve(RevisedSimplexSolver())
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+import parallel
+from parallel import ParallelSolver, SharedArrays, attach
+from simplex import SimplexSolver
+from sparse import CSRMatrix
+
+
+def _assert_same(batch, serial):
+    np.testing.assert_array_equal(batch.status, serial.status)
+    optimal = serial.status == 0
+    np.testing.assert_allclose(batch.z[optimal], serial.z[optimal], atol=1e-9)
+    np.testing.assert_allclose(batch.x[optimal], serial.x[optimal], atol=1e-9)
+
+
+@pytest.fixture
+def scenarios(rng, random_lp):
+    c, A, b = random_lp(rng, 6, 8)
+    A[A < 0.5] = 0.0
+    c_batch = c + 0.5 * rng.standard_normal((30, 8))
+    b_batch = b * rng.uniform(0.2, 1.5, (30, 6))
+    b_batch[7] = -1.0  # infeasible scenario
+    return c_batch, A, b_batch
+
+
+def test_shared_arrays_attach(rng):
+    values = rng.standard_normal((3, 4))
+    with SharedArrays(values=values, counts=np.arange(5)) as shared:
+        views, blocks = attach(shared.spec)
+        np.testing.assert_array_equal(views["values"], values)
+        np.testing.assert_array_equal(views["counts"], np.arange(5))
+        shared.arrays["values"][0, 0] = 42.0  # same memory, no copy
+        assert views["values"][0, 0] == 42.0
+        views.clear()
+        for block in blocks:
+            block.close()
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+def test_parallel_matches_serial(scenarios, sparse):
+    c_batch, A, b_batch = scenarios
+    serial = SimplexSolver().solve_batch(c_batch, A, b_batch)
+    with ParallelSolver(workers=2, chunk_size=4) as solver:
+        batch = solver.solve_batch(c_batch, CSRMatrix.from_dense(A) if sparse else A, b_batch)
+    _assert_same(batch, serial)
+    assert batch.status_names()[7] == "infeasible"
+    assert 7 in batch.messages
+
+
+def test_new_sparse_problem_on_the_same_pool(scenarios):
+    # Workers keep the dense copy of a shared CSR matrix between chunks;
+    # a second problem must not reuse the first one's
+    c_batch, A, b_batch = scenarios
+    with ParallelSolver(workers=2, chunk_size=5) as solver:
+        for scale in (1.0, 2.0):
+            batch = solver.solve_batch(c_batch, CSRMatrix.from_dense(scale * A), b_batch)
+            _assert_same(batch, SimplexSolver().solve_batch(c_batch, scale * A, b_batch))
+
+
+def test_worker_matrix_follows_the_spec(rng):
+    A = rng.uniform(0.0, 1.0, (3, 4))
+    try:
+        for scale in (1.0, 3.0):
+            csr = CSRMatrix.from_dense(scale * A)
+            with SharedArrays(A_data=csr.data, A_indices=csr.indices, A_indptr=csr.indptr,
+                              A_shape=np.array(csr.shape, dtype=np.int64)) as shared:
+                views = parallel._views(shared.spec)
+                dense = parallel._shared_matrix(views)
+                assert parallel._shared_matrix(views) is dense  # expanded once per problem
+                np.testing.assert_allclose(dense, scale * A)
+                parallel._views({})  # release the blocks before they are unlinked
+    finally:
+        parallel._attached = (None, {}, [])
+        parallel._dense = None
+
+
+def test_shape_errors_fall_back_to_serial():
+    with ParallelSolver(workers=2) as solver:
+        batch = solver.solve_batch(np.ones((2, 2)), np.ones((1, 3)), np.ones((2, 1)))
+    assert set(batch.status_names()) == {"error"}
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from presolve import presolve
+from simplex import SimplexSolver
+
+
+def _presolve_friendly(rng, random_lp):
+    # Random LP plus the structures presolve removes: an empty row, a
+    # singleton row, a duplicated row and a fixed column
+    c, A, b = random_lp(rng, rng.integers(3, 7), rng.integers(3, 7), negative_b=True)
+    m, n = A.shape
+    A = np.vstack([A, np.zeros(n), np.eye(n)[rng.integers(n)] * 2.0, 3.0 * A[0]])
+    b = np.concatenate([b, [1.0, 4.0, 3.0 * b[0]]])
+    A[:, rng.integers(n)] *= rng.random() < 0.5
+    return c, A, b
+
+
+@pytest.mark.parametrize("method", ["primal", "dual"])
+def test_presolved_solves_match_reference(highs, rng, random_lp, method):
+    solver = SimplexSolver(presolve=True, method=method)
+    for trial in range(40):
+        c, A, b = _presolve_friendly(rng, random_lp)
+        bounds = None
+        if trial % 2:
+            bounds = [(float(rng.uniform(0, 0.5)), float(rng.uniform(1, 3)) if rng.random() < 0.7 else None)
+                      for _ in range(A.shape[1])]
+        maximize = bool(rng.integers(2))
+        result = solver.solve(c, A, b, maximize, bounds=bounds)
+        status, z = highs(c, A, b, maximize, bounds)
+        if status == "optimal":
+            assert result.status == "optimal"
+            assert result.z == pytest.approx(z, abs=1e-6)
+            assert np.all(A @ result.x <= b + 1e-6)
+        else:
+            assert result.status in ("infeasible", "unbounded")
+        assert result.state is None
+        if result.presolve is not None:
+            assert result.presolve.rows_after <= result.presolve.rows_before
+
+
+@pytest.mark.parametrize("method", ["primal", "dual"])
+def test_presolve_removes_every_row(method):
+    # Regression: the single row is a bound, so the dual phase gets no rows
+    solver = SimplexSolver(presolve=True, method=method)
+    assert solver.solve([1, 2], [[1, 0]], [3]).status == "unbounded"
+    result = solver.solve([1, 2], [[1, 0], [0, 1]], [3, 4])
+    assert result.status == "optimal"
+    np.testing.assert_allclose(result.x, [3.0, 4.0])
+    assert result.state is None
+
+
+def test_standalone_presolve():
+    c, A, b = [1.0, 1.0, 1.0], [[1.0, 1.0, 0.0], [2.0, 2.0, 0.0], [0.0, 0.0, 0.0]], [4.0, 8.0, 1.0]
+    reduced = presolve(c, A, b, upper=[np.inf, np.inf, 2.0])
+    assert reduced.status == "reduced"
+    assert reduced.stats.rows_after < reduced.stats.rows_before
+    x = reduced.postsolve(SimplexSolver().solve(reduced.c, reduced.A, reduced.b, bounds=[
+        (0.0, u) for u in reduced.upper]).x)
+    assert x[2] == pytest.approx(2.0)
+    assert x[0] + x[1] == pytest.approx(4.0)
+
+
+def test_presolve_detects_infeasibility():
+    assert presolve([1.0], [[0.0], [1.0]], [-1.0, 2.0]).status == "infeasible"
@@ -0,0 +1,30 @@
+import pytest
+
+from pricing import PRICING_RULES, PricingRule, make_pricing
+from simplex import SimplexSolver
+
+
+@pytest.mark.parametrize("rule", sorted(PRICING_RULES))
+def test_rules_agree_with_reference(highs, rng, random_lp, rule):
+    solver = SimplexSolver(pricing=rule)
+    for _ in range(25):
+        c, A, b = random_lp(rng, rng.integers(3, 9), rng.integers(3, 9))
+        result = solver.solve(c, A, b)
+        status, z = highs(c, A, b)
+        assert result.status == status
+        if status == "optimal":
+            assert result.z == pytest.approx(z, abs=1e-6)
+            assert result.stats.pricing == rule
+
+
+def test_unknown_rule():
+    with pytest.raises(ValueError):
+        make_pricing("fastest")
+
+
+def test_rule_without_choose():
+    class Incomplete(PricingRule):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
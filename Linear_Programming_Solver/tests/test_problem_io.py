@@ -0,0 +1,186 @@
+import gzip
+
+import numpy as np
+import pytest
+
+from problem_io import (LPModel, read_lp, read_mps, read_problem, read_table, write_lp, write_mps, write_problem,
+                        write_table)
+from simplex import SimplexSolver
+from sparse import CSRMatrix
+
+LP_TEXT = r"""\ every feature of the reader
+Maximize
+ profit: 3x + 2.5e+0 y - 1E-1 z \ trailing comment
+   + 4 * w - 2 + 7
+Subject To
+ -x - - y + 3 <= 10
+ 2 <= x + y <= 8
+ lbl: -2 x + 1.5 y =< -1e1
+ x + y + z => 1.5
+ w - z = 0
+Bounds
+ x <= 4
+ -inf <= z <= 1e+2
+ y >= -3
+ w free
+ 5 >= w
+Binaries
+ b1
+Generals
+ w
+End
+"""
+
+
+def _random_model(rng):
+    m, n = rng.integers(1, 8), rng.integers(1, 9)
+    A = rng.normal(size=(m, n)).round(3) * (rng.random((m, n)) < 0.6)
+    row_lower = np.where(rng.random(m) < 0.5, -np.inf, rng.normal(size=m) - 3)
+    row_upper = np.where(rng.random(m) < 0.3, np.inf, rng.normal(size=m) + 3)
+    equal = rng.random(m) < 0.2
+    row_lower[equal] = row_upper[equal] = 1.5
+    row_upper[np.isinf(row_lower) & np.isinf(row_upper)] = 2.0
+    lower = np.where(rng.random(n) < 0.3, -np.inf, np.where(rng.random(n) < 0.5, 0.0, rng.normal(size=n)))
+    upper = np.where(rng.random(n) < 0.5, np.inf, np.where(np.isinf(lower), 5.0, lower + rng.random(n) * 4))
+    return LPModel(rng.normal(size=n).round(2), CSRMatrix.from_dense(A), row_lower, row_upper, lower, upper,
+                   rng.random(n) < 0.3, bool(rng.random() < 0.5), round(float(rng.normal()), 2), "random")
+
+
+def _assert_same(a, b):
+    # MPS ranges are stored as widths, so row bounds may differ in the last bit
+    for name in ("c", "row_lower", "row_upper", "lower", "upper", "integer"):
+        np.testing.assert_allclose(getattr(a, name), getattr(b, name), rtol=1e-15, err_msg=name)
+    np.testing.assert_array_equal(a.A.toarray(), b.A.toarray())
+    assert list(a.row_names) == list(b.row_names) and list(a.col_names) == list(b.col_names)
+    assert (a.maximize, a.objective_offset) == (b.maximize, b.objective_offset)
+
+
+@pytest.mark.parametrize("suffix", [".mps", ".lp", ".mps.gz", ".lp.gz"])
+def test_round_trip(tmp_path, rng, suffix):
+    write, read = (write_lp, read_lp) if ".lp" in suffix else (write_mps, read_mps)
+    for k in range(30):
+        model = _random_model(rng)
+        path = tmp_path / f"m{k}{suffix}"
+        write(model, path)
+        _assert_same(model, read(path))
+        _assert_same(model, read_problem(path))
+
+
+@pytest.mark.parametrize("read, write", [(read_mps, write_mps), (read_lp, write_lp)])
+def test_small_blocks(tmp_path, rng, read, write):
+    model = _random_model(rng)
+    write(model, tmp_path / "m")
+    for block_size in (1, 7, 64):
+        _assert_same(model, read(tmp_path / "m", block_size=block_size))
+
+
+def test_lp_syntax(tmp_path):
+    (tmp_path / "f.lp").write_text(LP_TEXT)
+    model = read_lp(tmp_path / "f.lp")
+    assert model.maximize and model.objective_name == "profit"
+    assert list(model.col_names) == ["x", "y", "z", "w", "b1"]
+    assert list(model.row_names) == ["R1", "R2", "lbl", "R4", "R5"]
+    np.testing.assert_allclose(model.c, [3.0, 2.5, -0.1, 4.0, 0.0])
+    assert model.objective_offset == pytest.approx(5.0)
+    np.testing.assert_allclose(model.A.toarray(), [[-1, 1, 0, 0, 0], [1, 1, 0, 0, 0], [-2, 1.5, 0, 0, 0],
+                                                   [1, 1, 1, 0, 0], [0, 0, -1, 1, 0]])
+    np.testing.assert_allclose(model.row_lower, [-np.inf, 2, -np.inf, 1.5, 0])
+    np.testing.assert_allclose(model.row_upper, [7, 8, -10, np.inf, 0])
+    np.testing.assert_allclose(model.lower, [0, -3, -np.inf, -np.inf, 0])
+    np.testing.assert_allclose(model.upper, [4, np.inf, 100, 5, 1])
+    np.testing.assert_array_equal(model.integer, [False, False, False, True, True])
+
+
+def _fixed_line(*fields):
+    # Fields at the fixed MPS columns 2, 5, 15, 25, 40 and 50
+    line = ""
+    for start, field in zip((1, 4, 14, 24, 39, 49), fields):
+        line = line.ljust(start) + field
+    return line
+
+
+def test_fixed_mps(tmp_path):
+    lines = ["NAME          FIXED", "ROWS", " N  COST", " L  LIM1", " G  LIM2", "COLUMNS",
+             _fixed_line("", "X ONE", "COST", "1.0", "LIM1", "1.0"),
+             _fixed_line("", "X ONE", "LIM2", "1.0"),
+             _fixed_line("", "Y", "COST", "2.0", "LIM1", "1.0"),
+             "RHS", _fixed_line("", "RHS", "LIM1", "4.0", "LIM2", "1.0"),
+             "BOUNDS", _fixed_line("UP", "BND", "Y", "3.0"), "ENDATA"]
+    (tmp_path / "f.mps").write_text("\n".join(lines) + "\n")
+    model = read_mps(tmp_path / "f.mps", fixed=True)
+    assert model.name == "FIXED" and list(model.col_names) == ["X ONE", "Y"]
+    np.testing.assert_allclose(model.A.toarray(), [[1, 1], [1, 0]])
+    np.testing.assert_allclose(model.row_lower, [-np.inf, 1])
+    np.testing.assert_allclose(model.upper, [np.inf, 3])
+
+
+def test_standard_form_matches_reference(tmp_path, rng):
+    linprog = pytest.importorskip("scipy.optimize").linprog
+    for k in range(20):
+        model = _random_model(rng)
+        model.integer[:] = False
+        form = model.to_standard()
+        result = SimplexSolver().solve(form.c, form.A.toarray(), form.b, form.maximize, bounds=form.bounds)
+        A = model.A.toarray()
+        up, lo = np.isfinite(model.row_upper), np.isfinite(model.row_lower)
+        ref = linprog(-model.c if model.maximize else model.c, A_ub=np.vstack([A[up], -A[lo]]),
+                      b_ub=np.concatenate([model.row_upper[up], -model.row_lower[lo]]),
+                      bounds=list(zip(model.lower, model.upper)), method="highs")
+        if ref.status != 0:
+            assert result.status != "optimal"
+            continue
+        assert result.status == "optimal"
+        z = (-ref.fun if model.maximize else ref.fun) + model.objective_offset
+        assert result.z + form.offset == pytest.approx(z, abs=1e-6)
+        assert model.c @ form.recover(result.x) + model.objective_offset == pytest.approx(z, abs=1e-6)
+
+
+def test_read_errors(tmp_path):
+    (tmp_path / "bad.mps").write_text("NAME x\nWHATEVER\nENDATA\n")
+    with pytest.raises(ValueError):
+        read_mps(tmp_path / "bad.mps")
+    (tmp_path / "bad.lp").write_text("Minimize\n x\nSubject To\n x <= y\nEnd\n")
+    with pytest.raises(ValueError):
+        read_lp(tmp_path / "bad.lp")
+    (tmp_path / "open.lp").write_text("Minimize\n x\nSubject To\n x + y\nEnd\n")
+    with pytest.raises(ValueError):
+        read_lp(tmp_path / "open.lp")
+
+
+def test_gzip_lp(tmp_path):
+    with gzip.open(tmp_path / "f.lp.gz", "wt") as f:
+        f.write(LP_TEXT)
+    _assert_same(read_lp(tmp_path / "f.lp.gz"), read_problem(tmp_path / "f.lp.gz"))
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".npy"])
+def test_table_round_trip(tmp_path, rng, suffix):
+    c, A, b = rng.standard_normal(4), rng.standard_normal((3, 4)), rng.uniform(-1.0, 1.0, 3)
+    write_table(tmp_path / f"t{suffix}", c, A, b)
+    for written, read in zip((c, A, b), read_table(tmp_path / f"t{suffix}")):
+        np.testing.assert_array_equal(read, written)  # %.17g keeps CSV values exact
+
+
+def test_csv_table_fields(tmp_path):
+    (tmp_path / "t.csv").write_text("3,5,\n1,,4\n0,2,12\n")
+    c, A, b = read_table(tmp_path / "t.csv")
+    np.testing.assert_array_equal(c, [3, 5])
+    np.testing.assert_array_equal(A, [[1, 0], [0, 2]])
+    np.testing.assert_array_equal(b, [4, 12])
+    for text in ("1,2,3\n", "1,2,0\n1,x,4\n"):
+        (tmp_path / "bad.csv").write_text(text)
+        with pytest.raises(ValueError):
+            read_table(tmp_path / "bad.csv")
+
+
+@pytest.mark.parametrize("suffix", [".mps", ".lp"])
+@pytest.mark.parametrize("maximize", [True, False])
+def test_table_through_model_file(tmp_path, rng, suffix, maximize):
+    # The GUI's export and import of a table as a model file
+    c, A, b = rng.uniform(-2.0, 5.0, 4), rng.uniform(-1.0, 3.0, (3, 4)), rng.uniform(1.0, 10.0, 3)
+    write_problem(LPModel.from_arrays(c, A, b, maximize), tmp_path / f"m{suffix}")
+    form = read_problem(tmp_path / f"m{suffix}").to_standard()
+    assert form.maximize == maximize
+    np.testing.assert_allclose(form.c, c, rtol=1e-15)
+    np.testing.assert_allclose(form.A.toarray(), A, rtol=1e-15)
+    np.testing.assert_allclose(form.b, b, rtol=1e-15)
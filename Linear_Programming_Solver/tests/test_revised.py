@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+import revised
+from revised import RevisedSimplexSolver
+from sparse import CSRMatrix
+
+
+def _check_random(highs, rng, random_lp, to_matrix):
+    solver = RevisedSimplexSolver()
+    for _ in range(30):
+        c, A, b = random_lp(rng, rng.integers(2, 8), rng.integers(2, 8))
+        maximize = bool(rng.integers(2))
+        result = solver.solve(c, to_matrix(A), b, maximize)
+        status, z = highs(c, A, b, maximize)
+        assert result.status == status
+        if status == "optimal":
+            assert result.z == pytest.approx(z, abs=1e-6)
+
+
+@pytest.mark.parametrize("to_matrix", [np.asarray, CSRMatrix.from_dense], ids=["dense", "csr"])
+def test_random_lps_match_reference(highs, rng, random_lp, to_matrix):
+    _check_random(highs, rng, random_lp, to_matrix)
+
+
+def test_numpy_factorization_without_scipy(highs, rng, random_lp, monkeypatch):
+    # The product-form fallback used when scipy is not installed
+    monkeypatch.setattr(revised, "_scipy_loaded", True)
+    for name in ("_lu_factor", "_lu_solve", "_csc_matrix", "_splu"):
+        monkeypatch.setattr(revised, name, None)
+    _check_random(highs, rng, random_lp, CSRMatrix.from_dense)
+
+
+def test_negative_b_is_rejected():
+    result = RevisedSimplexSolver().solve([1, 1], [[1, 1]], [-1])
+    assert result.status == "error"
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from simplex import SimplexSolver
+
+CASES = [
+    (True, None),
+    (False, None),
+    (True, [(0, 2), (0.2, None), (0, 3), (0, None)]),
+]
+
+
+def _problem(rng, random_lp, maximize):
+    c, A, b = random_lp(rng, 5, 4)
+    if not maximize:
+        # Keep the minimization bounded below: positive costs and >= rows
+        c, A, b = np.abs(c) + 0.5, -A, -0.3 * b
+    return c, A, b
+
+
+@pytest.mark.parametrize("maximize, bounds", CASES)
+def test_shadow_prices_and_rhs_ranges(rng, random_lp, highs, maximize, bounds):
+    c, A, b = _problem(rng, random_lp, maximize)
+    result = SimplexSolver().solve(c, A, b, maximize, bounds=bounds)
+    assert result.status == "optimal"
+    report = result.sensitivity
+    for i in range(A.shape[0]):
+        low, high = report.rhs_ranges[i]
+        assert low <= b[i] + 1e-9 <= high + 2e-9
+        # Inside the range the value is linear in b_i with the shadow price as slope
+        for target in (max(low, b[i] - 1.0), min(high, b[i] + 1.0)):
+            shifted = b.copy()
+            shifted[i] = target
+            status, z = highs(c, A, shifted, maximize, bounds)
+            assert status == "optimal"
+            assert z == pytest.approx(result.z + report.shadow_prices[i] * (target - b[i]), abs=1e-6)
+
+
+@pytest.mark.parametrize("maximize, bounds", CASES)
+def test_reduced_costs_and_cost_ranges(rng, random_lp, highs, maximize, bounds):
+    c, A, b = _problem(rng, random_lp, maximize)
+    result = SimplexSolver().solve(c, A, b, maximize, bounds=bounds)
+    report = result.sensitivity
+    basic = report.basis[report.basis < c.shape[0]]
+    assert np.all(report.reduced_costs[basic] == 0.0)
+    for j in range(c.shape[0]):
+        low, high = report.cost_ranges[j]
+        assert low <= c[j] + 1e-9 <= high + 2e-9
+        # Inside the range x stays optimal
+        for target in (max(low, c[j] - 1.0), min(high, c[j] + 1.0)):
+            shifted = c.copy()
+            shifted[j] = target
+            status, z = highs(shifted, A, b, maximize, bounds)
+            assert z == pytest.approx(shifted @ result.x, abs=1e-6)
+
+
+def test_no_report_without_an_optimum():
+    assert SimplexSolver().solve([1, 1], [[1, -1]], [1]).sensitivity is None
+
+
+@pytest.mark.parametrize("maximize, bounds", CASES)
+def test_parametric_rhs(rng, random_lp, highs, maximize, bounds):
+    c, A, b = _problem(rng, random_lp, maximize)
+    solver = SimplexSolver()
+    state = solver.solve(c, A, b, maximize, bounds=bounds).state
+    direction = rng.uniform(-1.0, 1.0, b.shape[0])
+    for t_end in (8.0, -8.0):
+        sweep = solver.parametric_rhs(state, direction, t_end)
+        assert sweep.status in ("optimal", "infeasible")
+        for t in np.linspace(sweep.t[0], sweep.t[-1], 9):
+            status, z = highs(c, A, b + t * direction, maximize, bounds)
+            assert status == "optimal"
+            assert sweep.value(t) == pytest.approx(z, abs=1e-6)
+        if sweep.status == "infeasible":
+            beyond = sweep.t[-1] + 1e-3 * np.sign(t_end)
+            assert highs(c, A, b + beyond * direction, maximize, bounds)[0] == "infeasible"
+
+
+@pytest.mark.parametrize("maximize, bounds", CASES)
+def test_parametric_cost(rng, random_lp, highs, maximize, bounds):
+    c, A, b = _problem(rng, random_lp, maximize)
+    solver = SimplexSolver()
+    state = solver.solve(c, A, b, maximize, bounds=bounds).state
+    sweep = solver.parametric_cost(state, 1, 6.0)
+    assert np.all(np.diff(sweep.t) > 0)
+    for t in np.linspace(0.0, sweep.t[-1], 9):
+        shifted = c.copy()
+        shifted[1] += t
+        status, z = highs(shifted, A, b, maximize, bounds)
+        assert sweep.value(t) == pytest.approx(z, abs=1e-6)
+    assert np.isnan(sweep.value(sweep.t[-1] + 1.0))
+
+
+def test_parametric_errors():
+    solver = SimplexSolver()
+    state = solver.solve([3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18]).state
+    assert solver.parametric_rhs(state, 5, 1.0).status == "error"
+    assert solver.parametric_cost(state, [1.0], 1.0).status == "error"
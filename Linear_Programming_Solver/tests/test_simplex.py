@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from simplex import SimplexSolver
+
+
+def test_textbook_problem():
+    result = SimplexSolver().solve([3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18])
+    assert result.status == "optimal"
+    assert result.z == pytest.approx(36.0)
+    np.testing.assert_allclose(result.x, [2.0, 6.0])
+
+
+def test_unbounded_and_infeasible():
+    assert SimplexSolver().solve([1, 1], [[1, -1]], [1]).status == "unbounded"
+    assert SimplexSolver().solve([1, 1], [[1, 1], [-1, -1]], [1, -2]).status == "infeasible"
+
+
+def test_input_errors():
+    assert SimplexSolver().solve([1, 1], [[1, 1]], [1, 2]).status == "error"
+    assert SimplexSolver().solve([1], [[1, 1]], [1]).status == "error"
+
+
+@pytest.mark.parametrize("maximize", [True, False])
+def test_random_lps_match_reference(highs, rng, random_lp, maximize):
+    solver = SimplexSolver()
+    for _ in range(40):
+        c, A, b = random_lp(rng, rng.integers(2, 7), rng.integers(2, 7), negative_b=True)
+        result = solver.solve(c, A, b, maximize)
+        status, z = highs(c, A, b, maximize)
+        assert result.status == status
+        if status == "optimal":
+            assert result.z == pytest.approx(z, abs=1e-6)
+            assert np.all(A @ result.x <= b + 1e-7) and np.all(result.x >= -1e-9)
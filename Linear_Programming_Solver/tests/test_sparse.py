@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from simplex import SimplexSolver
+from sparse import CSRMatrix
+
+# Beale's example, which cycles under Dantzig's rule without a fallback
+BEALE_C = [0.75, -150.0, 0.02, -6.0]
+BEALE_A = [[0.25, -60.0, -0.04, 9.0], [0.5, -90.0, -0.02, 3.0], [0.0, 0.0, 1.0, 0.0]]
+BEALE_B = [0.0, 0.0, 1.0]
+
+
+def test_csr_roundtrip():
+    A = np.array([[1.0, 0.0, 2.0], [0.0, 0.0, 0.0], [3.0, 4.0, 0.0]])
+    csr = CSRMatrix.from_dense(A)
+    assert csr.nnz == 4
+    np.testing.assert_array_equal(csr.toarray(), A)
+    np.testing.assert_allclose(csr.matvec(np.ones(3)), A @ np.ones(3))
+
+
+@pytest.mark.parametrize("options", [{}, {"method": "dual"}, {"pricing": "devex"}, {"presolve": True},
+                                     {"anti_cycling": "perturb"}])
+def test_sparse_input_matches_dense(highs, rng, random_lp, options):
+    for _ in range(20):
+        c, A, b = random_lp(rng, rng.integers(2, 8), rng.integers(2, 8), negative_b=True)
+        A[rng.random(A.shape) < 0.5] = 0.0
+        result = SimplexSolver(**options).solve(c, CSRMatrix.from_dense(A), b)
+        status, z = highs(c, A, b)
+        assert result.status == status
+        if status == "optimal":
+            assert result.z == pytest.approx(z, abs=1e-6)
+
+
+def test_scipy_sparse_input(highs):
+    sparse = pytest.importorskip("scipy.sparse")
+    A = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]])
+    result = SimplexSolver().solve([3, 5], sparse.csr_matrix(A), [4, 12, 18])
+    assert result.z == pytest.approx(36.0)
+
+
+def test_options_the_revised_engine_lacks_use_the_tableau():
+    A = CSRMatrix.from_dense(np.array([[1.0, 1.0], [-1.0, 0.0]]))
+    plain = SimplexSolver().solve([1, 2], A, [4, 1])
+    assert plain.status == "optimal" and plain.state is None
+    # Negative b (a >= row) needs the two-phase tableau, which keeps a state
+    result = SimplexSolver().solve([1, 2], A, [4, -1])
+    assert result.status == "optimal" and result.state is not None
+    assert result.z == pytest.approx(7.0)
+
+
+@pytest.mark.parametrize("anti_cycling", ["bland", "perturb"])
+def test_sparse_input_does_not_cycle(anti_cycling):
+    result = SimplexSolver(anti_cycling=anti_cycling).solve(BEALE_C, CSRMatrix.from_dense(np.array(BEALE_A)),
+                                                            BEALE_B)
+    assert result.status == "optimal"
+    assert result.z == pytest.approx(0.05)
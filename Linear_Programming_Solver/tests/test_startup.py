@@ -0,0 +1,16 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("scipy", "matplotlib", "tkinter")
+
+
+@pytest.mark.parametrize("module", ["simplex", "cli"])
+def test_import_leaves_heavy_packages_unloaded(module):
+    # A fresh interpreter, since this one may have loaded them for other tests
+    code = f"import sys, {module}; print(' '.join(name for name in {HEAVY!r} if name in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=PACKAGE, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == []
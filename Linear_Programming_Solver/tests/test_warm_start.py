@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from simplex import SimplexSolver
+
+
+@pytest.fixture
+def solved(rng, random_lp):
+    c, A, b = random_lp(rng, 5, 6)
+    solver = SimplexSolver()
+    return solver, c, A, b, solver.solve(c, A, b)
+
+
+def test_resolve_new_rhs_and_cost(solved, rng):
+    solver, c, A, b, result = solved
+    for _ in range(10):
+        new_b = b * rng.uniform(0.5, 1.5, b.shape)
+        new_c = c + rng.standard_normal(c.shape)
+        for warm, cold in ((solver.resolve(result.state, b=new_b), solver.solve(c, A, new_b)),
+                           (solver.resolve(result.state, c=new_c), solver.solve(new_c, A, b))):
+            assert warm.status == cold.status
+            if cold.status == "optimal":
+                assert warm.z == pytest.approx(cold.z, abs=1e-7)
+
+
+def test_structural_changes(solved, rng):
+    solver, c, A, b, result = solved
+    a = rng.uniform(0.0, 1.0, A.shape[1])
+    added = solver.add_constraint(result.state, a, 2.0)
+    assert added.z == pytest.approx(solver.solve(c, np.vstack([A, a]), np.append(b, 2.0)).z, abs=1e-7)
+    removed = solver.remove_constraint(result.state, 0)
+    assert removed.status == solver.solve(c, A[1:], b[1:]).status
+    column = rng.uniform(0.0, 1.0, A.shape[0])
+    grown = solver.add_variable(result.state, column, 1.0)
+    assert grown.z == pytest.approx(solver.solve(np.append(c, 1.0), np.column_stack([A, column]), b).z, abs=1e-7)
+
+
+def test_basis_warm_start(solved):
+    solver, c, A, b, result = solved
+    again = solver.solve(c, A, b, basis=result.state.basis)
+    assert again.z == pytest.approx(result.z)
+    assert again.iterations <= result.iterations
@@ -1,19 +1,219 @@
+import io
+import queue
+import threading
+import time
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from tkinter import *
 import numpy as np
-from PIL import Image, ImageTk   
-from graphical import graphical_solver
-from simplex import SimplexSolver
+
+# The solvers, matplotlib and PIL are imported on first use, so the window
+# comes up with only tkinter and NumPy loaded
+
+TABLE_FILES = (("CSV table", "*.csv"), ("NumPy table", "*.npy"))
+MODEL_FILES = (("MPS model", "*.mps *.mps.gz"), ("LP model", "*.lp *.lp.gz"))
+
+
+class CoefficientGrid(ttk.Frame):
+    """Spreadsheet view of a 2-D NumPy array that only draws the visible cells.
+
+    The array is edited in place. Cells are canvas items recreated for the
+    visible window after every scroll or resize, and one Entry edits the
+    selected cell, so the number of widgets does not depend on the size
+    of the array. Click selects, double-click, Return or typing edits,
+    arrows/Tab move, the wheel and the scrollbars scroll.
+    """
+
+    CELL_WIDTH = 72
+    CELL_HEIGHT = 22
+    HEADER_WIDTH = 80
+
+    def __init__(self, master, values, row_label, col_label, blank=None, on_edit=None, **kwargs):
+        super().__init__(master)
+        self.values = values
+        self.row_label = row_label    # row index -> header text
+        self.col_label = col_label    # column index -> header text
+        self.blank = blank            # (row, col) -> True for cells without a value
+        self.on_edit = on_edit        # called after a cell is changed
+        self.top = self.left = 0      # first visible row and column
+        self.selected = (0, 0)
+        self.editor = None
+
+        self.canvas = tk.Canvas(self, background="white", highlightthickness=1, takefocus=True, **kwargs)
+        self.ybar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+        self.xbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.xview)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.ybar.grid(row=0, column=1, sticky="ns")
+        self.xbar.grid(row=1, column=0, sticky="ew")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<Button-1>", self.on_click)
+        self.canvas.bind("<Double-Button-1>", lambda event: self.start_edit())
+        self.canvas.bind("<Return>", lambda event: self.start_edit())
+        self.canvas.bind("<Key>", self.on_key)
+        self.canvas.bind("<MouseWheel>", lambda event: self.scroll(-event.delta // 120, 0))
+        self.canvas.bind("<Shift-MouseWheel>", lambda event: self.scroll(0, -event.delta // 120))
+        self.canvas.bind("<Button-4>", lambda event: self.scroll(-3, 0))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll(3, 0))
+        for key, move in (("Up", (-1, 0)), ("Down", (1, 0)), ("Left", (0, -1)), ("Right", (0, 1)), ("Tab", (0, 1))):
+            self.canvas.bind(f"<{key}>", lambda event, move=move: self.move(*move) or "break")
+
+    def set_values(self, values):
+        self.cancel_edit()
+        self.values = values
+        self.top = min(self.top, max(values.shape[0] - 1, 0))
+        self.left = min(self.left, max(values.shape[1] - 1, 0))
+        self.selected = (min(self.selected[0], values.shape[0] - 1), min(self.selected[1], values.shape[1] - 1))
+        self.redraw()
+
+    def visible(self):
+        # Rows and columns that fit in the canvas
+        rows = max(1, (self.canvas.winfo_height() - self.CELL_HEIGHT) // self.CELL_HEIGHT)
+        cols = max(1, (self.canvas.winfo_width() - self.HEADER_WIDTH) // self.CELL_WIDTH)
+        return rows, cols
+
+    def cell_box(self, i, j):
+        x = self.HEADER_WIDTH + (j - self.left) * self.CELL_WIDTH
+        y = self.CELL_HEIGHT + (i - self.top) * self.CELL_HEIGHT
+        return x, y, x + self.CELL_WIDTH, y + self.CELL_HEIGHT
+
+    def redraw(self):
+        canvas = self.canvas
+        canvas.delete("cell")
+        m, n = self.values.shape
+        rows, cols = self.visible()
+        bottom, right = min(m, self.top + rows), min(n, self.left + cols)
+        for j in range(self.left, right):
+            x0, _, x1, _ = self.cell_box(0, j)
+            canvas.create_rectangle(x0, 0, x1, self.CELL_HEIGHT, fill="#e8e8e8", outline="#c0c0c0", tags="cell")
+            canvas.create_text((x0 + x1) / 2, self.CELL_HEIGHT / 2, text=self.col_label(j), tags="cell")
+        for i in range(self.top, bottom):
+            _, y0, _, y1 = self.cell_box(i, 0)
+            canvas.create_rectangle(0, y0, self.HEADER_WIDTH, y1, fill="#e8e8e8", outline="#c0c0c0", tags="cell")
+            canvas.create_text(4, (y0 + y1) / 2, text=self.row_label(i), anchor=tk.W, tags="cell")
+            for j in range(self.left, right):
+                x0, y0, x1, y1 = self.cell_box(i, j)
+                blank = self.blank is not None and self.blank(i, j)
+                fill = "#cce0ff" if (i, j) == self.selected else ("#f4f4f4" if blank else "white")
+                canvas.create_rectangle(x0, y0, x1, y1, fill=fill, outline="#d8d8d8", tags="cell")
+                if not blank:
+                    canvas.create_text(x1 - 4, (y0 + y1) / 2, text=f"{self.values[i, j]:.6g}", anchor=tk.E, tags="cell")
+        self.ybar.set(self.top / max(m, 1), bottom / max(m, 1))
+        self.xbar.set(self.left / max(n, 1), right / max(n, 1))
+
+    def scroll(self, rows, cols):
+        self.commit_edit()
+        m, n = self.values.shape
+        visible_rows, visible_cols = self.visible()
+        self.top = int(np.clip(self.top + rows, 0, max(m - visible_rows, 0)))
+        self.left = int(np.clip(self.left + cols, 0, max(n - visible_cols, 0)))
+        self.redraw()
+
+    def _view(self, axis, args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", count, "units" | "pages")
+        size = self.values.shape[axis]
+        page = self.visible()[axis]
+        first = self.top if axis == 0 else self.left
+        if args[0] == "moveto":
+            target = int(round(float(args[1]) * size))
+        else:
+            target = first + int(args[1]) * (page if args[2] == "pages" else 1)
+        delta = target - first
+        self.scroll(delta, 0) if axis == 0 else self.scroll(0, delta)
+
+    def yview(self, *args):
+        self._view(0, args)
+
+    def xview(self, *args):
+        self._view(1, args)
+
+    def select(self, i, j):
+        self.commit_edit()
+        m, n = self.values.shape
+        i, j = int(np.clip(i, 0, m - 1)), int(np.clip(j, 0, n - 1))
+        self.selected = (i, j)
+        # Scroll just enough to show the selection
+        rows, cols = self.visible()
+        self.top = min(max(self.top, i - rows + 1), i)
+        self.left = min(max(self.left, j - cols + 1), j)
+        self.redraw()
+
+    def move(self, di, dj):
+        self.select(self.selected[0] + di, self.selected[1] + dj)
+
+    def on_click(self, event):
+        self.canvas.focus_set()
+        if event.x < self.HEADER_WIDTH or event.y < self.CELL_HEIGHT:
+            return
+        i = self.top + (event.y - self.CELL_HEIGHT) // self.CELL_HEIGHT
+        j = self.left + (event.x - self.HEADER_WIDTH) // self.CELL_WIDTH
+        if i < self.values.shape[0] and j < self.values.shape[1]:
+            self.select(i, j)
+
+    def on_key(self, event):
+        # Typing a number starts editing the selected cell with that character
+        if event.char and event.char in "0123456789-+.eE":
+            self.start_edit(event.char)
+
+    def start_edit(self, text=None):
+        i, j = self.selected
+        if self.editor is not None or (self.blank is not None and self.blank(i, j)):
+            return
+        x0, y0, x1, y1 = self.cell_box(i, j)
+        self.editor = ttk.Entry(self.canvas, justify=tk.RIGHT)
+        self.editor.insert(0, f"{self.values[i, j]:.17g}" if text is None else text)
+        if text is None:
+            self.editor.select_range(0, tk.END)
+        self.canvas.create_window(x0, y0, window=self.editor, anchor=tk.NW, width=x1 - x0, height=y1 - y0,
+                                  tags="editor")
+        self.editor.bind("<Return>", lambda event: self.commit_edit() or self.move(1, 0) or "break")
+        self.editor.bind("<Tab>", lambda event: self.commit_edit() or self.move(0, 1) or "break")
+        self.editor.bind("<Escape>", lambda event: self.cancel_edit() or "break")
+        self.editor.bind("<FocusOut>", lambda event: self.commit_edit())
+        self.editor.focus_set()
+
+    def commit_edit(self):
+        if self.editor is None:
+            return
+        try:
+            value = float(self.editor.get())
+        except ValueError:
+            self.bell()
+            value = None
+        if value is not None and np.isfinite(value):
+            self.values[self.selected] = value
+            if self.on_edit is not None:
+                self.on_edit()
+        self.cancel_edit()
+
+    def cancel_edit(self):
+        if self.editor is not None:
+            editor, self.editor = self.editor, None
+            self.canvas.delete("editor")
+            editor.destroy()
+            self.canvas.focus_set()
+            self.redraw()
+
 
 class LPSolverApp:
+    POLL_MS = 50            # how often the main thread drains the worker queue
+    PROGRESS_EVERY = 0.1    # seconds between progress updates sent by a running solve
+    MAX_SIZE = 5000         # variables or constraints; the dense table then holds at most 200 MB
+
     def __init__(self, root):
         self.root = root
         self.root.title("Linear Programming Solver")
         self.root.geometry("900x900")
-        image=Image.open('loading.jpg')
-        self.icon=ImageTk.PhotoImage(image)
-        self.root.iconphoto(True,self.icon)
+        self.root.after_idle(self.load_icon)  # decoded once the window is up
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Solves run on a worker thread and report back through this queue,
+        # which the main thread polls with root.after
+        self.messages = queue.Queue()
+        self.job = None
+        self.controls = {}
        
         # Create notebook for different solvers
         self.notebook = ttk.Notebook(root)
@@ -26,6 +226,12 @@ class LPSolverApp:
         self.create_simplex_tab()
         
     
+    def load_icon(self):
+        from PIL import Image, ImageTk
+        image=Image.open('loading.jpg')
+        self.icon=ImageTk.PhotoImage(image)
+        self.root.iconphoto(True,self.icon)
+
     def create_graphical_tab(self):
 
         tab = ttk.Frame(self.notebook)
@@ -66,8 +272,8 @@ class LPSolverApp:
         ttk.Button(button_frame, text="Add Constraint", command=lambda: self.add_constraint_row(constraints_frame, len(self.constraint_entries)+1)).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Remove Constraint", command=self.remove_constraint_row).pack(side=tk.LEFT, padx=5)
         
-        # Solve Button
-        ttk.Button(tab, text="Solve Graphically", command=self.solve_graphical).grid(row=3, column=0, columnspan=5, pady=10)
+        # Solve and Cancel Buttons, progress
+        self.create_solve_controls(tab, "graphical", "Solve Graphically", self.solve_graphical).grid(row=3, column=0, columnspan=5, pady=10)
         
         # Results
         self.graphical_results = Text(tab, height=10, width=80)
@@ -132,215 +338,301 @@ class LPSolverApp:
                 c = entry['rhs'].get()
                 sense = entry['sense'].get()
                 constraints.append((a, b, c, sense))
-            
-            # Solve
-            result = graphical_solver(
-                opt_type=self.graphical_opt_type.get(),
-                obj_coeffs=obj_coeffs,
-                constraints=constraints
-            )
-            
-            # Display results
-            self.graphical_results.delete(1.0, tk.END)
-            self.graphical_results.insert(tk.END, "=== LP Solution ===\n")
-            self.graphical_results.insert(tk.END, f"Status: {result['status']}\n")
-            
-            if result['status'] == 'optimal':
-                self.graphical_results.insert(tk.END, f"Optimal Value: {result['opt_value']:.4f}\n")
-                self.graphical_results.insert(tk.END, "Optimal Points:\n")
-                for point in result['opt_points']:
-                    self.graphical_results.insert(tk.END, f"  ({point[0]:.4f}, {point[1]:.4f})\n")
-            
+            opt_type = self.graphical_opt_type.get()
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
+            return
+
+        # Solve and render the plot off the main thread (headless, no plt.show);
+        # Cancel stops it between the solve, the drawing and the encoding
+        def work(cancel, report):
+            report("Solving...")
+            from graphical import graphical_solver
+            return graphical_solver(opt_type=opt_type, obj_coeffs=obj_coeffs, constraints=constraints,
+                                    show=False, image_format="png", cancel=cancel)
+
+        self.start_job("graphical", work)
+
+    def show_graphical_result(self, result):
+        # Display results
+        self.graphical_results.delete(1.0, tk.END)
+        self.graphical_results.insert(tk.END, "=== LP Solution ===\n")
+        self.graphical_results.insert(tk.END, f"Status: {result['status']}\n")
+        
+        if result['status'] == 'optimal':
+            self.graphical_results.insert(tk.END, f"Optimal Value: {result['opt_value']:.4f}\n")
+            self.graphical_results.insert(tk.END, "Optimal Points:\n")
+            for point in result['opt_points']:
+                self.graphical_results.insert(tk.END, f"  ({point[0]:.4f}, {point[1]:.4f})\n")
+
+        # The plot opens in its own window, which does not block the app
+        from PIL import Image, ImageTk
+        window = tk.Toplevel(self.root)
+        window.title(f"LP Graphical Solution - {result['status'].capitalize()}")
+        label = ttk.Label(window)
+        label.image = ImageTk.PhotoImage(Image.open(io.BytesIO(result['image'])))  # keep a reference
+        label.config(image=label.image)
+        label.pack()
     
     def create_simplex_tab(self):
 
         tab = ttk.Frame(self.notebook)
         self.notebook.add(tab, text="Simplex Solver")
+        tab.columnconfigure(0, weight=1)
+        tab.rowconfigure(2, weight=1)
         
         # Problem Type
-        ttk.Label(tab, text="Problem Type:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        type_frame = ttk.Frame(tab)
+        type_frame.grid(row=0, column=0, columnspan=3, sticky=tk.W)
+        ttk.Label(type_frame, text="Problem Type:").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
         self.simplex_opt_type = tk.StringVar(value="max")
-        ttk.Radiobutton(tab, text="Maximize", variable=self.simplex_opt_type, value="max").grid(row=0, column=1,  sticky=tk.W)
-        ttk.Radiobutton(tab, text="Minimize", variable=self.simplex_opt_type, value="min").grid(row=0, column=2, sticky=tk.W)
+        ttk.Radiobutton(type_frame, text="Maximize", variable=self.simplex_opt_type, value="max").grid(row=0, column=1,  sticky=tk.W)
+        ttk.Radiobutton(type_frame, text="Minimize", variable=self.simplex_opt_type, value="min").grid(row=0, column=2, sticky=tk.W)
         
-        # Variables Frame
-        vars_frame = ttk.LabelFrame(tab, text="Variables")
-        vars_frame.grid(row=1, column=0, columnspan=3, padx=10, pady=10, sticky=tk.W+tk.E)
+        # Problem size, import and export
+        size_frame = ttk.LabelFrame(tab, text="Problem")
+        size_frame.grid(row=1, column=0, columnspan=3, padx=10, pady=5, sticky=tk.W+tk.E)
         
-        ttk.Label(vars_frame, text="Number of Variables:").grid(row=0, column=0, padx=5, pady=5)
+        ttk.Label(size_frame, text="Number of Variables:").grid(row=0, column=0, padx=5, pady=5)
         self.num_vars = tk.IntVar(value=2)
-        ttk.Spinbox(vars_frame, from_=1, to=10, textvariable=self.num_vars, width=5, command=self.update_variable_count).grid(row=0, column=1, padx=5, pady=5)
-        
-        # Objective Function
-        self.objective_entries = []
-        self.objective_frame = ttk.LabelFrame(vars_frame, text="Objective Coefficients")
-        self.objective_frame.grid(row=1, column=0, columnspan=2, padx=5, pady=5, sticky=tk.W+tk.E)
-        self.update_objective_entries()
-        
-        # Constraints
-        constraints_frame = ttk.LabelFrame(tab, text="Constraints")
-        constraints_frame.grid(row=2, column=0, columnspan=3, padx=10, pady=10, sticky=tk.W+tk.E)
-        
-        # Constraints header
-        ttk.Label(constraints_frame, text="Coefficients").grid(row=0, column=0, columnspan=10, padx=5, pady=5)
-        
-        # Constraint entries (start with 2 empty constraints)
-        self.simplex_constraint_entries = []
-        for i in range(2):
-            self.add_simplex_constraint_row(constraints_frame, i+1)
-        
-        # Add/Remove constraint buttons
-        button_frame = ttk.Frame(constraints_frame)
-        button_frame.grid(row=10, column=0, columnspan=10, pady=5)
-        ttk.Button(button_frame, text="Add Constraint", command=lambda: self.add_simplex_constraint_row(constraints_frame, len(self.simplex_constraint_entries)+1)).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="Remove Constraint", command=self.remove_simplex_constraint_row).pack(side=tk.LEFT, padx=5)
-        
-        # Solve Button
-        ttk.Button(tab, text="Solve with Simplex", command=self.solve_simplex).grid(row=3, column=0, columnspan=3, pady=10)
+        vars_box = ttk.Spinbox(size_frame, from_=1, to=self.MAX_SIZE, textvariable=self.num_vars, width=7, command=self.resize_problem)
+        vars_box.grid(row=0, column=1, padx=5, pady=5)
+        ttk.Label(size_frame, text="Number of Constraints:").grid(row=0, column=2, padx=5, pady=5)
+        self.num_constraints = tk.IntVar(value=2)
+        cons_box = ttk.Spinbox(size_frame, from_=1, to=self.MAX_SIZE, textvariable=self.num_constraints, width=7, command=self.resize_problem)
+        cons_box.grid(row=0, column=3, padx=5, pady=5)
+        for box in (vars_box, cons_box):
+            box.bind("<Return>", lambda event: self.resize_problem())
+            box.bind("<FocusOut>", lambda event: self.resize_problem())
+        ttk.Button(size_frame, text="Add Constraint", command=lambda: self.resize_problem(rows=self.table.shape[0])).grid(row=0, column=4, padx=5)
+        ttk.Button(size_frame, text="Remove Constraint", command=lambda: self.resize_problem(rows=self.table.shape[0] - 2)).grid(row=0, column=5, padx=5)
+        ttk.Button(size_frame, text="Import...", command=self.import_problem).grid(row=0, column=6, padx=5)
+        ttk.Button(size_frame, text="Export...", command=self.export_problem).grid(row=0, column=7, padx=5)
+        
+        # Coefficients: row 0 is the objective, the others [A | b] of A x <= b.
+        # They live in self.table; the grid only draws the visible part
+        self.table = np.ones((3, 3))
+        self.simplex_form = None  # StandardForm of an imported model file
+        self.grid_view = CoefficientGrid(
+            tab, self.table,
+            row_label=lambda i: "Objective" if i == 0 else f"R{i}  (<=)",
+            col_label=lambda j: "RHS" if j == self.table.shape[1] - 1 else f"x{j+1}",
+            blank=lambda i, j: i == 0 and j == self.table.shape[1] - 1,
+            height=260)
+        self.grid_view.grid(row=2, column=0, columnspan=3, padx=10, pady=5, sticky="nsew")
+        
+        # Solve and Cancel Buttons, progress
+        self.create_solve_controls(tab, "simplex", "Solve with Simplex", self.solve_simplex).grid(row=3, column=0, columnspan=3, pady=10)
         
         # Results
         self.simplex_results =Text(tab, height=10, width=80)
         self.simplex_results.grid(row=4, column=0, columnspan=3, padx=10, pady=10)
     
-    def update_variable_count(self):
-
-        self.update_objective_entries()
-        self.update_constraints()
-    
-    def update_objective_entries(self):
-
-        # Clear existing entries
-        for widget in self.objective_frame.winfo_children():
-            widget.destroy()
-        
-        self.objective_entries = []
-        num_vars = self.num_vars.get()
-        
-        for i in range(num_vars):
-            ttk.Label(self.objective_frame, text=f"x{i+1}:").grid(row=0, column=i*2, padx=5, pady=5)
-            var = tk.DoubleVar(value=1)
-            ttk.Entry(self.objective_frame, textvariable=var, width=5).grid(row=0, column=i*2+1, padx=5, pady=5)
-            self.objective_entries.append(var)
-    def update_constraints(self):
-
-        # Store current constraints data
-        current_constraints = []
-        for entry in self.simplex_constraint_entries:
-            current_constraints.append({
-                'coeffs': [var.get() for var in entry['coeffs']],
-                'sense': entry['sense'].get(),
-                'rhs': entry['rhs'].get()
-            })
-        
-        # Clear all existing constraint widgets
-        for entry in self.simplex_constraint_entries:
-            for widget in entry['widgets']:
-                widget.destroy()
-        self.simplex_constraint_entries = []
-        
-        # Recreate constraints with new variable count
-        for i, constraint in enumerate(current_constraints):
-            row = i + 1
-            self.add_simplex_constraint_row(self.simplex_constraint_entries[0]['widgets'][0].master, row)
-            
-            # Set values from stored data (truncate or pad as needed)
-            num_vars = self.num_vars.get()
-            for j in range(min(num_vars, len(constraint['coeffs']))):
-                self.simplex_constraint_entries[-1]['coeffs'][j].set(constraint['coeffs'][j])
-            
-            # Set sense and rhs
-            self.simplex_constraint_entries[-1]['sense'].set(constraint['sense'])
-            self.simplex_constraint_entries[-1]['rhs'].set(constraint['rhs'])
+    def resize_problem(self, rows=None, cols=None):
+        # New size from the spinboxes (or the arguments); the coefficients
+        # that still fit are kept, new ones start at 1. Typed-in values are
+        # checked before anything is allocated
+        try:
+            m = self.num_constraints.get() if rows is None else rows
+            n = self.num_vars.get() if cols is None else cols
+        except tk.TclError:
+            m, n = -1, -1  # not a number
+        if m < 0 or n < 0 or max(m, n) > self.MAX_SIZE:
+            self.num_constraints.set(self.table.shape[0] - 1)
+            self.num_vars.set(self.table.shape[1] - 1)
+            messagebox.showerror("Error", f"The size must be a whole number from 1 to {self.MAX_SIZE}.")
+            return
+        m, n = max(1, m), max(1, n)
+        self.num_constraints.set(m)
+        self.num_vars.set(n)
+        old = self.table
+        if old.shape == (m + 1, n + 1):
+            return
+        table = np.ones((m + 1, n + 1))
+        keep_m, keep_n = min(old.shape[0], m + 1), min(old.shape[1] - 1, n)
+        table[:keep_m, :keep_n] = old[:keep_m, :keep_n]
+        table[1:keep_m, -1] = old[1:keep_m, -1]
+        if n + 1 != old.shape[1]:
+            self.simplex_form = None  # the columns no longer match the model
+        self.set_table(table)
 
-    def add_simplex_constraint_row(self, frame, row):
+    def set_table(self, table):
+        self.table = table
+        self.num_constraints.set(table.shape[0] - 1)
+        self.num_vars.set(table.shape[1] - 1)
+        self.grid_view.set_values(table)
 
-        num_vars = self.num_vars.get()
-        coeff_vars = []
-        widgets = [] 
-        sense = tk.StringVar(value="<=")
-        rhs = tk.DoubleVar(value=1)
-        
-        
-        for i in range(num_vars):
-            var = tk.DoubleVar(value=1)
-            entry = ttk.Entry(frame, textvariable=var, width=5)
-            entry.grid(row=row, column=i*2, padx=5, pady=5)
-            coeff_vars.append(var)
-            widgets.append(entry)
-            
-            if i < num_vars - 1:
-                lbl = ttk.Label(frame, text="+")
-                lbl.grid(row=row, column=i*2+1, padx=2)
-                widgets.append(lbl)
-        
-        col = num_vars * 2
-        sense_label = ttk.Label(frame, text="<=", width=3)
-        sense_label.grid(row=row, column=col, padx=5, pady=5)
-        rhs_entry = ttk.Entry(frame, textvariable=rhs, width=5)
-        rhs_entry.grid(row=row, column=col+1, padx=5, pady=5)
+    def import_problem(self):
+        path = filedialog.askopenfilename(title="Import problem", filetypes=TABLE_FILES + MODEL_FILES + (("All files", "*"),))
+        if not path:
+            return
+        try:
+            from problem_io import read_problem, read_table
+            if path.lower().endswith((".csv", ".npy")):
+                c, A, b = read_table(path)
+                form, shape = None, A.shape
+            else:
+                form = read_problem(path).to_standard()
+                shape = form.A.shape
+            # Checked before the model's matrix is expanded into the dense table
+            if max(shape) > self.MAX_SIZE:
+                raise ValueError(f"{shape[0]} x {shape[1]} is larger than the editable {self.MAX_SIZE} x {self.MAX_SIZE}.")
+            if form is not None:
+                c, A, b = form.c, form.A.toarray(), form.b
+                self.simplex_opt_type.set("max" if form.maximize else "min")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not import {path}:\n{str(e)}")
+            return
+        table = np.zeros((A.shape[0] + 1, A.shape[1] + 1))
+        table[0, :-1] = c
+        table[1:, :-1] = A
+        table[1:, -1] = b
+        self.set_table(table)
+        self.simplex_form = form
 
-        widgets.extend([sense_label, rhs_entry])
+    def export_problem(self):
+        path = filedialog.asksaveasfilename(title="Export problem", defaultextension=".csv", filetypes=TABLE_FILES + MODEL_FILES)
+        if not path:
+            return
+        self.grid_view.commit_edit()
+        c, A, b = self.table[0, :-1], self.table[1:, :-1], self.table[1:, -1]
+        try:
+            from problem_io import LPModel, write_problem, write_table
+            if path.lower().endswith((".csv", ".npy")):
+                write_table(path, c, A, b)
+            else:
+                write_problem(LPModel.from_arrays(c, A, b, self.simplex_opt_type.get() == "max"), path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not export {path}:\n{str(e)}")
 
-        self.simplex_constraint_entries.append({
-            'coeffs': coeff_vars,
-            'sense': sense,  
-            'rhs': rhs,
-            'widgets': widgets   # save widgets for removal
-        })
-        
-    def remove_simplex_constraint_row(self):
- 
-        if len(self.simplex_constraint_entries) > 1:  
-            # Get the last constraint entry
-            last_entry = self.simplex_constraint_entries[-1]
-            
-            # Destroy all widgets in the row
-            for widget in last_entry['widgets']:
-                widget.destroy()
-                
-            # Remove from our tracking list
-            self.simplex_constraint_entries.pop()
-    
     def solve_simplex(self):
   
-        try:
-            # Get objective coefficients
-            c = [var.get() for var in self.objective_entries]
-            
-            # Get constraints
-            A = []
-            b = []
-            for entry in self.simplex_constraint_entries:
-                A.append([var.get() for var in entry['coeffs']])
-                b.append(entry['rhs'].get())
-            
-            # Solve
-            solver = SimplexSolver()
-            result = solver.solve(
-                c=c,
-                A=A,
-                b=b,
-                maximize=(self.simplex_opt_type.get() == "max")
-            )
-            
-            # Display results
-            self.simplex_results.delete(1.0, tk.END)
-            self.simplex_results.insert(tk.END, "=== Simplex Solution ===\n")
-            self.simplex_results.insert(tk.END, f"Status: {result.status}\n")
-            
-            if result.status == 'optimal':
-                self.simplex_results.insert(tk.END, f"Optimal Value: {result.z:.4f}\n")
-                self.simplex_results.insert(tk.END, "Solution:\n")
-                for i, val in enumerate(result.x):
-                    self.simplex_results.insert(tk.END, f"  x{i+1} = {val:.4f}\n")
-            
-            if result.message:
-                self.simplex_results.insert(tk.END, f"\nMessage: {result.message}\n")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
+        # Copies, so editing during the solve does not change the problem
+        self.grid_view.commit_edit()
+        c = self.table[0, :-1].copy()
+        A = self.table[1:, :-1].copy()
+        b = self.table[1:, -1].copy()
+        maximize = (self.simplex_opt_type.get() == "max")
+        form = self.simplex_form
+        bounds = None
+        if form is not None and (np.any(form.bounds[:, 0] != 0) or np.any(np.isfinite(form.bounds[:, 1]))):
+            bounds = form.bounds
+
+        # The solver's callback reports progress and stops the solve on Cancel
+        def work(cancel, report):
+            sign = 1.0 if maximize else -1.0
+            start = time.perf_counter()
+            last = [-self.PROGRESS_EVERY]
+
+            def callback(stats, objective):
+                now = time.perf_counter()
+                if now - last[0] >= self.PROGRESS_EVERY:
+                    last[0] = now
+                    report(f"Iteration {stats.iterations}, objective {sign * objective:.6g}, {now - start:.1f} s")
+                return cancel.is_set()
+
+            from simplex import SimplexSolver
+            solver = SimplexSolver(callback=callback)
+            result = solver.solve(c=c, A=A, b=b, maximize=maximize, bounds=bounds)
+            if form is not None and result.x is not None:
+                # Back to the variables of the imported model
+                result.x, result.z = form.recover(result.x), result.z + form.offset
+            return result
+
+        self.start_job("simplex", work)
+
+    def show_simplex_result(self, result):
+        # Display results
+        self.simplex_results.delete(1.0, tk.END)
+        self.simplex_results.insert(tk.END, "=== Simplex Solution ===\n")
+        self.simplex_results.insert(tk.END, f"Status: {result.status}\n")
+        
+        if result.status == 'optimal':
+            self.simplex_results.insert(tk.END, f"Optimal Value: {result.z:.4f}\n")
+            self.simplex_results.insert(tk.END, "Solution:\n")
+            for i, val in enumerate(result.x):
+                self.simplex_results.insert(tk.END, f"  x{i+1} = {val:.4f}\n")
+        
+        if result.message:
+            self.simplex_results.insert(tk.END, f"\nMessage: {result.message}\n")
+
+    def create_solve_controls(self, tab, name, text, command):
+
+        frame = ttk.Frame(tab)
+        solve = ttk.Button(frame, text=text, command=command)
+        solve.pack(side=tk.LEFT, padx=5)
+        cancel = ttk.Button(frame, text="Cancel", command=self.cancel_job, state=tk.DISABLED)
+        cancel.pack(side=tk.LEFT, padx=5)
+        progress = tk.StringVar(value="")
+        ttk.Label(frame, textvariable=progress, width=50).pack(side=tk.LEFT, padx=5)
+        self.controls[name] = {'solve': solve, 'cancel': cancel, 'progress': progress}
+        return frame
+
+    def start_job(self, name, work):
+        """Run work(cancel, report) on a worker thread.
+
+        cancel is a threading.Event set by the Cancel button; report(text)
+        sends a progress line. The result (or the exception) comes back
+        through self.messages and is shown by poll_messages.
+        """
+        if self.job is not None:
+            return
+        cancel = threading.Event()
+
+        def run():
+            try:
+                self.messages.put((name, "done", work(cancel, lambda text: self.messages.put((name, "progress", text)))))
+            except Exception as e:
+                self.messages.put((name, "error", e))
+
+        self.job = {'name': name, 'cancel': cancel, 'start': time.perf_counter()}
+        for control in self.controls.values():
+            control['solve'].config(state=tk.DISABLED)
+        self.controls[name]['cancel'].config(state=tk.NORMAL)
+        self.controls[name]['progress'].set("Starting...")
+        threading.Thread(target=run, daemon=True).start()
+        self.root.after(self.POLL_MS, self.poll_messages)
+
+    def cancel_job(self):
+        if self.job is not None:
+            self.job['cancel'].set()
+            self.controls[self.job['name']]['progress'].set("Cancelling...")
+
+    def poll_messages(self):
+        while True:
+            try:
+                name, kind, payload = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                if not self.job['cancel'].is_set():
+                    self.controls[name]['progress'].set(payload)
+                continue
+            self.finish_job(name, kind, payload)
+            return
+        self.root.after(self.POLL_MS, self.poll_messages)
+
+    def finish_job(self, name, kind, payload):
+        cancelled = self.job['cancel'].is_set()
+        elapsed = time.perf_counter() - self.job['start']
+        self.job = None
+        for control in self.controls.values():
+            control['solve'].config(state=tk.NORMAL)
+        self.controls[name]['cancel'].config(state=tk.DISABLED)
+        self.controls[name]['progress'].set(f"{'Cancelled' if cancelled else 'Finished'} after {elapsed:.1f} s")
+        if kind == "error":
+            messagebox.showerror("Error", f"An error occurred:\n{str(payload)}")
+        elif name == "simplex":
+            # A cancelled simplex solve still returns its last basis (status "stopped")
+            self.show_simplex_result(payload)
+        elif not cancelled:
+            self.show_graphical_result(payload)
+
+    def on_close(self):
+        # A running solve is abandoned; its thread is a daemon
+        if self.job is not None:
+            self.job['cancel'].set()
+        self.root.destroy()
     
 
 if __name__ == "__main__":